@@ -12,35 +12,154 @@ Usage:
     python docx_to_images.py input.docx --width 1920
     python docx_to_images.py input.docx --format jpg
     python docx_to_images.py input.docx --keep-pdf
+    python docx_to_images.py input.docx --workers 8
+    python docx_to_images.py existing.pdf          (stage 2 only, any PDF)
+    python docx_to_images.py input.docx --cache [--diff report_folder]
 
 Output:
-    Creates a folder (default: _temp-docx-to-png/ next to the input file) with:
-        page_01.png, page_02.png, ...
+    Creates a folder (default: _temp-docx-to-png/ next to the input file, or
+    _temp-pdf-to-png/ for a PDF) with:
+        page_01.png, page_02.png, ...   (page_001.png ... for 100+ pages)
+
+Pages are rendered in parallel worker processes (see render_pdf_pages).
+With --cache only pages whose PDF content changed since the previous --cache
+run are re-rendered; --diff also writes heatmaps of the changed pages (see
+page_render_cache.py).
 
 Requirements:
-    - Windows with Microsoft Word installed
+    - Windows with Microsoft Word installed (not needed for PDF input)
     - pip install comtypes PyMuPDF
+    - pip install Pillow numpy (only for --diff)
 """
 
 import argparse
-import comtypes
-import comtypes.client
-import fitz  # PyMuPDF
 import os
 import sys
 import time
 from pathlib import Path
 
+import fitz  # PyMuPDF
+
+from page_render_cache import page_filename, rasterize_pages, render_pdf_cached
+
+
+def _export_pdf_via_word(docx_path: str, pdf_path: str) -> None:
+    """
+    Export a Word document to PDF through Word's COM interface (Windows only).
+
+    comtypes is imported here rather than at module level, so the rest of the
+    module (e.g. render_pdf_pages) works on any platform.
+    """
+    import comtypes
+    import comtypes.client
+
+    comtypes.CoInitialize()
+    word = None
+    doc = None
+
+    try:
+        word = comtypes.client.CreateObject("Word.Application")
+        word.Visible = False
+
+        doc = word.Documents.Open(docx_path, ReadOnly=True)
+
+        # wdExportFormatPDF = 17, wdExportOptimizeForPrint = 0
+        doc.ExportAsFixedFormat(
+            OutputFileName=pdf_path,
+            ExportFormat=17,
+            OptimizeFor=0,
+        )
+
+        page_count = doc.ComputeStatistics(2)  # wdStatisticPages = 2
+        print(f"  Word reports {page_count} page(s)")
+
+    except comtypes.COMError as e:
+        print(f"\nCOM Error: {e}")
+        print("Make sure Microsoft Word is installed.")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\nError during Word export: {e}")
+        sys.exit(1)
+    finally:
+        try:
+            if doc:
+                doc.Close(False)
+        except Exception:
+            pass
+        try:
+            if word:
+                word.Quit()
+        except Exception:
+            pass
+        comtypes.CoUninitialize()
+
+
+def render_pdf_pages(pdf_path: str, output_dir: str = None,
+                     width: int = 1920, img_format: str = "png",
+                     workers: int = None, use_cache: bool = False,
+                     diff_dir: str = None) -> list[str]:
+    """
+    Render every page of a PDF to an image, in parallel.
+
+    Pages are rendered by page_render_cache.rasterize_pages in a process pool
+    (each worker opens its own PyMuPDF document).  Works on any PDF, not only
+    Word exports.
+
+    Args:
+        pdf_path: Path to the PDF file
+        output_dir: Output directory (default: _temp-pdf-to-png/ next to the PDF)
+        width: Width of rendered images in pixels (height auto-calculated)
+        img_format: Image format - 'png' or 'jpg'
+        workers: Worker process count (default: CPU count; 1 renders in-process)
+        use_cache: Re-render only pages that changed since the last cached
+                   render into output_dir (see page_render_cache.render_pdf_cached)
+        diff_dir: With use_cache, write heatmaps of changed pages to this folder
+
+    Returns:
+        List of paths to the rendered image files, in page order
+        (see page_render_cache.page_filename for the naming)
+    """
+    pdf_path = os.path.abspath(pdf_path)
+
+    if not os.path.exists(pdf_path):
+        print(f"Error: File not found: {pdf_path}")
+        sys.exit(1)
+
+    if output_dir is None:
+        output_dir = os.path.join(os.path.dirname(pdf_path), "_temp-pdf-to-png")
+    output_dir = os.path.abspath(output_dir)
+    os.makedirs(output_dir, exist_ok=True)
+
+    if use_cache:
+        exported_files, _ = render_pdf_cached(pdf_path, output_dir, width, img_format,
+                                              workers, diff_dir=diff_dir)
+        return exported_files
+
+    pdf = fitz.open(pdf_path)
+    page_count = len(pdf)
+    pdf.close()
+
+    print(f"  Found {page_count} page(s) in PDF")
+
+    start = time.perf_counter()
+    jobs = [(i, os.path.join(output_dir, page_filename(i, page_count, img_format)))
+            for i in range(1, page_count + 1)]
+    exported_files = rasterize_pages(pdf_path, jobs, width, img_format, workers)
+    print(f"  Rendered {page_count} page(s) in {time.perf_counter() - start:.1f}s")
+    return exported_files
+
 
 def export_pages(docx_path: str, output_dir: str = None,
                  width: int = 1920, img_format: str = "png",
-                 keep_pdf: bool = False) -> list[str]:
+                 keep_pdf: bool = False, workers: int = None,
+                 use_cache: bool = False, diff_dir: str = None) -> list[str]:
     """
     Export all pages from a .docx file to individual images.
 
     The process has two stages:
       1. Word COM exports the document to a temporary PDF (pixel-perfect).
-      2. PyMuPDF renders each PDF page to an image at the requested width.
+      2. render_pdf_pages renders the PDF pages to images at the requested
+         width, in parallel.
 
     Args:
         docx_path: Path to the .docx file
@@ -48,6 +167,9 @@ def export_pages(docx_path: str, output_dir: str = None,
         width: Width of exported images in pixels (height auto-calculated)
         img_format: Image format - 'png' or 'jpg'
         keep_pdf: If True, keep the intermediate PDF file
+        workers: Worker processes for stage 2 (default: CPU count)
+        use_cache: Re-render only pages that changed since the last cached run
+        diff_dir: With use_cache, write heatmaps of changed pages to this folder
 
     Returns:
         List of paths to the exported image files
@@ -83,45 +205,7 @@ def export_pages(docx_path: str, output_dir: str = None,
     # ------------------------------------------------------------------
     print("Stage 1: Exporting to PDF via Microsoft Word ...")
 
-    comtypes.CoInitialize()
-    word = None
-    doc = None
-
-    try:
-        word = comtypes.client.CreateObject("Word.Application")
-        word.Visible = False
-
-        doc = word.Documents.Open(docx_path, ReadOnly=True)
-
-        # wdExportFormatPDF = 17, wdExportOptimizeForPrint = 0
-        doc.ExportAsFixedFormat(
-            OutputFileName=pdf_path,
-            ExportFormat=17,
-            OptimizeFor=0,
-        )
-
-        page_count = doc.ComputeStatistics(2)  # wdStatisticPages = 2
-        print(f"  Word reports {page_count} page(s)")
-
-    except comtypes.COMError as e:
-        print(f"\nCOM Error: {e}")
-        print("Make sure Microsoft Word is installed.")
-        sys.exit(1)
-    except Exception as e:
-        print(f"\nError during Word export: {e}")
-        sys.exit(1)
-    finally:
-        try:
-            if doc:
-                doc.Close(False)
-        except Exception:
-            pass
-        try:
-            if word:
-                word.Quit()
-        except Exception:
-            pass
-        comtypes.CoUninitialize()
+    _export_pdf_via_word(docx_path, pdf_path)
 
     if not os.path.exists(pdf_path):
         print("Error: PDF was not created. Word export may have failed.")
@@ -135,34 +219,9 @@ def export_pages(docx_path: str, output_dir: str = None,
     # ------------------------------------------------------------------
     print("Stage 2: Rendering pages to images ...")
 
-    exported_files = []
-
     try:
-        pdf = fitz.open(pdf_path)
-        page_count = len(pdf)
-
-        print(f"  Found {page_count} page(s) in PDF")
-        print()
-
-        for i, page in enumerate(pdf, start=1):
-            # Calculate zoom factor to reach the target width
-            zoom = width / page.rect.width
-            mat = fitz.Matrix(zoom, zoom)
-            pix = page.get_pixmap(matrix=mat)
-
-            filename = f"page_{i:02d}.{img_format}"
-            filepath = os.path.join(output_dir, filename)
-
-            if img_format == "jpg":
-                pix.save(filepath, jpg_quality=95)
-            else:
-                pix.save(filepath)
-
-            exported_files.append(filepath)
-            print(f"  Exported page {i}/{page_count}: {filename}")
-
-        pdf.close()
-
+        exported_files = render_pdf_pages(pdf_path, output_dir, width, img_format, workers,
+                                          use_cache, diff_dir)
     except Exception as e:
         print(f"\nError during PDF rendering: {e}")
         sys.exit(1)
@@ -195,10 +254,12 @@ Examples:
     python docx_to_images.py report.docx --width 2560
     python docx_to_images.py report.docx --format jpg
     python docx_to_images.py report.docx --keep-pdf
+    python docx_to_images.py existing.pdf --workers 8
+    python docx_to_images.py report.docx --cache --diff _diff
         """
     )
 
-    parser.add_argument("input", help="Path to .docx file")
+    parser.add_argument("input", help="Path to .docx file (or a .pdf to render directly)")
     parser.add_argument("-o", "--output", default=None,
                         help="Output directory (default: _temp-docx-to-png/)")
     parser.add_argument("--width", type=int, default=1920,
@@ -207,10 +268,24 @@ Examples:
                         help="Image format (default: png)")
     parser.add_argument("--keep-pdf", action="store_true", default=False,
                         help="Keep the intermediate PDF file")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Processes for page rendering (default: CPU count)")
+    parser.add_argument("--cache", action="store_true", default=False,
+                        help="Re-render only pages that changed since the last --cache run")
+    parser.add_argument("--diff", metavar="REPORT_DIR", default=None,
+                        help="Write heatmaps of pages changed since the last run (implies --cache)")
 
     args = parser.parse_args()
+    use_cache = args.cache or args.diff is not None
 
-    export_pages(args.input, args.output, args.width, args.format, args.keep_pdf)
+    if args.input.lower().endswith(".pdf"):
+        exported_files = render_pdf_pages(args.input, args.output, args.width,
+                                          args.format, args.workers,
+                                          use_cache, args.diff)
+        print(f"\nDone! {len(exported_files)} pages rendered.")
+    else:
+        export_pages(args.input, args.output, args.width, args.format,
+                     args.keep_pdf, args.workers, use_cache, args.diff)
 
 
 if __name__ == "__main__":
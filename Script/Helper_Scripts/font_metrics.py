@@ -0,0 +1,190 @@
+"""
+Font Metrics
+
+Measures text width from TrueType advance widths, for the table layout code in
+md_to_docx.py and md_to_pptx_converter.py (via table_metrics.TableMetrics).
+
+Font files are looked up in the usual system font folders plus the folder named
+by the FONT_METRICS_DIR environment variable.  Calibri is used when installed;
+otherwise the metric-compatible Carlito is used.  Widths are the sum of glyph
+advance widths, and results are kept in LRU caches keyed by (font, size, bold,
+text), so re-measuring the same cell text at another size or in another table is
+a dictionary lookup.
+
+Without fontTools (pip install fonttools) or a matching font file, the measure
+functions return None and the converters fall back to their average
+character-width estimates.
+
+Usage:
+    python font_metrics.py "Text to measure" [--size 11] [--bold] [--font Calibri]
+"""
+
+import argparse
+import os
+import sys
+from functools import lru_cache
+
+try:
+    from fontTools.ttLib import TTFont
+except ImportError:  # fontTools is optional; measurement is then unavailable
+    TTFont = None
+
+# Font family -> {bold: candidate file names in preference order}.  Carlito and
+# Caladea are metric-compatible with Calibri and Cambria.
+FONT_FILES = {
+    'Calibri': {
+        False: ('calibri.ttf', 'Carlito-Regular.ttf'),
+        True: ('calibrib.ttf', 'Carlito-Bold.ttf'),
+    },
+    'Cambria': {
+        False: ('cambria.ttc', 'cambria.ttf', 'Caladea-Regular.ttf'),
+        True: ('cambriab.ttf', 'Caladea-Bold.ttf'),
+    },
+    'Consolas': {
+        False: ('consola.ttf',),
+        True: ('consolab.ttf',),
+    },
+}
+
+# Folders searched (recursively) for font files
+FONT_DIRS = [
+    os.environ.get('FONT_METRICS_DIR', ''),
+    os.path.join(os.environ.get('WINDIR', r'C:\Windows'), 'Fonts'),
+    os.path.join(os.environ.get('LOCALAPPDATA', ''), 'Microsoft', 'Windows', 'Fonts'),
+    '/Library/Fonts',
+    os.path.expanduser('~/Library/Fonts'),
+    '/usr/share/fonts',
+    '/usr/local/share/fonts',
+    os.path.expanduser('~/.local/share/fonts'),
+    os.path.expanduser('~/.fonts'),
+]
+
+_FONT_EXTENSIONS = ('.ttf', '.ttc', '.otf')
+
+
+@lru_cache(maxsize=None)
+def _font_index():
+    """Map lower-case font file name -> path for every font file in FONT_DIRS."""
+    index = {}
+    for font_dir in FONT_DIRS:
+        if not font_dir or not os.path.isdir(font_dir):
+            continue
+        for dirpath, _, filenames in os.walk(font_dir):
+            for name in filenames:
+                if name.lower().endswith(_FONT_EXTENSIONS):
+                    index.setdefault(name.lower(), os.path.join(dirpath, name))
+    return index
+
+
+def find_font_file(font='Calibri', bold=False):
+    """Return the path of the first installed candidate file for a font, or None."""
+    candidates = FONT_FILES.get(font, {}).get(bold, ())
+    index = _font_index()
+    for name in candidates:
+        if name.lower() in index:
+            return index[name.lower()]
+    return None
+
+
+class FontMetrics:
+    """
+    Advance widths of one font face.
+
+    Attributes:
+        path: Font file path
+        units_per_em: Design units per em
+        advances: dict of code point -> advance width in design units
+        default_advance: Advance used for characters the font has no glyph for
+    """
+
+    def __init__(self, path):
+        font = TTFont(path, lazy=True, fontNumber=0)
+        self.path = path
+        self.units_per_em = font['head'].unitsPerEm
+        hmtx = font['hmtx'].metrics
+        self.advances = {code: hmtx[glyph][0] for code, glyph in font.getBestCmap().items()}
+        self.default_advance = hmtx['.notdef'][0] if '.notdef' in hmtx else self.units_per_em // 2
+        font.close()
+
+    def em_width(self, text):
+        """Width of text in em (i.e. in points at a 1 pt font size)."""
+        advances = self.advances
+        default = self.default_advance
+        return sum(advances.get(ord(ch), default) for ch in text) / self.units_per_em
+
+
+@lru_cache(maxsize=None)
+def load_font(font='Calibri', bold=False):
+    """Return FontMetrics for a font face (cached), or None if unavailable."""
+    if TTFont is None:
+        return None
+    path = find_font_file(font, bold)
+    if path is None:
+        return None
+    try:
+        return FontMetrics(path)
+    except Exception:
+        return None
+
+
+def available(font='Calibri'):
+    """True when both faces of font can be measured."""
+    return load_font(font, False) is not None and load_font(font, True) is not None
+
+
+@lru_cache(maxsize=65_536)
+def em_width(text, font='Calibri', bold=False):
+    """
+    Width of a string in em (points per point of font size).
+
+    Returns:
+        float, or None when the font cannot be measured
+    """
+    metrics = load_font(font, bold)
+    if metrics is None:
+        return None
+    return metrics.em_width(text)
+
+
+@lru_cache(maxsize=65_536)
+def text_width(text, size_pt, font='Calibri', bold=False):
+    """
+    Single-line advance width of a string.
+
+    Args:
+        text: Text to measure (rendered text, markdown already stripped)
+        size_pt: Font size in points
+        font: Font family name (see FONT_FILES)
+        bold: Measure the bold face
+
+    Returns:
+        float: Width in points, or None when the font cannot be measured
+    """
+    width = em_width(text, font, bold)
+    return None if width is None else width * size_pt
+
+
+def main():
+    """
+    Main execution function.
+    """
+    parser = argparse.ArgumentParser(description="Measure text with TrueType font metrics")
+    parser.add_argument('text', help="Text to measure")
+    parser.add_argument('--font', default='Calibri', help="Font family (default: Calibri)")
+    parser.add_argument('--size', type=float, default=11, help="Font size in points (default: 11)")
+    parser.add_argument('--bold', action='store_true', help="Measure the bold face")
+    args = parser.parse_args()
+
+    metrics = load_font(args.font, args.bold)
+    if metrics is None:
+        print(f"Error: No font metrics for {args.font}"
+              f"{' Bold' if args.bold else ''} (need fontTools and a font file).")
+        sys.exit(1)
+
+    width = text_width(args.text, args.size, args.font, args.bold)
+    print(f"Font file: {metrics.path}")
+    print(f"Width: {width:.2f} pt ({width / 72:.3f} in) at {args.size:g} pt")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Inline Formatting
+
+Markdown inline lexer shared by md_to_docx.py and md_to_pptx_converter.py, so
+both converters agree on what is bold, italic, code or a link.
+
+Supported syntax (first match wins at each position, in this order):
+    `code`   [text](url)   **bold**   *italic*
+
+Markers do not nest: the text inside a span is taken literally, and an
+unmatched marker (e.g. a lone '*') stays in the text.  Each distinct string is
+lexed once; results are cached in an LRU cache, since table cells and list
+labels repeat heavily across a document.
+
+Usage:
+    from inline_format import lex_inline
+    for run in lex_inline("Use **bold**, `code` and [links](https://example.com)"):
+        print(run.text, run.bold, run.italic, run.code, run.link)
+"""
+
+import re
+from functools import lru_cache
+from typing import NamedTuple, Optional, Tuple
+
+# Inline code, links, bold, italic (in priority order)
+INLINE_RE = re.compile(r'(`([^`]+)`|\[([^\]]+)\]\(([^)]+)\)|\*\*([^*]+)\*\*|\*([^*]+)\*)')
+
+
+class InlineRun(NamedTuple):
+    """One run of text with uniform inline formatting."""
+    text: str
+    bold: bool = False
+    italic: bool = False
+    code: bool = False
+    link: Optional[str] = None
+
+
+@lru_cache(maxsize=16_384)
+def lex_inline(text: str) -> Tuple[InlineRun, ...]:
+    """
+    Split markdown text into formatted runs.
+
+    Args:
+        text: One paragraph, list item or table cell of markdown
+
+    Returns:
+        tuple of InlineRun in reading order (shared through the cache, so
+        it is immutable); empty for empty text
+    """
+    runs = []
+    last_end = 0
+    for match in INLINE_RE.finditer(text):
+        if match.start() > last_end:
+            runs.append(InlineRun(text[last_end:match.start()]))
+
+        if match.group(2) is not None:
+            runs.append(InlineRun(match.group(2), code=True))
+        elif match.group(3) is not None:
+            runs.append(InlineRun(match.group(3), link=match.group(4)))
+        elif match.group(5) is not None:
+            runs.append(InlineRun(match.group(5), bold=True))
+        else:
+            runs.append(InlineRun(match.group(6), italic=True))
+
+        last_end = match.end()
+
+    if last_end < len(text):
+        runs.append(InlineRun(text[last_end:]))
+    return tuple(runs)
+
+
+def visible_text(text: str) -> str:
+    """The text a reader sees once the inline markup is rendered."""
+    return "".join(run.text for run in lex_inline(text))
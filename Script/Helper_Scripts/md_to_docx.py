@@ -6,23 +6,55 @@ Supports: headings, tables, bullet/numbered lists (nested), bold, italic, inline
           links, images, code blocks, blockquotes, horizontal rules.
 
 Usage:
-    python md_to_docx.py input.md [output.docx] [--author "Author Name"]
+    python md_to_docx.py input.md [output.docx] [--author "Author Name"] [--incremental]
+    python md_to_docx.py --batch DIR [--workers N] [--force] [--incremental] [--author "Author Name"]
+    python md_to_docx.py --benchmark
     
 If output is not specified, it will use the same name as input with .docx extension.
 If --author is not specified, the current OS username is used.
+
+--batch converts every .md under DIR (recursively) in a pool of worker
+processes, writing each .docx next to its source.  Files whose .docx is newer
+than the markdown and all of its images are skipped unless --force is given.
+
+--incremental caches each H1/H2 chapter's generated XML (with its images,
+hyperlinks and list numbering) in .md_to_docx_cache/ next to the markdown, and
+splices unchanged chapters back in on the next run instead of regenerating them.
 """
 
 import re
 import sys
 import os
+import io
+import json
+import hashlib
+import contextlib
+import time
 import datetime
 import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from copy import deepcopy
+from dataclasses import dataclass, field
+from typing import List
 from xml.sax.saxutils import escape as xml_escape
 from docx import Document
 from docx.shared import Pt, Inches, RGBColor
 from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.enum.table import WD_ALIGN_VERTICAL
 from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls
+from docx.table import Table
+from docx.text.paragraph import Paragraph as DocxParagraph
+from lxml import etree
+import numpy as np
+
+import font_metrics
+from inline_format import lex_inline
+from table_metrics import table_metrics
+
+try:
+    from PIL import Image as PILImage
+except ImportError:  # Pillow is optional; images are then embedded unchanged
+    PILImage = None
 
 # ---------------------------------------------------------------------------
 # Configuration
@@ -32,6 +64,43 @@ from docx.oxml import parse_xml
 # silently skip them.
 ENABLE_HORIZONTAL_RULES = False
 
+# Block images are embedded at this width, after being resampled once to this
+# print resolution (width in pixels = inches x DPI); see prepare_image.
+IMAGE_WIDTH_INCHES = 5.5
+IMAGE_TARGET_DPI = 220
+
+# Working folder created next to the markdown for prepared images and
+# incremental-rebuild fragments
+CACHE_DIRNAME = '.md_to_docx_cache'
+
+# ---------------------------------------------------------------------------
+# Precompiled block patterns (inline markup is lexed by inline_format)
+# ---------------------------------------------------------------------------
+_CODE_FENCE_RE = re.compile(r'^```(\w*)$')
+_HORIZONTAL_RULE_RE = re.compile(r'^(-{3,}|\*{3,}|_{3,})$')
+_HEADING_RE = re.compile(r'^(#{1,6})\s+(.+)$')
+_HEADING_TRAILING_HASHES_RE = re.compile(r'\s*#+\s*$')
+_IMAGE_RE = re.compile(r'^!\[([^\]]*)\]\(([^)]+)\)$')
+_BULLET_RE = re.compile(r'^(\s*)([-*+])\s+(.+)$')
+_NUMBERED_RE = re.compile(r'^(\s*)(\d+)[.)]\s+(.+)$')
+_TABLE_SEPARATOR_RE = re.compile(r'^[\|\-:\s]+$')
+_BLOCKQUOTE_PREFIX_RE = re.compile(r'^>\s?')
+
+# A paragraph line ends the current paragraph when it starts another block
+_SPECIAL_LINE_RE = re.compile(
+    r'^(?:-{3,}|\*{3,}|_{3,})$'       # Horizontal rule
+    r'|^#{1,6}\s'                      # Heading
+    r'|^[-*+]\s'                       # Bullet list
+    r'|^\d+[.)]\s'                     # Numbered list
+    r'|^```'                           # Code fence
+    r'|^>'                             # Blockquote
+    r'|^!\[[^\]]*\]\([^)]+\)'          # Image
+)
+
+# First characters that can start a non-paragraph block (after stripping);
+# lines starting with anything else skip the block patterns entirely
+_BLOCK_START_CHARS = frozenset('`-*_#!|>+0123456789')
+
 
 def add_hyperlink(paragraph, text, url):
     """Add a clickable hyperlink to a paragraph."""
@@ -50,53 +119,72 @@ def add_hyperlink(paragraph, text, url):
     paragraph._p.append(hyperlink)
 
 
-def parse_inline_formatting(paragraph, text):
-    """
-    Parse inline markdown formatting and add to paragraph.
-    Handles: `code`, **bold**, *italic*, [text](url)
-    """
-    if not text:
-        return
-
-    # Pattern matches (in priority order): inline code, links, bold, italic
-    pattern = r'(`([^`]+)`|\[([^\]]+)\]\(([^)]+)\)|\*\*([^*]+)\*\*|\*([^*]+)\*)'
-
-    last_end = 0
-    for match in re.finditer(pattern, text):
-        # Add any plain text before this match
-        if match.start() > last_end:
-            paragraph.add_run(text[last_end:match.start()])
+# Pre-built w:r templates for each inline style, with and without bold (header
+# cells); rPr children are in schema order.  Cloning a template is much cheaper
+# than building the run through python-docx's run/font API.
+_RUN_PROPERTIES_XML = {
+    ('plain', False): '',
+    ('plain', True): '<w:b/>',
+    ('bold', False): '<w:b/>',
+    ('bold', True): '<w:b/>',
+    ('italic', False): '<w:i/>',
+    ('italic', True): '<w:b/><w:i/>',
+    ('code', False): '<w:rFonts w:ascii="Consolas" w:hAnsi="Consolas"/><w:color w:val="C7254E"/><w:sz w:val="18"/>',
+    ('code', True): '<w:rFonts w:ascii="Consolas" w:hAnsi="Consolas"/><w:b/><w:color w:val="C7254E"/><w:sz w:val="18"/>',
+}
+_RUN_TEMPLATES = {
+    key: parse_xml(
+        f'<w:r {nsdecls("w")}>' + (f'<w:rPr>{rpr}</w:rPr>' if rpr else '') + '<w:t/></w:r>'
+    )
+    for key, rpr in _RUN_PROPERTIES_XML.items()
+}
+_XML_SPACE = '{http://www.w3.org/XML/1998/namespace}space'
 
-        full_match = match.group(0)
 
-        if full_match.startswith('`'):
-            # Inline code: `code`
-            code_text = match.group(2)
-            run = paragraph.add_run(code_text)
+def _append_run(paragraph, text, style, bold=False):
+    """Append a run of the given inline style ('plain', 'bold', 'italic', 'code')."""
+    if '\t' in text or '\n' in text or '\r' in text:
+        # Tabs and breaks need python-docx's w:tab / w:br handling
+        run = paragraph.add_run(text)
+        if style == 'code':
             run.font.name = 'Consolas'
             run.font.size = Pt(9)
             run.font.color.rgb = RGBColor(0xC7, 0x25, 0x4E)
-        elif full_match.startswith('['):
-            # Link: [text](url)
-            link_text = match.group(3)
-            link_url = match.group(4)
-            add_hyperlink(paragraph, link_text, link_url)
-        elif full_match.startswith('**'):
-            # Bold: **text**
-            bold_text = match.group(5)
-            run = paragraph.add_run(bold_text)
-            run.bold = True
-        elif full_match.startswith('*'):
-            # Italic: *text*
-            italic_text = match.group(6)
-            run = paragraph.add_run(italic_text)
+        elif style == 'italic':
             run.italic = True
+        if bold or style == 'bold':
+            run.bold = True
+        return
+
+    run = deepcopy(_RUN_TEMPLATES[(style, bold)])
+    t = run[-1]
+    t.text = text
+    if text != text.strip():
+        t.set(_XML_SPACE, 'preserve')
+    paragraph._p.append(run)
+
+
+def parse_inline_formatting(paragraph, text, bold=False):
+    """
+    Parse inline markdown formatting and add to paragraph.
+    Handles: `code`, **bold**, *italic*, [text](url) (see inline_format)
 
-        last_end = match.end()
+    If bold is True, every run except hyperlinks is bold (table header cells).
+    """
+    if not text:
+        return
 
-    # Add any remaining plain text after the last match
-    if last_end < len(text):
-        paragraph.add_run(text[last_end:])
+    for run in lex_inline(text):
+        if run.link:
+            add_hyperlink(paragraph, run.text, run.link)
+        elif run.code:
+            _append_run(paragraph, run.text, 'code', bold)
+        elif run.bold:
+            _append_run(paragraph, run.text, 'bold', bold)
+        elif run.italic:
+            _append_run(paragraph, run.text, 'italic', bold)
+        else:
+            _append_run(paragraph, run.text, 'plain', bold)
 
 
 def parse_table(lines, start_idx):
@@ -115,7 +203,7 @@ def parse_table(lines, start_idx):
 
         if line.startswith('|') and line.endswith('|'):
             # Check if this is a separator row (contains only |, -, :, spaces)
-            if re.match(r'^[\|\-:\s]+$', line):
+            if _TABLE_SEPARATOR_RE.match(line):
                 # Extract alignment from separator cells
                 sep_cells = [cell.strip() for cell in line.split('|')[1:-1]]
                 for cell in sep_cells:
@@ -138,15 +226,6 @@ def parse_table(lines, start_idx):
     return table_data, alignments, idx
 
 
-def _get_alignment_enum(alignment_str):
-    """Convert alignment string to WD_ALIGN_PARAGRAPH enum."""
-    if alignment_str == 'center':
-        return WD_ALIGN_PARAGRAPH.CENTER
-    elif alignment_str == 'right':
-        return WD_ALIGN_PARAGRAPH.RIGHT
-    return WD_ALIGN_PARAGRAPH.LEFT
-
-
 # ---------------------------------------------------------------------------
 # Table layout helpers
 # ---------------------------------------------------------------------------
@@ -166,31 +245,11 @@ _CELL_MARGIN_TOP_TWIPS = 40      # ~2 pt / 0.028 in
 _CELL_MARGIN_BOTTOM_TWIPS = 40   # ~2 pt / 0.028 in
 
 
-def _set_cell_margins(cell, top=_CELL_MARGIN_TOP_TWIPS,
-                      bottom=_CELL_MARGIN_BOTTOM_TWIPS):
-    """Add top/bottom padding to a DOCX table cell via XML.
-
-    Values are in twips (twentieths of a point).  The defaults give a
-    comfortable ~4 pt cushion above and below the text.
-    """
-    tc = cell._tc
-    tcPr = tc.get_or_add_tcPr()
-    ns = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
-
-    # Remove any existing <w:tcMar> so we don't duplicate
-    for existing in tcPr.findall(f'{{{ns}}}tcMar'):
-        tcPr.remove(existing)
-
-    tcMar = parse_xml(
-        f'<w:tcMar xmlns:w="{ns}">'
-        f'  <w:top w:w="{top}" w:type="dxa"/>'
-        f'  <w:bottom w:w="{bottom}" w:type="dxa"/>'
-        f'</w:tcMar>'
-    )
-    tcPr.append(tcMar)
-
-
-# Constants for column width estimation
+# Constants for column width estimation.  Cell text is measured with the
+# table font's real metrics when available (see font_metrics); otherwise an
+# average character width is used.
+_TABLE_FONT_NAME = 'Calibri'
+_TABLE_FONT_SIZE_PT = 11
 _CHAR_WIDTH_INCHES = 0.08       # Approx. width per char at 11 pt Calibri
 _CELL_HORIZ_PAD_INCHES = 0.25   # Horizontal padding inside a cell
 _BOLD_WIDTH_FACTOR = 1.2        # Bold text is ~20 % wider
@@ -209,21 +268,7 @@ _HEADER_WIDTH_BOOSTS = {
 }
 
 
-def _strip_to_rendered_text(cell_text):
-    """Strip Markdown syntax that is not rendered, keeping all visible chars.
-
-    Unlike the scoring helper (which also strips brackets/parens), this
-    preserves parentheses and brackets that appear literally in the cell
-    because they occupy space in the rendered Word document.
-    """
-    # Remove bold/italic markers and backtick code spans
-    text = re.sub(r'[*`]', '', cell_text)
-    # Convert link syntax to visible text: [text](url) -> text
-    text = re.sub(r'\[([^\]]+)\]\([^)]+\)', r'\\1', text)
-    return text
-
-
-def _min_column_widths_for_words(table_data, num_cols):
+def _min_column_widths_for_words(metrics):
     """Compute minimum column widths (inches) so that the longest word
     in each column can render on a single line without mid-word breaks.
 
@@ -232,76 +277,49 @@ def _min_column_widths_for_words(table_data, num_cols):
     act as break opportunities, but we are conservative).
 
     Returns:
-        List of minimum widths in inches, one per column.
+        Array of minimum widths in inches, one per column.
     """
-    min_widths = []
-    for col_idx in range(num_cols):
-        max_word_width = 0.0
-        for row_idx, row in enumerate(table_data):
-            if col_idx < len(row):
-                raw = row[col_idx]
-                text = _strip_to_rendered_text(raw)
-                # Detect if this cell renders bold (header row or **…**)
-                is_bold = (row_idx == 0) or ('**' in raw)
-                for word in text.split():
-                    w = len(word) * _CHAR_WIDTH_INCHES
-                    if is_bold:
-                        w *= _BOLD_WIDTH_FACTOR
-                    max_word_width = max(max_word_width, w)
-        min_widths.append(max_word_width + _CELL_HORIZ_PAD_INCHES)
-    return min_widths
-
-
-def _natural_column_widths(table_data, num_cols):
+    word_ems = metrics.word_em_widths(_TABLE_FONT_NAME)
+    if word_ems is not None:
+        word_widths = word_ems * (_TABLE_FONT_SIZE_PT / 72)
+    else:
+        word_widths = metrics.longest_word * _CHAR_WIDTH_INCHES
+        word_widths = np.where(metrics.bold, word_widths * _BOLD_WIDTH_FACTOR, word_widths)
+    return metrics.column_max(word_widths) + _CELL_HORIZ_PAD_INCHES
+
+
+def _natural_column_widths(metrics):
     """Compute the natural width (inches) each column needs to display its
     longest cell content on a single line without any wrapping.
 
     This gives the "ideal" width — the column is wide enough that no cell
     text wraps.  The value is used as the upper target when allocating space.
     """
-    natural = []
-    for col_idx in range(num_cols):
-        max_width = 0.0
-        for row_idx, row in enumerate(table_data):
-            if col_idx < len(row):
-                text = _strip_to_rendered_text(row[col_idx])
-                is_bold = (row_idx == 0) or ('**' in row[col_idx])
-                w = len(text) * _CHAR_WIDTH_INCHES
-                if is_bold:
-                    w *= _BOLD_WIDTH_FACTOR
-                max_width = max(max_width, w)
-        natural.append(max_width + _CELL_HORIZ_PAD_INCHES)
-    return natural
-
-
-def _column_extra_space_weights(table_data, natural, minimums, num_cols):
-    """Weight extra space allocation toward columns likely to wrap heavily."""
-    weights = []
-    header_row = table_data[0] if table_data else []
-
-    for col_idx in range(num_cols):
-        n = natural[col_idx]
-        m = minimums[col_idx]
-        desire = max(0.0, n - m)
-        if desire <= 0:
-            weights.append(0.0)
-            continue
+    text_ems = metrics.em_widths(_TABLE_FONT_NAME)
+    if text_ems is not None:
+        text_widths = text_ems * (_TABLE_FONT_SIZE_PT / 72)
+    else:
+        text_widths = metrics.length * _CHAR_WIDTH_INCHES
+        text_widths = np.where(metrics.bold, text_widths * _BOLD_WIDTH_FACTOR, text_widths)
+    return metrics.column_max(text_widths) + _CELL_HORIZ_PAD_INCHES
 
-        # Prefer columns far from their minimum and with higher wrap pressure.
-        wrap_pressure = (n / m) if m > 0 else 1.0
-        weight = (desire ** _EXTRA_SPACE_POWER) * wrap_pressure
 
-        # Common long-text headers deserve a little more width.
-        header_text = ''
-        if col_idx < len(header_row):
-            header_text = _strip_to_rendered_text(header_row[col_idx]).lower()
-        boost = 1.0
-        for key, factor in _HEADER_WIDTH_BOOSTS.items():
-            if key in header_text:
-                boost = max(boost, factor)
-        weight *= boost
+def _column_extra_space_weights(metrics, natural, minimums):
+    """Weight extra space allocation toward columns likely to wrap heavily."""
+    desire = np.maximum(0.0, natural - minimums)
+
+    # Prefer columns far from their minimum and with higher wrap pressure.
+    safe_minimums = np.where(minimums > 0, minimums, 1.0)
+    wrap_pressure = np.where(minimums > 0, natural / safe_minimums, 1.0)
+    weights = np.where(desire > 0, (desire ** _EXTRA_SPACE_POWER) * wrap_pressure, 0.0)
 
-        weights.append(weight)
+    # Common long-text headers deserve a little more width.
+    if metrics.num_rows:
+        for col_idx, header_text in enumerate(metrics.text[0]):
+            header_text = header_text.lower()
+            boost = max([1.0] + [factor for key, factor in _HEADER_WIDTH_BOOSTS.items()
+                                 if key in header_text])
+            weights[col_idx] *= boost
 
     return weights
 
@@ -323,125 +341,63 @@ def _compute_column_widths(table_data, num_cols, available_width_inches):
        compact.
     4. The result is normalised so the table spans exactly the available
        width.
+
+    Cell text is measured once per table (see table_metrics) and every step
+    is an array operation over the columns.
     """
-    natural = _natural_column_widths(table_data, num_cols)
-    minimums = _min_column_widths_for_words(table_data, num_cols)
+    metrics = table_metrics(table_data, num_cols)
+    natural = _natural_column_widths(metrics)
+    minimums = _min_column_widths_for_words(metrics)
 
-    total_natural = sum(natural)
-    total_min = sum(minimums)
+    total_natural = natural.sum()
+    total_min = minimums.sum()
 
     # --- Case 1: every column fits on one line --------------------------
     if total_natural <= available_width_inches:
-        widths = natural[:]
+        widths = natural
         surplus = available_width_inches - total_natural
         if total_natural > 0:
-            widths = [w + surplus * (w / total_natural) for w in widths]
-        return widths
+            widths = widths + surplus * (widths / total_natural)
+        return widths.tolist()
 
     # --- Case 2: even single-word minimums exceed the page --------------
     if total_min >= available_width_inches:
         factor = (available_width_inches / total_min) if total_min > 0 else 1.0
-        return [m * factor for m in minimums]
+        return (minimums * factor).tolist()
 
     # --- Case 3: normal — allocate extra space above minimums -----------
     extra = available_width_inches - total_min
-    weights = _column_extra_space_weights(
-        table_data, natural, minimums, num_cols)
-    total_weight = sum(weights)
+    weights = _column_extra_space_weights(metrics, natural, minimums)
+    total_weight = weights.sum()
 
     if total_weight > 0:
-        widths = [m + extra * (w / total_weight)
-                  for m, w in zip(minimums, weights)]
+        widths = minimums + extra * (weights / total_weight)
     else:
-        widths = [m + extra / num_cols for m in minimums]
+        widths = minimums + extra / num_cols
 
-    return widths
+    return widths.tolist()
 
 
-def _prevent_row_splitting(table):
-    """Prevent table rows from splitting across page boundaries."""
-    ns = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
-    for row in table.rows:
-        trPr = row._tr.get_or_add_trPr()
-        if trPr.find(f'{{{ns}}}cantSplit') is None:
-            trPr.append(parse_xml(f'<w:cantSplit xmlns:w="{ns}"/>'))
-
-
-def _apply_fixed_table_layout(table, table_data, num_cols,
-                              available_width_inches):
-    """Apply a fixed-width, full-page-width table layout.
-
-    * The table spans the full width between page margins.
-    * Column widths are computed using a natural-width-based strategy:
-      short-label columns stay compact while longer-content columns
-      receive more space.
-    * Every column is guaranteed wide enough for its longest single
-      word to render without a mid-word line break.
-    * Word is told to respect the explicit column widths (fixed layout).
-    """
+def _fixed_column_widths(table_data, num_cols, available_width_inches):
+    """Column widths (inches) normalized to exactly fill the available width."""
     widths = _compute_column_widths(table_data, num_cols, available_width_inches)
 
-    # Normalize to exactly fill the available width
     total = sum(widths)
     if total > 0:
         factor = available_width_inches / total
         widths = [w * factor for w in widths]
-
-    # ------------------------------------------------------------------
-    # Apply XML properties
-    # ------------------------------------------------------------------
-    ns = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
-    tblPr = table._tbl.tblPr
-
-    # Table width -> 100 % of page (pct 5000 = 100 %)
-    for child in tblPr.findall(f'{{{ns}}}tblW'):
-        tblPr.remove(child)
-    tblPr.append(parse_xml(
-        f'<w:tblW xmlns:w="{ns}" w:type="pct" w:w="5000"/>'
-    ))
-
-    # Fixed layout -> Word respects explicit column widths
-    for child in tblPr.findall(f'{{{ns}}}tblLayout'):
-        tblPr.remove(child)
-    tblPr.append(parse_xml(
-        f'<w:tblLayout xmlns:w="{ns}" w:type="fixed"/>'
-    ))
-
-    # Disable python-docx autofit flag
-    table.autofit = False
-
-    # Avoid ugly split rows at page boundaries.
-    _prevent_row_splitting(table)
-
-    # Set explicit column (and cell) widths
-    for col_idx in range(num_cols):
-        col_width = Inches(widths[col_idx])
-        table.columns[col_idx].width = col_width
-        for row in table.rows:
-            row.cells[col_idx].width = col_width
+    return widths
 
 
 def _is_special_line(stripped):
     """Check if a stripped line is a special Markdown element (not a regular paragraph line)."""
     if not stripped:
         return True
-    if re.match(r'^(-{3,}|\*{3,}|_{3,})$', stripped):
-        return True  # Horizontal rule
-    if re.match(r'^#{1,6}\s+', stripped):
-        return True  # Heading
+    if stripped[0] not in _BLOCK_START_CHARS:
+        return False
     if stripped.startswith('|') and '|' in stripped[1:]:
         return True  # Table
-    if re.match(r'^[-*+]\s+', stripped):
-        return True  # Bullet list
-    if re.match(r'^\d+[.)]\s+', stripped):
-        return True  # Numbered list
-    if stripped.startswith('```'):
-        return True  # Code fence
-    if stripped.startswith('>'):
-        return True  # Blockquote
-    if re.match(r'^!\[([^\]]*)\]\(([^)]+)\)', stripped):
-        return True  # Image
-    return False
+    return _SPECIAL_LINE_RE.match(stripped) is not None
 
 
 def _restart_list_numbering(doc, paragraph):
@@ -598,7 +554,526 @@ def _clean_document_metadata(doc, author):
         pass  # Non-critical; core properties cover the visible fields
 
 
-def convert_markdown_to_docx(input_path, output_path=None, author=None):
+# ---------------------------------------------------------------------------
+# Block AST
+# ---------------------------------------------------------------------------
+
+
+@dataclass(slots=True)
+class Block:
+    """Base class for a block-level Markdown element."""
+    line: int = field(default=0, kw_only=True)  # 1-based source line
+
+
+@dataclass(slots=True)
+class Heading(Block):
+    """ATX heading (# .. ######)"""
+    level: int
+    text: str
+
+
+@dataclass(slots=True)
+class TableBlock(Block):
+    """Pipe table: rows of cell strings (header first) and column alignments"""
+    rows: List[List[str]]
+    alignments: List[str]
+
+
+@dataclass(slots=True)
+class ListItem(Block):
+    """Bullet or numbered list item"""
+    text: str
+    indent: int = 0
+    ordered: bool = False
+
+
+@dataclass(slots=True)
+class CodeBlock(Block):
+    """Fenced code block"""
+    lines: List[str]
+    language: str = ''
+
+
+@dataclass(slots=True)
+class BlockQuote(Block):
+    """Blockquote, merged into a single line of text"""
+    text: str
+
+
+@dataclass(slots=True)
+class Image(Block):
+    """Block-level image"""
+    alt: str
+    path: str
+
+
+@dataclass(slots=True)
+class Paragraph(Block):
+    """Regular paragraph (consecutive lines merged with spaces)"""
+    text: str
+
+
+@dataclass(slots=True)
+class HorizontalRule(Block):
+    """Horizontal rule (---, ***, ___)"""
+
+
+def tokenize_markdown(lines):
+    """
+    Tokenize Markdown lines into a list of blocks in a single pass.
+
+    The first character of each stripped line selects the only block patterns
+    that could match it, so plain text never touches a regex and every line is
+    examined a bounded number of times.  The cost is linear in the length of
+    the document.
+
+    Args:
+        lines: List of source lines (without newlines)
+
+    Returns:
+        List of Block objects in document order
+    """
+    blocks = []
+    idx = 0
+    n_lines = len(lines)
+
+    while idx < n_lines:
+        line = lines[idx]
+        stripped = line.strip()
+
+        # Skip empty lines
+        if not stripped:
+            idx += 1
+            continue
+
+        first = stripped[0]
+        line_no = idx + 1
+
+        # --- Fenced code block ---
+        if first == '`':
+            code_fence_match = _CODE_FENCE_RE.match(stripped)
+            if code_fence_match:
+                code_lines = []
+                idx += 1
+                while idx < n_lines:
+                    if lines[idx].strip() == '```':
+                        idx += 1
+                        break
+                    code_lines.append(lines[idx])
+                    idx += 1
+                blocks.append(CodeBlock(code_lines, code_fence_match.group(1), line=line_no))
+                continue
+
+        # --- Headings ---
+        elif first == '#':
+            heading_match = _HEADING_RE.match(stripped)
+            if heading_match:
+                heading_text = heading_match.group(2).strip()
+                # Remove any trailing # characters
+                heading_text = _HEADING_TRAILING_HASHES_RE.sub('', heading_text)
+                blocks.append(Heading(len(heading_match.group(1)), heading_text, line=line_no))
+                idx += 1
+                continue
+
+        # --- Image (block-level) ---
+        elif first == '!':
+            image_match = _IMAGE_RE.match(stripped)
+            if image_match:
+                blocks.append(Image(image_match.group(1), image_match.group(2), line=line_no))
+                idx += 1
+                continue
+
+        # --- Table ---
+        elif first == '|':
+            if '|' in stripped[1:]:
+                table_data, alignments, new_idx = parse_table(lines, idx)
+                if table_data:
+                    blocks.append(TableBlock(table_data, alignments, line=line_no))
+                    idx = new_idx
+                    continue
+
+        # --- Blockquote ---
+        elif first == '>':
+            quote_lines = []
+            while idx < n_lines:
+                s = lines[idx].strip()
+                if s.startswith('>'):
+                    # Remove the > prefix and optional following space
+                    quote_lines.append(_BLOCKQUOTE_PREFIX_RE.sub('', s, count=1))
+                    idx += 1
+                elif s == '':
+                    # Allow blank lines within a blockquote if next line continues it
+                    if idx + 1 < n_lines and lines[idx + 1].strip().startswith('>'):
+                        quote_lines.append('')
+                        idx += 1
+                    else:
+                        break
+                else:
+                    break
+
+            # Merge non-empty lines into a single paragraph
+            merged_quote = ' '.join(ln for ln in quote_lines if ln)
+            blocks.append(BlockQuote(merged_quote, line=line_no))
+            continue
+
+        # --- Horizontal rule (3+ of the SAME character) or bullet list ---
+        elif first in '-*_+':
+            if first != '+' and _HORIZONTAL_RULE_RE.match(stripped):
+                blocks.append(HorizontalRule(line=line_no))
+                idx += 1
+                continue
+            bullet_match = _BULLET_RE.match(line)
+            if bullet_match:
+                blocks.append(ListItem(bullet_match.group(3), len(bullet_match.group(1)),
+                                       ordered=False, line=line_no))
+                idx += 1
+                continue
+
+        # --- Numbered list ---
+        elif first.isdigit():
+            number_match = _NUMBERED_RE.match(line)
+            if number_match:
+                blocks.append(ListItem(number_match.group(3), len(number_match.group(1)),
+                                       ordered=True, line=line_no))
+                idx += 1
+                continue
+
+        # --- Regular paragraph ---
+        idx = _consume_paragraph(lines, idx, stripped, blocks)
+
+    return blocks
+
+
+def _consume_paragraph(lines, idx, stripped, blocks):
+    """Merge consecutive non-special lines from idx into one Paragraph block.
+
+    Returns the index of the first line after the paragraph.
+    """
+    para_lines = [stripped]
+    line_no = idx + 1
+    idx += 1
+    n_lines = len(lines)
+    while idx < n_lines:
+        next_stripped = lines[idx].strip()
+        if not next_stripped or _is_special_line(next_stripped):
+            break
+        para_lines.append(next_stripped)
+        idx += 1
+
+    blocks.append(Paragraph(' '.join(para_lines), line=line_no))
+    return idx
+
+
+# ---------------------------------------------------------------------------
+# Image pipeline
+# ---------------------------------------------------------------------------
+# Prepared images live in this subfolder of CACHE_DIRNAME, named by source
+# content hash and target pixel width, so each source is processed once.
+_PREPARED_IMAGES_DIRNAME = '_prepared_images'
+
+# Formats kept as-is when re-encoded; anything else (BMP, TIFF, GIF, ...) is
+# converted to PNG
+_REENCODE_FORMATS = {'PNG': '.png', 'JPEG': '.jpg'}
+
+# In-process memo: (path, size, mtime_ns, target_px) -> prepared image path
+_prepared_images = {}
+
+
+def _encode_image(img, source_format, target_px, dpi):
+    """Resample img to at most target_px wide and encode it; returns (bytes, ext)."""
+    if img.width > target_px:
+        target_height = max(1, round(img.height * target_px / img.width))
+        img = img.resize((target_px, target_height), PILImage.LANCZOS)
+
+    buffer = io.BytesIO()
+    if source_format == 'JPEG':
+        if img.mode not in ('RGB', 'L'):
+            img = img.convert('RGB')
+        img.save(buffer, 'JPEG', quality=88, optimize=True, progressive=True, dpi=(dpi, dpi))
+    else:
+        if img.mode == 'RGBA' and img.getextrema()[3][0] == 255:
+            img = img.convert('RGB')  # Fully opaque: drop the alpha channel
+        elif img.mode not in ('RGB', 'RGBA', 'L', 'LA', 'P'):
+            img = img.convert('RGBA')
+        img.save(buffer, 'PNG', optimize=True, dpi=(dpi, dpi))
+    return buffer.getvalue(), _REENCODE_FORMATS.get(source_format, '.png')
+
+
+def prepare_image(image_path, cache_root, width_inches=IMAGE_WIDTH_INCHES,
+                  dpi=IMAGE_TARGET_DPI):
+    """
+    Return a copy of an image resampled to the print resolution for embedding.
+
+    Images wider than width_inches x dpi pixels are downscaled (Lanczos) and
+    re-encoded (optimized PNG, or progressive JPEG for JPEG sources); smaller
+    images are only re-encoded, and the original is kept when re-encoding would
+    not make it smaller.  Results are cached in cache_root, keyed by the source
+    content hash and target width, so identical images share one file and
+    python-docx stores them once in the package.
+
+    Args:
+        image_path: Path to the source image
+        cache_root: Folder holding prepared images
+        width_inches: Width the image is embedded at
+        dpi: Target print resolution
+
+    Returns:
+        str: Path to embed (the source path if Pillow is missing, the file does
+             not exist, cannot be read as an image or exceeds Pillow's
+             decompression-bomb pixel limit), or an io.BytesIO of the prepared
+             image when the cache folder cannot be written
+    """
+    if PILImage is None or not os.path.isfile(image_path):
+        return image_path
+
+    target_px = round(width_inches * dpi)
+    stat = os.stat(image_path)
+    memo_key = (os.path.abspath(image_path), stat.st_size, stat.st_mtime_ns, target_px)
+    if memo_key in _prepared_images:
+        return _prepared_images[memo_key]
+
+    with open(image_path, 'rb') as f:
+        source_bytes = f.read()
+    source_hash = hashlib.sha1(source_bytes).hexdigest()[:20]
+
+    cache_dir = os.path.join(cache_root, _PREPARED_IMAGES_DIRNAME)
+    for ext in ('.png', '.jpg'):
+        cached = os.path.join(cache_dir, f'{source_hash}-{target_px}{ext}')
+        if os.path.exists(cached):
+            _prepared_images[memo_key] = cached
+            return cached
+
+    try:
+        with PILImage.open(io.BytesIO(source_bytes)) as img:
+            source_format = img.format
+            downscaled = img.width > target_px
+            encoded, ext = _encode_image(img, source_format, target_px, dpi)
+    except (OSError, ValueError):
+        # Not a raster format Pillow can read (e.g. SVG, EMF); embed unchanged
+        return image_path
+    except (PILImage.DecompressionBombError, PILImage.DecompressionBombWarning):
+        # Beyond Pillow's pixel limit (the warning is raised under -W error);
+        # embed the original rather than decode it
+        return image_path
+
+    # Re-encoding a small, already-compact image can make it larger
+    if (not downscaled and source_format in _REENCODE_FORMATS
+            and len(encoded) >= len(source_bytes)):
+        encoded, ext = source_bytes, _REENCODE_FORMATS[source_format]
+
+    prepared = os.path.join(cache_dir, f'{source_hash}-{target_px}{ext}')
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(prepared, 'wb') as f:
+            f.write(encoded)
+    except OSError:
+        # Cache folder not writable; embed the prepared bytes from memory
+        return io.BytesIO(encoded)
+    _prepared_images[memo_key] = prepared
+    return prepared
+
+
+# ---------------------------------------------------------------------------
+# DOCX emitter
+# ---------------------------------------------------------------------------
+
+
+# Table properties shared by every emitted table (schema order)
+_TABLE_LOOK_XML = ('<w:tblLook w:firstColumn="1" w:firstRow="1" w:lastColumn="0" '
+                   'w:lastRow="0" w:noHBand="0" w:noVBand="1" w:val="04A0"/>')
+_ALIGNMENT_JC = {'left': 'left', 'center': 'center', 'right': 'right'}
+_CELL_MARGIN_XML = (f'<w:tcMar><w:top w:w="{_CELL_MARGIN_TOP_TWIPS}" w:type="dxa"/>'
+                    f'<w:bottom w:w="{_CELL_MARGIN_BOTTOM_TWIPS}" w:type="dxa"/></w:tcMar>')
+
+
+def _add_table(doc, block):
+    """Add a pipe table block as a full-width, fixed-layout Word table.
+
+    The w:tbl element is built in one pass over the rows: column widths are
+    computed up front, and every row and cell is a deepcopy of a pre-built
+    template carrying its properties (width, padding, vertical centering,
+    alignment, no row splitting), so no per-cell parse_xml or python-docx
+    row/cell lookups are needed.
+    """
+    table_data = block.rows
+    num_cols = max(len(row) for row in table_data)
+
+    # Pad alignments list to match column count
+    alignments = list(block.alignments) + ['left'] * (num_cols - len(block.alignments))
+
+    available_width = _get_available_page_width(doc)
+    widths = _fixed_column_widths(table_data, num_cols, available_width)
+    twips = [Inches(w).twips for w in widths]
+
+    style_id = doc.styles['Table Grid'].style_id
+    grid_xml = ''.join(f'<w:gridCol w:w="{tw}"/>' for tw in twips)
+    tbl = parse_xml(
+        f'<w:tbl {nsdecls("w")}>'
+        f'<w:tblPr><w:tblStyle w:val="{style_id}"/>'
+        f'<w:tblW w:type="pct" w:w="5000"/>'
+        f'<w:tblLayout w:type="fixed"/>{_TABLE_LOOK_XML}</w:tblPr>'
+        f'<w:tblGrid>{grid_xml}</w:tblGrid>'
+        f'</w:tbl>'
+    )
+
+    # Pre-built templates: one filled-cell and one empty-cell template per column
+    row_template = parse_xml(f'<w:tr {nsdecls("w")}><w:trPr><w:cantSplit/></w:trPr></w:tr>')
+    cell_templates = [
+        parse_xml(
+            f'<w:tc {nsdecls("w")}><w:tcPr><w:tcW w:type="dxa" w:w="{tw}"/>'
+            f'{_CELL_MARGIN_XML}<w:vAlign w:val="center"/></w:tcPr>'
+            f'<w:p><w:pPr><w:jc w:val="{_ALIGNMENT_JC.get(align, "left")}"/></w:pPr></w:p></w:tc>'
+        )
+        for tw, align in zip(twips, alignments)
+    ]
+    empty_cell_templates = [
+        parse_xml(f'<w:tc {nsdecls("w")}><w:tcPr><w:tcW w:type="dxa" w:w="{tw}"/></w:tcPr><w:p/></w:tc>')
+        for tw in twips
+    ]
+
+    body = doc._body
+    for row_idx, row_data in enumerate(table_data):
+        tr = deepcopy(row_template)
+        for col_idx in range(num_cols):
+            if col_idx >= len(row_data):
+                tr.append(deepcopy(empty_cell_templates[col_idx]))
+                continue
+
+            tc = deepcopy(cell_templates[col_idx])
+            # Header row is bold
+            parse_inline_formatting(DocxParagraph(tc[-1], body), row_data[col_idx], bold=(row_idx == 0))
+            tr.append(tc)
+        tbl.append(tr)
+
+    doc.element.body._insert_tbl(tbl)
+    doc.add_paragraph()  # Add spacing after table
+    return Table(tbl, body)
+
+
+def _add_blockquote(doc, text):
+    """Add an indented, italic, gray blockquote paragraph with a left border."""
+    p = doc.add_paragraph()
+    p.paragraph_format.left_indent = Inches(0.5)
+    parse_inline_formatting(p, text)
+
+    # Style the blockquote runs (italic + gray)
+    for run in p.runs:
+        run.italic = True
+        run.font.color.rgb = RGBColor(0x55, 0x55, 0x55)
+
+    # Add a left border via XML
+    pPr = p._p.get_or_add_pPr()
+    pBdr = parse_xml(
+        '<w:pBdr xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+        '<w:left w:val="single" w:sz="12" w:space="4" w:color="AAAAAA"/>'
+        '</w:pBdr>'
+    )
+    pPr.append(pBdr)
+
+
+def _add_image(doc, block, base_dir):
+    """Add a centered block image, or its alt text if the image can't be loaded."""
+    image_path = block.path
+    # Resolve relative paths against the input file's directory
+    if not os.path.isabs(image_path):
+        image_path = os.path.join(base_dir, image_path)
+    try:
+        image_path = prepare_image(image_path, os.path.join(base_dir, CACHE_DIRNAME))
+        doc.add_picture(image_path, width=Inches(IMAGE_WIDTH_INCHES))
+        # Center the image
+        last_paragraph = doc.paragraphs[-1]
+        last_paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    except Exception:
+        # If image can't be loaded, add alt text as fallback
+        p = doc.add_paragraph()
+        run = p.add_run(f'[Image: {block.alt}]')
+        run.italic = True
+        run.font.color.rgb = RGBColor(0x99, 0x99, 0x99)
+
+
+def emit_blocks(doc, blocks, base_dir, state=None):
+    """
+    Emit a block AST into a Word document.
+
+    Args:
+        doc: python-docx Document
+        blocks: Blocks from tokenize_markdown
+        base_dir: Directory that relative image paths are resolved against
+        state: Emitter state dict carried between calls (has_content,
+               first_chapter_done, prev_block); a fresh state is used when None
+
+    Returns:
+        dict: Emitter state after the last block
+    """
+    if state is None:
+        state = {'has_content': False, 'first_chapter_done': False, 'prev_block': None}
+
+    for block in blocks:
+        prev_block = state['prev_block']
+        state['prev_block'] = block
+
+        if isinstance(block, CodeBlock):
+            _add_code_block(doc, block.lines)
+
+        elif isinstance(block, HorizontalRule):
+            if not ENABLE_HORIZONTAL_RULES:
+                continue
+            p = doc.add_paragraph()
+            p.add_run('─' * 50)
+            p.alignment = WD_ALIGN_PARAGRAPH.CENTER
+
+        elif isinstance(block, Heading):
+            level = block.level
+            # Start each chapter (H1 or H2) on a new page.
+            # Uses an explicit page-break paragraph (not the paragraph
+            # property page_break_before) so the user can select and
+            # delete it in Word to merge chapters.
+            # - Skip when no content yet (avoids a leading blank page).
+            # - Let the first H2 share the page with the title.
+            if level <= 2 and state['has_content']:
+                if level == 1 or state['first_chapter_done']:
+                    doc.add_page_break()
+            heading = doc.add_heading(block.text, level=level)
+            if level == 1:
+                heading.alignment = WD_ALIGN_PARAGRAPH.CENTER
+            if level == 2:
+                state['first_chapter_done'] = True
+
+        elif isinstance(block, Image):
+            _add_image(doc, block, base_dir)
+
+        elif isinstance(block, TableBlock):
+            _add_table(doc, block)
+
+        elif isinstance(block, BlockQuote):
+            _add_blockquote(doc, block.text)
+
+        elif isinstance(block, ListItem):
+            # Determine nesting level based on indentation
+            if block.indent >= 4:
+                suffix = ' 3'
+            elif block.indent >= 2:
+                suffix = ' 2'
+            else:
+                suffix = ''
+            style = ('List Number' if block.ordered else 'List Bullet') + suffix
+            p = doc.add_paragraph(style=style)
+            parse_inline_formatting(p, block.text)
+            # Restart numbering at 1 if this is the first item of a new list
+            if block.ordered and not (isinstance(prev_block, ListItem) and prev_block.ordered):
+                _restart_list_numbering(doc, p)
+
+        elif isinstance(block, Paragraph):
+            p = doc.add_paragraph()
+            parse_inline_formatting(p, block.text)
+
+        state['has_content'] = True
+
+    return state
+
+
+def convert_markdown_to_docx(input_path, output_path=None, author=None, incremental=False,
+                             markdown=None):
     """
     Convert a markdown file to a Word document.
     
@@ -606,15 +1081,23 @@ def convert_markdown_to_docx(input_path, output_path=None, author=None):
         input_path: Path to the input markdown file
         output_path: Path for the output docx file (optional)
         author: Author name for document properties (defaults to OS username)
+        incremental: Reuse cached WordprocessingML for H1/H2 chapters whose
+                     markdown has not changed since the last incremental build
+        markdown: Markdown text to convert instead of reading input_path; image
+                  paths still resolve relative to input_path's folder
     """
     if output_path is None:
         output_path = os.path.splitext(input_path)[0] + '.docx'
 
     # Read the markdown file
-    with open(input_path, 'r', encoding='utf-8') as f:
-        content = f.read()
+    if markdown is None:
+        with open(input_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+    else:
+        content = markdown
 
     lines = content.split('\n')
+    blocks = tokenize_markdown(lines)
     doc = Document()
 
     # Clean metadata — remove python-docx traces, set author
@@ -623,251 +1106,577 @@ def convert_markdown_to_docx(input_path, output_path=None, author=None):
                                 os.environ.get('USER', ''))
     _clean_document_metadata(doc, author)
 
-    idx = 0
-    has_content = False  # Track whether any content has been added (for page-break logic)
-    first_chapter_done = False  # Allow the first H2 to stay on the same page as the title
-    prev_was_numbered_list = False  # Track numbered-list continuity
+    base_dir = os.path.dirname(os.path.abspath(input_path))
+    if incremental:
+        stem = os.path.splitext(os.path.basename(input_path))[0]
+        cache_dir = os.path.join(base_dir, CACHE_DIRNAME, stem)
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+        except OSError as e:
+            print(f"Note: chapter cache unavailable ({e}); building the full document")
+            incremental = False
+    if incremental:
+        reused, total = emit_blocks_incremental(doc, lines, blocks, base_dir, cache_dir)
+    else:
+        emit_blocks(doc, blocks, base_dir)
+
+    # Save the document
+    doc.save(output_path)
+    print(f"Successfully converted: {input_path}")
+    print(f"Output saved to: {output_path}")
+    if incremental:
+        print(f"Reused {reused} of {total} chapters from cache")
+    return output_path
+
+
+# ---------------------------------------------------------------------------
+# Incremental rebuild
+# ---------------------------------------------------------------------------
+# Each H1/H2 chapter's WordprocessingML is cached under CACHE_DIRNAME (next to
+# the markdown) together with the relationships and numbering instances it
+# uses, keyed by a hash of the chapter's markdown and the emitter state it
+# starts from.  Unchanged chapters are spliced back in without re-emitting.
+
+# Bump when the fragment format changes so old cache entries are ignored
+_INCREMENTAL_CACHE_VERSION = 1
+
+# Modules whose code shapes the emitted fragments (inline lexing, table column
+# widths); editing any of them invalidates every cached chapter
+_FRAGMENT_SOURCES = ('md_to_docx.py', 'inline_format.py', 'table_metrics.py', 'font_metrics.py')
+
+_W_NS = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+_R_NS = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+_WP_NS = 'http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing'
+_R_ATTRS = (f'{{{_R_NS}}}id', f'{{{_R_NS}}}embed', f'{{{_R_NS}}}link')
+
+
+def _split_chapters(blocks, line_count):
+    """
+    Split blocks at H1/H2 headings.
+
+    Returns:
+        list: (first_line, end_line, blocks) per chapter, as 0-based source
+              line slices; anything before the first heading is chapter 0
+    """
+    chapters = []
+    current = []
+    start = 0
+    for block in blocks:
+        if isinstance(block, Heading) and block.level <= 2 and current:
+            chapters.append((start, block.line - 1, current))
+            current = []
+            start = block.line - 1
+        current.append(block)
+    if current:
+        chapters.append((start, line_count, current))
+    return chapters
+
+
+def _advance_state(state, blocks):
+    """Apply the state changes emit_blocks would make for blocks, without emitting."""
+    for block in blocks:
+        state['prev_block'] = block
+        if isinstance(block, HorizontalRule) and not ENABLE_HORIZONTAL_RULES:
+            continue
+        if isinstance(block, Heading) and block.level == 2:
+            state['first_chapter_done'] = True
+        state['has_content'] = True
+    return state
+
+
+def _chapter_key(chapter_lines, blocks, state, base_dir):
+    """
+    Cache key for one chapter.
+
+    Covers the chapter's markdown, the emitter state it starts from, its image
+    files, the emitter modules, the image and rule settings, and whether the
+    table font can be measured (real metrics change the table column widths).
+    """
+    source_dir = os.path.dirname(os.path.abspath(__file__))
+    sources = '|'.join(str(os.path.getmtime(os.path.join(source_dir, name)))
+                       for name in _FRAGMENT_SOURCES)
+    digest = hashlib.sha256()
+    digest.update(f"{_INCREMENTAL_CACHE_VERSION}|{sources}|"
+                  f"{ENABLE_HORIZONTAL_RULES}|{IMAGE_WIDTH_INCHES}|{IMAGE_TARGET_DPI}|"
+                  f"{font_metrics.available(_TABLE_FONT_NAME)}|{state['has_content']}|"
+                  f"{state['first_chapter_done']}\n".encode('utf-8'))
+    digest.update('\n'.join(chapter_lines).encode('utf-8'))
+    for block in blocks:
+        if isinstance(block, Image):
+            image_path = os.path.join(base_dir, block.path)
+            if os.path.exists(image_path):
+                stat = os.stat(image_path)
+                digest.update(f"\n{image_path}|{stat.st_size}|{stat.st_mtime_ns}".encode('utf-8'))
+    return digest.hexdigest()[:24]
+
+
+def _body_content(body):
+    """Block-level children of w:body, excluding the trailing w:sectPr."""
+    return [child for child in body if child.tag != f'{{{_W_NS}}}sectPr']
+
+
+def _capture_chapter(doc, elements, new_nums, cache_dir, key):
+    """Write freshly emitted chapter elements and their dependencies to the cache."""
+    rels = {}
+    for element in elements:
+        for node in element.iter():
+            for attr in _R_ATTRS:
+                r_id = node.get(attr)
+                if r_id is None or r_id in rels:
+                    continue
+                rel = doc.part.rels[r_id]
+                if rel.is_external:
+                    rels[r_id] = {'reltype': rel.reltype, 'target': rel.target_ref}
+                else:
+                    part = rel.target_part
+                    image_name = f"{part.sha1}.{part.partname.ext}"
+                    image_path = os.path.join(cache_dir, 'images', image_name)
+                    if not os.path.exists(image_path):
+                        os.makedirs(os.path.dirname(image_path), exist_ok=True)
+                        with open(image_path, 'wb') as f:
+                            f.write(part.blob)
+                    rels[r_id] = {'image': image_name}
+
+    entry = {
+        'elements': [etree.tostring(element, encoding='unicode') for element in elements],
+        'rels': rels,
+        'nums': {num.get(f'{{{_W_NS}}}numId'): etree.tostring(num, encoding='unicode')
+                 for num in new_nums},
+    }
+    with open(os.path.join(cache_dir, f'{key}.json'), 'w', encoding='utf-8') as f:
+        json.dump(entry, f)
+
+
+def _splice_chapter(doc, entry, cache_dir):
+    """Insert a cached chapter, re-creating its relationships and numbering."""
+    body = doc.element.body
+    numbering_elm = doc.part.numbering_part._element
+
+    rid_map = {}
+    for old_id, rel in entry['rels'].items():
+        if 'image' in rel:
+            rid_map[old_id], _ = doc.part.get_or_add_image(
+                os.path.join(cache_dir, 'images', rel['image']))
+        else:
+            rid_map[old_id] = doc.part.relate_to(rel['target'], rel['reltype'], is_external=True)
+
+    num_map = {}
+    next_num_id = max((int(n.get(f'{{{_W_NS}}}numId'))
+                       for n in numbering_elm.findall(f'{{{_W_NS}}}num')), default=0) + 1
+    for old_id, num_xml in entry['nums'].items():
+        num = parse_xml(num_xml)
+        num.set(f'{{{_W_NS}}}numId', str(next_num_id))
+        numbering_elm.append(num)
+        num_map[old_id] = str(next_num_id)
+        next_num_id += 1
+
+    for element_xml in entry['elements']:
+        element = parse_xml(element_xml)
+        for node in element.iter():
+            for attr in _R_ATTRS:
+                r_id = node.get(attr)
+                if r_id is not None:
+                    node.set(attr, rid_map[r_id])
+            if node.tag == f'{{{_W_NS}}}numId':
+                val = node.get(f'{{{_W_NS}}}val')
+                if val in num_map:
+                    node.set(f'{{{_W_NS}}}val', num_map[val])
+        # Drawing ids must stay unique across the document
+        for doc_pr in element.iter(f'{{{_WP_NS}}}docPr'):
+            doc_pr.set('id', str(doc.part.next_id))
+        if body.sectPr is not None:
+            body.sectPr.addprevious(element)
+        else:
+            body.append(element)
+
+
+def emit_blocks_incremental(doc, lines, blocks, base_dir, cache_dir):
+    """
+    Emit blocks chapter by chapter, splicing unchanged chapters from cache.
+
+    Args:
+        doc: python-docx Document
+        lines: Markdown source lines (the input to tokenize_markdown)
+        blocks: Blocks from tokenize_markdown
+        base_dir: Directory that relative image paths are resolved against
+        cache_dir: Folder holding this document's cached chapter fragments
+
+    Returns:
+        tuple: (chapters reused from cache, total chapters)
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    numbering_elm = doc.part.numbering_part._element
+    state = {'has_content': False, 'first_chapter_done': False, 'prev_block': None}
+    used_keys = set()
+    reused = 0
+
+    chapters = _split_chapters(blocks, len(lines))
+    for first_line, end_line, chapter_blocks in chapters:
+        key = _chapter_key(lines[first_line:end_line], chapter_blocks, state, base_dir)
+        used_keys.add(key)
+        entry_path = os.path.join(cache_dir, f'{key}.json')
+
+        entry = None
+        if os.path.exists(entry_path):
+            try:
+                with open(entry_path, 'r', encoding='utf-8') as f:
+                    entry = json.load(f)
+            except (OSError, ValueError):
+                entry = None
+
+        if entry is not None:
+            _splice_chapter(doc, entry, cache_dir)
+            _advance_state(state, chapter_blocks)
+            reused += 1
+            continue
+
+        before = len(_body_content(doc.element.body))
+        nums_before = len(numbering_elm.findall(f'{{{_W_NS}}}num'))
+        emit_blocks(doc, chapter_blocks, base_dir, state)
+        elements = _body_content(doc.element.body)[before:]
+        new_nums = numbering_elm.findall(f'{{{_W_NS}}}num')[nums_before:]
+        _capture_chapter(doc, elements, new_nums, cache_dir, key)
+
+    # Drop fragments and images no longer used by this document
+    live_images = set()
+    for key in used_keys:
+        with open(os.path.join(cache_dir, f'{key}.json'), 'r', encoding='utf-8') as f:
+            live_images.update(rel['image'] for rel in json.load(f)['rels'].values()
+                               if 'image' in rel)
+    for name in os.listdir(cache_dir):
+        if name.endswith('.json') and name[:-5] not in used_keys:
+            os.remove(os.path.join(cache_dir, name))
+    images_dir = os.path.join(cache_dir, 'images')
+    if os.path.isdir(images_dir):
+        for name in os.listdir(images_dir):
+            if name not in live_images:
+                os.remove(os.path.join(images_dir, name))
+
+    return reused, len(chapters)
+
+
+# ---------------------------------------------------------------------------
+# Batch conversion
+# ---------------------------------------------------------------------------
+# Directories never searched for markdown sources
+_BATCH_SKIP_DIRS = {'.git', '__pycache__', 'node_modules'}
+
+
+def discover_markdown_files(root):
+    """Return every .md file under root (sorted), skipping VCS/cache folders."""
+    found = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames
+                             if d not in _BATCH_SKIP_DIRS and not d.startswith('.'))
+        found.extend(os.path.join(dirpath, name) for name in sorted(filenames)
+                     if name.lower().endswith('.md'))
+    return found
+
+
+def _referenced_images(md_path):
+    """Return absolute paths of the block images referenced by a markdown file."""
+    with open(md_path, 'r', encoding='utf-8') as f:
+        blocks = tokenize_markdown(f.read().split('\n'))
+    base_dir = os.path.dirname(os.path.abspath(md_path))
+    return [block.path if os.path.isabs(block.path)
+            else os.path.join(base_dir, block.path)
+            for block in blocks if isinstance(block, Image)]
+
+
+def _is_up_to_date(md_path, docx_path):
+    """True when docx_path is newer than the markdown source and every image it uses."""
+    if not os.path.exists(docx_path):
+        return False
+    output_mtime = os.path.getmtime(docx_path)
+    sources = [md_path] + [p for p in _referenced_images(md_path) if os.path.exists(p)]
+    return all(os.path.getmtime(p) < output_mtime for p in sources)
+
+
+def _init_batch_worker():
+    """Warm a pool worker: import python-docx and load the default template once."""
+    Document()
+
+
+def _convert_batch_item(input_path, output_path, author, incremental=False):
+    """Pool task: convert one file quietly, returning (input, elapsed, error)."""
+    start = time.perf_counter()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            convert_markdown_to_docx(input_path, output_path, author=author,
+                                     incremental=incremental)
+    except Exception as e:
+        return input_path, time.perf_counter() - start, f"{type(e).__name__}: {e}"
+    return input_path, time.perf_counter() - start, None
+
+
+def convert_batch(root, author=None, workers=None, force=False, incremental=False):
+    """
+    Convert every markdown file under a directory in a process pool.
+
+    Each .md is written to a .docx next to it.  Files whose .docx is newer than
+    both the markdown and every image it references are skipped unless force is
+    set.  The pool is created once, so workers stay warm across files.
+
+    Args:
+        root: Directory to search recursively for .md files
+        author: Author name for document properties (defaults to OS username)
+        workers: Worker process count (defaults to the CPU count)
+        force: Reconvert even when the output is up to date
+        incremental: Reuse cached chapters (see convert_markdown_to_docx)
+
+    Returns:
+        int: Number of files that failed to convert
+    """
+    sources = discover_markdown_files(root)
+    if not sources:
+        print(f"No markdown files found under {root}")
+        return 0
+
+    jobs = []
+    skipped = []
+    for md_path in sources:
+        docx_path = os.path.splitext(md_path)[0] + '.docx'
+        if not force and _is_up_to_date(md_path, docx_path):
+            skipped.append(md_path)
+        else:
+            jobs.append((md_path, docx_path))
+
+    print(f"Found {len(sources)} markdown file(s) under {root}: "
+          f"{len(jobs)} to convert, {len(skipped)} up to date")
+
+    results = {}
+    start = time.perf_counter()
+    if jobs:
+        workers = max(1, min(workers or os.cpu_count() or 1, len(jobs)))
+        with ProcessPoolExecutor(max_workers=workers,
+                                 initializer=_init_batch_worker) as pool:
+            futures = [pool.submit(_convert_batch_item, md_path, docx_path, author, incremental)
+                       for md_path, docx_path in jobs]
+            for future in as_completed(futures):
+                input_path, elapsed, error = future.result()
+                results[input_path] = (elapsed, error)
+    wall_time = time.perf_counter() - start
+
+    # Per-file timing summary, in discovery order
+    width = max(len(os.path.relpath(p, root)) for p in sources)
+    print(f"\n{'File':<{width}}  {'Time (s)':>9}  Status")
+    for md_path in sources:
+        name = os.path.relpath(md_path, root)
+        if md_path in results:
+            elapsed, error = results[md_path]
+            status = f"FAILED ({error})" if error else "converted"
+            print(f"{name:<{width}}  {elapsed:>9.2f}  {status}")
+        else:
+            print(f"{name:<{width}}  {'-':>9}  up to date")
+
+    failures = sum(1 for _, error in results.values() if error)
+    busy_time = sum(elapsed for elapsed, _ in results.values())
+    print(f"\n  - Converted {len(results) - failures}, failed {failures}, "
+          f"skipped {len(skipped)}")
+    if results:
+        print(f"  - Wall time {wall_time:.2f} s "
+              f"(sum of per-file times {busy_time:.2f} s, {workers} worker(s))")
+    return failures
+
+
+# ---------------------------------------------------------------------------
+# Benchmark
+# ---------------------------------------------------------------------------
+
 
+def _legacy_block_scan(lines):
+    """Block scan as done by the original if-chain parser (uncompiled re.match
+    per branch), kept as the benchmark baseline.  Returns block type names."""
+    kinds = []
+    idx = 0
     while idx < len(lines):
         line = lines[idx]
         stripped = line.strip()
-
-        # Skip empty lines (don't reset list tracking)
         if not stripped:
             idx += 1
             continue
-
-        # Save and reset numbered-list tracking for this iteration.
-        # The numbered-list branch below will set it back to True.
-        was_in_numbered_list = prev_was_numbered_list
-        prev_was_numbered_list = False
-
-        # --- Fenced code block ---
-        code_fence_match = re.match(r'^```(\w*)$', stripped)
-        if code_fence_match:
-            code_lines = []
+        if re.match(r'^```(\w*)$', stripped):
             idx += 1
             while idx < len(lines):
                 if lines[idx].strip() == '```':
                     idx += 1
                     break
-                code_lines.append(lines[idx])
                 idx += 1
-            _add_code_block(doc, code_lines)
-            has_content = True
+            kinds.append('CodeBlock')
             continue
-
-        # --- Horizontal rule (must use 3+ of the SAME character) ---
         if re.match(r'^(-{3,}|\*{3,}|_{3,})$', stripped):
-            if ENABLE_HORIZONTAL_RULES:
-                p = doc.add_paragraph()
-                p.add_run('─' * 50)
-                p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-                has_content = True
+            kinds.append('HorizontalRule')
             idx += 1
             continue
-
-        # --- Headings ---
         heading_match = re.match(r'^(#{1,6})\s+(.+)$', stripped)
         if heading_match:
-            level = len(heading_match.group(1))
-            heading_text = heading_match.group(2).strip()
-            # Remove any trailing # characters
-            heading_text = re.sub(r'\s*#+\s*$', '', heading_text)
-            # Start each chapter (H1 or H2) on a new page.
-            # Uses an explicit page-break paragraph (not the paragraph
-            # property page_break_before) so the user can select and
-            # delete it in Word to merge chapters.
-            # - Skip when no content yet (avoids a leading blank page).
-            # - Let the first H2 share the page with the title.
-            if level <= 2 and has_content:
-                if level == 1 or first_chapter_done:
-                    doc.add_page_break()
-            heading = doc.add_heading(heading_text, level=level)
-            if level == 1:
-                heading.alignment = WD_ALIGN_PARAGRAPH.CENTER
-            if level == 2:
-                first_chapter_done = True
-            has_content = True
+            re.sub(r'\s*#+\s*$', '', heading_match.group(2).strip())
+            kinds.append('Heading')
             idx += 1
             continue
-
-        # --- Image (block-level) ---
-        image_match = re.match(r'^!\[([^\]]*)\]\(([^)]+)\)$', stripped)
-        if image_match:
-            alt_text = image_match.group(1)
-            image_path = image_match.group(2)
-            # Resolve relative paths against the input file's directory
-            if not os.path.isabs(image_path):
-                input_dir = os.path.dirname(os.path.abspath(input_path))
-                image_path = os.path.join(input_dir, image_path)
-            try:
-                doc.add_picture(image_path, width=Inches(5.5))
-                # Center the image
-                last_paragraph = doc.paragraphs[-1]
-                last_paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
-            except Exception:
-                # If image can't be loaded, add alt text as fallback
-                p = doc.add_paragraph()
-                run = p.add_run(f'[Image: {alt_text}]')
-                run.italic = True
-                run.font.color.rgb = RGBColor(0x99, 0x99, 0x99)
-            has_content = True
+        if re.match(r'^!\[([^\]]*)\]\(([^)]+)\)$', stripped):
+            kinds.append('Image')
             idx += 1
             continue
-
-        # --- Table ---
         if stripped.startswith('|') and '|' in stripped[1:]:
-            table_data, alignments, new_idx = parse_table(lines, idx)
-
+            table_data = []
+            while idx < len(lines):
+                row = lines[idx].strip()
+                if not (row.startswith('|') and row.endswith('|')):
+                    break
+                if not re.match(r'^[\|\-:\s]+$', row):
+                    table_data.append([cell.strip() for cell in row.split('|')[1:-1]])
+                idx += 1
             if table_data:
-                idx = new_idx
-                # Create table
-                num_cols = max(len(row) for row in table_data)
-                table = doc.add_table(rows=len(table_data), cols=num_cols)
-                table.style = 'Table Grid'
-
-                # Pad alignments list to match column count
-                while len(alignments) < num_cols:
-                    alignments.append('left')
-
-                available_width = _get_available_page_width(doc)
-
-                for row_idx, row_data in enumerate(table_data):
-                    for col_idx, cell_text in enumerate(row_data):
-                        if col_idx < num_cols:
-                            cell = table.rows[row_idx].cells[col_idx]
-                            # Clear existing paragraph and add formatted text
-                            cell.text = ''
-                            p = cell.paragraphs[0]
-                            parse_inline_formatting(p, cell_text)
-
-                            # Apply column alignment
-                            p.alignment = _get_alignment_enum(alignments[col_idx])
-
-                            # Vertical center alignment and cell padding
-                            cell.vertical_alignment = WD_ALIGN_VERTICAL.CENTER
-                            _set_cell_margins(cell)
-
-                            # Bold header row
-                            if row_idx == 0:
-                                for run in p.runs:
-                                    run.bold = True
-
-                # Apply fixed layout with content-proportional column widths
-                _apply_fixed_table_layout(
-                    table, table_data, num_cols, available_width)
-
-                doc.add_paragraph()  # Add spacing after table
-                has_content = True
+                kinds.append('TableBlock')
                 continue
-
-        # --- Blockquote ---
         if stripped.startswith('>'):
-            quote_lines = []
             while idx < len(lines):
                 s = lines[idx].strip()
                 if s.startswith('>'):
-                    # Remove the > prefix and optional following space
-                    quote_text = re.sub(r'^>\s?', '', s)
-                    quote_lines.append(quote_text)
+                    re.sub(r'^>\s?', '', s)
+                    idx += 1
+                elif s == '' and idx + 1 < len(lines) and lines[idx + 1].strip().startswith('>'):
                     idx += 1
-                elif s == '':
-                    # Allow blank lines within a blockquote if next line continues it
-                    if idx + 1 < len(lines) and lines[idx + 1].strip().startswith('>'):
-                        quote_lines.append('')
-                        idx += 1
-                    else:
-                        break
                 else:
                     break
-
-            # Merge non-empty lines into a single paragraph
-            merged_quote = ' '.join(ln for ln in quote_lines if ln)
-            p = doc.add_paragraph()
-            p.paragraph_format.left_indent = Inches(0.5)
-            parse_inline_formatting(p, merged_quote)
-
-            # Style the blockquote runs (italic + gray)
-            for run in p.runs:
-                run.italic = True
-                run.font.color.rgb = RGBColor(0x55, 0x55, 0x55)
-
-            # Add a left border via XML
-            pPr = p._p.get_or_add_pPr()
-            pBdr = parse_xml(
-                '<w:pBdr xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
-                '<w:left w:val="single" w:sz="12" w:space="4" w:color="AAAAAA"/>'
-                '</w:pBdr>'
-            )
-            pPr.append(pBdr)
-            has_content = True
+            kinds.append('BlockQuote')
             continue
-
-        # --- Bullet list (with nesting support) ---
-        bullet_match = re.match(r'^(\s*)([-*+])\s+(.+)$', line)
-        if bullet_match:
-            indent = len(bullet_match.group(1))
-            # Determine nesting level based on indentation
-            if indent >= 4:
-                style = 'List Bullet 3'
-            elif indent >= 2:
-                style = 'List Bullet 2'
-            else:
-                style = 'List Bullet'
-            p = doc.add_paragraph(style=style)
-            parse_inline_formatting(p, bullet_match.group(3))
-            has_content = True
-            idx += 1
-            continue
-
-        # --- Numbered list (with nesting support) ---
-        number_match = re.match(r'^(\s*)(\d+)[.)]\s+(.+)$', line)
-        if number_match:
-            indent = len(number_match.group(1))
-            if indent >= 4:
-                style = 'List Number 3'
-            elif indent >= 2:
-                style = 'List Number 2'
-            else:
-                style = 'List Number'
-            p = doc.add_paragraph(style=style)
-            parse_inline_formatting(p, number_match.group(3))
-            # Restart numbering at 1 if this is the first item of a new list
-            if not was_in_numbered_list:
-                _restart_list_numbering(doc, p)
-            prev_was_numbered_list = True
-            has_content = True
+        if re.match(r'^(\s*)([-*+])\s+(.+)$', line) or re.match(r'^(\s*)(\d+)[.)]\s+(.+)$', line):
+            kinds.append('ListItem')
             idx += 1
             continue
-
-        # --- Regular paragraph (merge consecutive non-special lines) ---
-        para_lines = [stripped]
         idx += 1
         while idx < len(lines):
             next_stripped = lines[idx].strip()
-            if not next_stripped or _is_special_line(next_stripped):
+            if not next_stripped or _legacy_is_special_line(next_stripped):
                 break
-            para_lines.append(next_stripped)
             idx += 1
+        kinds.append('Paragraph')
+    return kinds
 
-        merged_text = ' '.join(para_lines)
-        p = doc.add_paragraph()
-        parse_inline_formatting(p, merged_text)
-        has_content = True
 
-    # Save the document
-    doc.save(output_path)
-    print(f"Successfully converted: {input_path}")
-    print(f"Output saved to: {output_path}")
-    return output_path
+def _legacy_is_special_line(stripped):
+    """Original _is_special_line (uncompiled patterns), for the benchmark."""
+    if re.match(r'^(-{3,}|\*{3,}|_{3,})$', stripped):
+        return True
+    if re.match(r'^#{1,6}\s+', stripped):
+        return True
+    if stripped.startswith('|') and '|' in stripped[1:]:
+        return True
+    if re.match(r'^[-*+]\s+', stripped):
+        return True
+    if re.match(r'^\d+[.)]\s+', stripped):
+        return True
+    if stripped.startswith('```'):
+        return True
+    if stripped.startswith('>'):
+        return True
+    if re.match(r'^!\[([^\]]*)\]\(([^)]+)\)', stripped):
+        return True
+    return False
+
+
+def _synthetic_report_lines(n_sections):
+    """Build a long report mixing every block type (about 40 lines per section)."""
+    section = [
+        '## Section {n}',
+        '',
+        'This paragraph describes **section {n}** with *emphasis* and a [link](https://example.com).',
+        'It continues on a second line with `inline code` and more words to wrap.',
+        'A third line closes the paragraph.',
+        '',
+        '- First bullet with **bold** text',
+        '  - Nested bullet',
+        '- Second bullet',
+        '',
+        '1. First step',
+        '2. Second step',
+        '3. Third step',
+        '',
+        '| Metric | Value | Notes |',
+        '|:-------|------:|:-----:|',
+        '| Tons | 1,234 | Estimated |',
+        '| Value | $5.6M | From FAF |',
+        '| Share | 61.6% | SICT |',
+        '',
+        '> A quoted remark about',
+        '> section {n}.',
+        '',
+        '```python',
+        'def f(x):',
+        '    return x * 2',
+        '```',
+        '',
+        '### Detail {n}',
+        '',
+        'Closing paragraph for section {n}.',
+        'Second line of the closing paragraph.',
+        '',
+        '---',
+        '',
+    ]
+    lines = ['# Synthetic Report', '']
+    for n in range(n_sections):
+        lines.extend(line.format(n=n) for line in section)
+    return lines
+
+
+def run_table_benchmark(n_rows=5_000, n_cols=8):
+    """Time the bulk w:tbl builder on a large table."""
+    rows = [[f'**Column {c}**' for c in range(n_cols)]]
+    for r in range(n_rows):
+        rows.append([f'Row {r} value {c} with `code`' if c % 3 == 0 else f'{r * c:,}'
+                     for c in range(n_cols)])
+    block = TableBlock(rows, ['left', 'right', 'center'] * (n_cols // 3 + 1))
+
+    doc = Document()
+    start = time.perf_counter()
+    _add_table(doc, block)
+    elapsed = time.perf_counter() - start
+
+    n_cells = (n_rows + 1) * n_cols
+    print(f"\nTable: {n_rows:,} rows x {n_cols} columns")
+    print(f"{'Bulk (s)':>12}{'us/cell':>10}")
+    print(f"{elapsed:>12.2f}{elapsed / n_cells * 1e6:>10.2f}")
+
+
+def run_benchmark(sizes=(1_000, 10_000, 50_000)):
+    """Time the legacy block scan against tokenize_markdown on growing reports."""
+    print(f"{'Lines':>12}{'Legacy (s)':>14}{'Tokenizer (s)':>16}{'Speedup':>10}{'us/line':>10}")
+    for n_sections in sizes:
+        lines = _synthetic_report_lines(n_sections)
+
+        start = time.perf_counter()
+        legacy_kinds = _legacy_block_scan(lines)
+        legacy_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        blocks = tokenize_markdown(lines)
+        token_time = time.perf_counter() - start
+
+        if legacy_kinds != [type(block).__name__ for block in blocks]:
+            raise AssertionError("Tokenizer block sequence differs from the legacy scan.")
+
+        print(f"{len(lines):>12,}{legacy_time:>14.3f}{token_time:>16.3f}"
+              f"{legacy_time / token_time:>9.1f}x{token_time / len(lines) * 1e6:>10.2f}")
 
 
 def main():
     """Main entry point for command-line usage."""
+    args = list(sys.argv[1:])
+
+    if '--benchmark' in args:
+        run_benchmark()
+        run_table_benchmark()
+        return
+
+    incremental = '--incremental' in args
+    if incremental:
+        args.remove('--incremental')
+
     # Parse optional --author flag
     author = None
-    args = list(sys.argv[1:])
     if '--author' in args:
         ai = args.index('--author')
         if ai + 1 < len(args):
@@ -877,11 +1686,36 @@ def main():
             print("Error: --author requires a name argument.")
             sys.exit(1)
 
+    if '--batch' in args:
+        bi = args.index('--batch')
+        if bi + 1 >= len(args):
+            print("Error: --batch requires a directory argument.")
+            sys.exit(1)
+        batch_dir = args[bi + 1]
+        del args[bi:bi + 2]
+
+        workers = None
+        if '--workers' in args:
+            wi = args.index('--workers')
+            if wi + 1 >= len(args) or not args[wi + 1].isdigit():
+                print("Error: --workers requires a positive integer.")
+                sys.exit(1)
+            workers = int(args[wi + 1])
+            del args[wi:wi + 2]
+
+        if not os.path.isdir(batch_dir):
+            print(f"Error: Batch directory '{batch_dir}' not found.")
+            sys.exit(1)
+
+        failures = convert_batch(batch_dir, author=author, workers=workers,
+                                 force='--force' in args, incremental=incremental)
+        sys.exit(1 if failures else 0)
+
     if len(args) < 1:
         print(__doc__)
         print("\nError: Please provide an input markdown file.")
         print("Usage: python md_to_docx.py input.md [output.docx] "
-              "[--author \"Author Name\"]")
+              "[--author \"Author Name\"] [--incremental]")
         sys.exit(1)
 
     input_file = args[0]
@@ -892,7 +1726,8 @@ def main():
         sys.exit(1)
 
     try:
-        convert_markdown_to_docx(input_file, output_file, author=author)
+        convert_markdown_to_docx(input_file, output_file, author=author,
+                                 incremental=incremental)
     except Exception as e:
         print(f"Error during conversion: {e}")
         traceback.print_exc()
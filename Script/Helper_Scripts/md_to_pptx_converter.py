@@ -8,6 +8,12 @@ Usage:
     python md_to_pptx_converter.py input.md
     python md_to_pptx_converter.py input.md --template template.potx
     python md_to_pptx_converter.py input.md -o output.pptx
+    python md_to_pptx_converter.py --batch decks/ [--workers 4]
+    python md_to_pptx_converter.py input.md --check
+
+Templates are converted and analyzed once; the result is cached in
+.md_to_pptx_cache/ next to the template (keyed by its sha256).  Pass
+--no-template-cache to re-analyze.
 
 Requirements:
     pip install python-pptx
@@ -17,19 +23,26 @@ Author: Generated for HDOT presentations
 
 import argparse
 import copy
+import hashlib
+import io
+import json
 import logging
+import math
 import os
 import re
-import shutil
-import tempfile
+import struct
+import time
 import warnings
+import weakref
 import zipfile
-from dataclasses import dataclass, field
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
 from enum import Enum
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterable, Iterator, Tuple, Union
 
 from datetime import datetime
 
+import numpy as np
 from pptx import Presentation
 from pptx.util import Inches, Pt, Emu
 from pptx.enum.text import PP_ALIGN, MSO_ANCHOR, MSO_AUTO_SIZE
@@ -37,6 +50,9 @@ from pptx.oxml.ns import qn
 from pptx.enum.shapes import MSO_SHAPE, PP_PLACEHOLDER
 from pptx.dml.color import RGBColor
 
+from inline_format import InlineRun, lex_inline
+from table_metrics import table_metrics
+
 # Configure module-level logger
 logger = logging.getLogger(__name__)
 
@@ -122,8 +138,19 @@ CONFIG = {
         "body": {"name": "Calibri", "size": 18},
         "table_header": {"name": "Calibri", "size": 14, "bold": True},
         "table_body": {"name": "Calibri", "size": 14},
+        "code": {"name": "Consolas"},  # `inline code` runs (size follows the text)
     },
     
+    # Table font sizing: the largest size from the body size downward in
+    # steps of this many points whose estimated table height fits the slide
+    # (0.5 allows half-point sizes)
+    "table_font_step": 1,
+    
+    # Tables whose font would drop below this size are split across
+    # continuation slides with repeated headers and "(cont.)" titles
+    # (None keeps every table on one slide)
+    "table_min_font_size": 12,
+    
     # Slide dimensions (widescreen 16:9)
     "slide_width": 13.333,  # inches
     "slide_height": 7.5,    # inches
@@ -216,6 +243,7 @@ class TextRun:
     bold: bool = False
     italic: bool = False
     link: Optional[str] = None
+    code: bool = False
 
 
 @dataclass
@@ -225,6 +253,7 @@ class BulletItem:
     level: int = 0  # 0 = top level, 1 = nested, etc.
     is_ordered: bool = False  # True for numbered list items
     is_label: bool = False  # True = render as non-bulleted label/paragraph
+    line: int = 0  # 1-based markdown source line (0 = unknown)
 
 
 @dataclass
@@ -232,6 +261,12 @@ class TableData:
     """Represents a table"""
     headers: List[str]
     rows: List[List[str]]
+    line: int = 0  # 1-based markdown line of the header row (0 = unknown)
+    first_row: int = 0  # index of rows[0] in the markdown table (continuation pages)
+
+    def row_line(self, row_index: int) -> int:
+        """Source line of data row row_index (0-based), or 0 if unknown."""
+        return self.line + 2 + self.first_row + row_index if self.line else 0
 
 
 @dataclass
@@ -254,6 +289,7 @@ class SlideContent:
     subtitle: str = ""
     content_blocks: List[ContentBlock] = field(default_factory=list)
     has_image: bool = False  # For future image support
+    source_lines: Optional[Tuple[int, int]] = None  # (first, last) 1-based markdown lines
 
 
 @dataclass
@@ -273,30 +309,69 @@ class LayoutInfo:
 # ============================================
 
 class MarkdownToSlides:
-    """Parse markdown and extract slide structure"""
+    """Parse markdown and extract slide structure
+    
+    iter_slides() reads the source one line at a time (with one line of
+    lookahead) and yields each SlideContent as soon as it is complete, so a
+    file object can be converted without holding the whole document or
+    slide list in memory.  Slides, bullets and tables carry their markdown
+    line numbers for warnings (see source_ref).
+    """
     
-    def __init__(self, markdown_text: str):
-        self.markdown_text = markdown_text
+    def __init__(self, markdown: Union[str, Iterable[str]], source_name: str = "<markdown>"):
+        """
+        Args:
+            markdown: Markdown text, or an iterable of lines (e.g. an open file)
+            source_name: File name used when citing source lines
+        """
+        self.markdown = markdown
+        self.source_name = source_name
         self.slides: List[SlideContent] = []
         self.current_h1 = None
         self.current_h2 = None
         self.current_h3 = None
         self.current_slide_content = []
         self._in_html_block = False
-        
+        self._slide_first_line = None   # first line of the slide being collected
+        self._slide_last_line = None    # last line with content for that slide
+    
+    def source_ref(self, line: int) -> str:
+        """'file:line' for a source line number."""
+        return f"{self.source_name}:{line}"
+    
     def parse(self) -> List[SlideContent]:
         """Parse markdown and return list of slides"""
-        lines = self.markdown_text.split('\n')
-        i = 0
-        
-        while i < len(lines):
-            line = lines[i]
+        self.slides = list(self.iter_slides())
+        return self.slides
+    
+    def _numbered_lines(self) -> Iterator[Tuple[int, str]]:
+        """Yield (1-based line number, line without newline) from the source."""
+        if isinstance(self.markdown, str):
+            yield from enumerate(self.markdown.split('\n'), start=1)
+        else:
+            for number, line in enumerate(self.markdown, start=1):
+                yield number, line.rstrip('\n')
+    
+    def _add_content(self, item_type: str, item, first_line: int, last_line: int):
+        """Queue a bullet or table for the slide being collected."""
+        self.current_slide_content.append((item_type, item))
+        if self._slide_first_line is None:
+            self._slide_first_line = first_line
+        self._slide_last_line = last_line
+    
+    def iter_slides(self) -> Iterator[SlideContent]:
+        """Parse markdown, yielding each slide as soon as it is complete"""
+        lines = self._numbered_lines()
+        lookahead = next(lines, None)
+        
+        while lookahead is not None:
+            number, line = lookahead
+            lookahead = next(lines, None)
             
             # Handle multi-line HTML/CSS blocks (e.g., <style>...</style>)
             if self._in_html_block:
                 if '</style>' in line or '</script>' in line:
                     self._in_html_block = False
-                i += 1
                 continue
             
             # Detect start of multi-line HTML blocks
@@ -306,22 +381,21 @@ class MarkdownToSlides:
                 # Check if it closes on the same line
                 if '</style>' in line or '</script>' in line:
                     self._in_html_block = False
-                i += 1
                 continue
             
             # Skip standalone HTML comment lines (<!-- ... -->)
             if stripped_line.startswith('<!--') and stripped_line.endswith('-->'):
-                i += 1
                 continue
             
             # H1 - Title slide
             if line.startswith('# ') and not line.startswith('## '):
-                self._flush_current_slide()
+                yield from self._flush_current_slide()
                 title = line[2:].strip()
+                last_line = number
                 # Check if next line is subtitle (non-empty, non-heading, non-bullet)
                 subtitle = ""
-                if i + 1 < len(lines):
-                    next_line = lines[i + 1].strip()
+                if lookahead is not None:
+                    next_line = lookahead[1].strip()
                     if (next_line 
                             and not next_line.startswith('#')
                             and not next_line.startswith('- ')
@@ -329,64 +403,68 @@ class MarkdownToSlides:
                             and not re.match(r'^\d+\.\s', next_line)
                             and not next_line.startswith('|')):
                         subtitle = next_line
-                        i += 1
+                        last_line = lookahead[0]
+                        lookahead = next(lines, None)
                 
-                self.slides.append(SlideContent(
+                yield SlideContent(
                     slide_type=SlideType.TITLE,
                     title=title,
-                    subtitle=subtitle
-                ))
+                    subtitle=subtitle,
+                    source_lines=(number, last_line)
+                )
                 self.current_h1 = title
-                i += 1
                 continue
             
             # H2 - Section divider
             if line.startswith('## ') and not line.startswith('### '):
-                self._flush_current_slide()
+                yield from self._flush_current_slide()
                 title = line[3:].strip()
-                self.slides.append(SlideContent(
+                yield SlideContent(
                     slide_type=SlideType.SECTION,
-                    title=title
-                ))
+                    title=title,
+                    source_lines=(number, number)
+                )
                 self.current_h2 = title
                 self.current_h3 = None
-                i += 1
                 continue
             
             # H3 - Content slide
             if line.startswith('### '):
-                self._flush_current_slide()
+                yield from self._flush_current_slide()
                 self.current_h3 = line[4:].strip()
-                i += 1
+                if self._slide_first_line is None:
+                    self._slide_first_line = number
                 continue
             
             # Horizontal rule - slide break
             if stripped_line == '---':
-                self._flush_current_slide()
+                yield from self._flush_current_slide()
                 # Keep current H3 for continuation
-                i += 1
                 continue
             
             # Table detection
             if '|' in line and stripped_line.startswith('|'):
                 table_lines = [line]
-                i += 1
+                last_line = number
                 # Collect all table lines (must also start with |)
-                while i < len(lines) and '|' in lines[i] and lines[i].strip().startswith('|'):
-                    table_lines.append(lines[i])
-                    i += 1
+                while (lookahead is not None and '|' in lookahead[1]
+                       and lookahead[1].strip().startswith('|')):
+                    table_lines.append(lookahead[1])
+                    last_line = lookahead[0]
+                    lookahead = next(lines, None)
                 
                 table = self._parse_table(table_lines)
                 if table:
-                    self.current_slide_content.append(('table', table))
+                    table.line = number
+                    self._add_content('table', table, number, last_line)
                 continue
             
             # Bullet points (unordered)
             if stripped_line.startswith('- ') or stripped_line.startswith('* '):
                 bullet = self._parse_bullet(line)
                 if bullet:
-                    self.current_slide_content.append(('bullet', bullet))
-                i += 1
+                    bullet.line = number
+                    self._add_content('bullet', bullet, number, number)
                 continue
             
             # Numbered lists (ordered)
@@ -394,8 +472,8 @@ class MarkdownToSlides:
             if numbered_match:
                 bullet = self._parse_numbered_item(line, numbered_match)
                 if bullet:
-                    self.current_slide_content.append(('bullet', bullet))
-                i += 1
+                    bullet.line = number
+                    self._add_content('bullet', bullet, number, number)
                 continue
             
             # Plain text paragraph (non-empty, non-heading, non-bullet, non-table).
@@ -403,22 +481,18 @@ class MarkdownToSlides:
             # like "**Filtering Logic:**" written without a bullet marker.
             if stripped_line and self.current_h3:
                 text_runs = self._parse_inline_formatting(stripped_line)
-                self.current_slide_content.append(('bullet', BulletItem(
-                    text_runs=text_runs, level=0, is_label=True
-                )))
-                i += 1
+                self._add_content('bullet', BulletItem(
+                    text_runs=text_runs, level=0, is_label=True, line=number
+                ), number, number)
                 continue
             
             # Empty lines or other content
-            i += 1
         
         # Flush any remaining content
-        self._flush_current_slide()
-        
-        return self.slides
+        yield from self._flush_current_slide()
     
-    def _flush_current_slide(self):
-        """Create a slide from accumulated content.
+    def _flush_current_slide(self) -> Iterator[SlideContent]:
+        """Create a slide from accumulated content (yields it, if any).
         
         Groups consecutive bullets into a single ContentBlock and wraps each
         table in its own ContentBlock, preserving the original interleaved order.
@@ -453,10 +527,15 @@ class MarkdownToSlides:
             slide = SlideContent(
                 slide_type=SlideType.CONTENT,
                 title=self.current_h3,
-                content_blocks=content_blocks
+                content_blocks=content_blocks,
+                source_lines=(self._slide_first_line, self._slide_last_line)
             )
-            self.slides.append(slide)
             self.current_slide_content = []
+            self._slide_first_line = None
+            self._slide_last_line = None
+            yield slide
+        elif not self.current_slide_content:
+            self._slide_first_line = None
     
     def _parse_bullet(self, line: str) -> Optional[BulletItem]:
         """Parse a bullet point line.
@@ -509,39 +588,10 @@ class MarkdownToSlides:
         return BulletItem(text_runs=text_runs, level=min(level, 2), is_ordered=True)
     
     def _parse_inline_formatting(self, text: str) -> List[TextRun]:
-        """Parse bold, italic, and links in text"""
-        runs = []
-        current_pos = 0
-        
-        # Pattern for **bold**, *italic*, and [link](url)
-        pattern = r'(\*\*.*?\*\*|\*.*?\*|\[.*?\]\(.*?\))'
-        
-        for match in re.finditer(pattern, text):
-            # Add text before match
-            if match.start() > current_pos:
-                runs.append(TextRun(text=text[current_pos:match.start()]))
-            
-            matched_text = match.group(1)
-            
-            # Bold
-            if matched_text.startswith('**') and matched_text.endswith('**'):
-                runs.append(TextRun(text=matched_text[2:-2], bold=True))
-            # Italic
-            elif matched_text.startswith('*') and matched_text.endswith('*'):
-                runs.append(TextRun(text=matched_text[1:-1], italic=True))
-            # Link
-            elif matched_text.startswith('['):
-                link_match = re.match(r'\[(.*?)\]\((.*?)\)', matched_text)
-                if link_match:
-                    link_text, url = link_match.groups()
-                    runs.append(TextRun(text=link_text, link=url))
-            
-            current_pos = match.end()
-        
-        # Add remaining text
-        if current_pos < len(text):
-            runs.append(TextRun(text=text[current_pos:]))
-        
+        """Parse bold, italic, inline code and links in text (see inline_format)"""
+        runs = [TextRun(text=run.text, bold=run.bold, italic=run.italic,
+                        link=run.link, code=run.code)
+                for run in lex_inline(text)]
         return runs if runs else [TextRun(text=text)]
     
     def _parse_table(self, lines: List[str]) -> Optional[TableData]:
@@ -597,13 +647,87 @@ class LayoutManager:
         "two_column": ["two", "column", "side"],
     }
     
-    def __init__(self, presentation: 'Presentation'):
+    def __init__(self, presentation: 'Presentation', analysis: Optional[Dict[str, Any]] = None):
+        """
+        Args:
+            presentation: Presentation opened from the template
+            analysis: Result of to_analysis() for the same template (from the
+                      template cache); when given, the layouts are not re-analyzed
+        """
         self.prs = presentation
         self.layouts: List[LayoutInfo] = []
         self.layout_map: Dict[str, int] = {}
-        self._analyze_layouts()
-        self._build_layout_map()
-    
+        # (layout index, placeholder idx, placeholder type) -> see placeholder_info()
+        self.placeholders: Dict[tuple, Dict[str, Any]] = {}
+        self._layout_indices = {layout.part: idx for idx, layout in enumerate(presentation.slide_layouts)}
+
+        if analysis is None:
+            self._analyze_layouts()
+            self._build_layout_map()
+            self._analyze_placeholders()
+            self.theme_colors = _theme_colors(presentation)
+        else:
+            self._load_analysis(analysis)
+            _theme_color_memo[presentation.part] = self.theme_colors
+
+    def _analyze_placeholders(self):
+        """Extract formatting and geometry of every layout placeholder"""
+        for idx, layout in enumerate(self.prs.slide_layouts):
+            for layout_ph in layout.placeholders:
+                key = (idx, layout_ph.placeholder_format.idx, int(layout_ph.placeholder_format.type))
+                if key not in self.placeholders:
+                    self.placeholders[key] = _analyze_placeholder(layout_ph, layout, self.prs)
+
+    def _load_analysis(self, analysis: Dict[str, Any]):
+        """Restore the results of to_analysis()"""
+        self.layouts = [LayoutInfo(**info) for info in analysis["layouts"]]
+        self.layout_map = dict(analysis["layout_map"])
+        self.placeholders = {
+            tuple(entry[:3]): _decode_placeholder_info(entry[3])
+            for entry in analysis["placeholders"]
+        }
+        self.theme_colors = dict(analysis["theme_colors"])
+        logger.debug("Layout mapping (cached): %s", self.layout_map)
+
+    def to_analysis(self) -> Dict[str, Any]:
+        """
+        Export the template analysis as JSON-serializable data.
+
+        Returns:
+            Dict with the layouts, layout map, placeholder formatting/geometry
+            and theme color scheme; pass it back as LayoutManager(prs, analysis)
+        """
+        return {
+            "layouts": [asdict(info) for info in self.layouts],
+            "layout_map": self.layout_map,
+            "placeholders": [
+                [*key, _encode_placeholder_info(info)] for key, info in self.placeholders.items()
+            ],
+            "theme_colors": self.theme_colors,
+        }
+
+    def placeholder_info(self, slide_layout, shape) -> Dict[str, Any]:
+        """
+        Formatting and geometry of the layout placeholder matching a slide placeholder.
+
+        Args:
+            slide_layout: The layout the slide was created from
+            shape: The slide placeholder shape
+
+        Returns:
+            Dict with 'format' (see _extract_layout_formatting), 'body_format'
+            (see _extract_body_placeholder_format) and 'geometry'
+            ((left, top, width, height) or None).  Shared; do not modify.
+        """
+        layout_idx = self._layout_indices.get(slide_layout.part)
+        key = (layout_idx, shape.placeholder_format.idx, int(shape.placeholder_format.type))
+        info = self.placeholders.get(key)
+        if info is None:
+            info = _analyze_placeholder(shape, slide_layout, self.prs)
+            if layout_idx is not None:
+                self.placeholders[key] = info
+        return info
+
     def _analyze_layouts(self):
         """Analyze all layouts in the presentation template"""
         for idx, layout in enumerate(self.prs.slide_layouts):
@@ -788,6 +912,151 @@ class LayoutManager:
         return len(self.layout_map) > 1
 
 
+# ============================================
+# TEMPLATE CACHE
+# ============================================
+
+# Folder (next to the template) holding the clean template and its analysis
+TEMPLATE_CACHE_DIRNAME = '.md_to_pptx_cache'
+# Bump when the cached analysis format changes
+_TEMPLATE_CACHE_VERSION = 1
+
+# Template sha256 -> (clean .pptx bytes, analysis), for repeated builds in one process
+_prepared_templates: Dict[str, tuple] = {}
+
+# Format dict keys holding an RGBColor / a Length (serialized as hex / EMU)
+_COLOR_FORMAT_KEYS = ("color", "font_color")
+_LENGTH_FORMAT_KEYS = ("size", "font_size")
+
+
+def _encode_format(fmt: Dict[str, Any]) -> Dict[str, Any]:
+    """Make a placeholder format dict JSON-serializable."""
+    encoded = {}
+    for name, value in fmt.items():
+        if value is not None and name in _COLOR_FORMAT_KEYS:
+            value = str(value)
+        elif value is not None and name in _LENGTH_FORMAT_KEYS:
+            value = int(value)
+        encoded[name] = value
+    return encoded
+
+
+def _decode_format(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Inverse of _encode_format."""
+    fmt = {}
+    for name, value in data.items():
+        if value is not None and name in _COLOR_FORMAT_KEYS:
+            value = RGBColor.from_string(value)
+        elif value is not None and name in _LENGTH_FORMAT_KEYS:
+            value = Emu(value)
+        fmt[name] = value
+    return fmt
+
+
+def _encode_placeholder_info(info: Dict[str, Any]) -> Dict[str, Any]:
+    geometry = info["geometry"]
+    return {
+        "format": _encode_format(info["format"]),
+        "body_format": _encode_format(info["body_format"]),
+        "geometry": None if geometry is None else [int(v) for v in geometry],
+    }
+
+
+def _decode_placeholder_info(data: Dict[str, Any]) -> Dict[str, Any]:
+    geometry = data["geometry"]
+    return {
+        "format": _decode_format(data["format"]),
+        "body_format": _decode_format(data["body_format"]),
+        "geometry": None if geometry is None else tuple(Emu(v) for v in geometry),
+    }
+
+
+def _template_sha256(template_path: str) -> str:
+    """Hex sha256 of the template file contents."""
+    digest = hashlib.sha256()
+    with open(template_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _template_cache_stamp() -> Dict[str, Any]:
+    """Values that must match for a cached analysis to be reused."""
+    return {
+        "version": _TEMPLATE_CACHE_VERSION,
+        "converter_mtime": os.path.getmtime(__file__),
+    }
+
+
+def _read_template_cache(pptx_path: str, json_path: str) -> Optional[tuple]:
+    """Return (clean .pptx bytes, analysis) from the cache files, or None if stale/missing."""
+    try:
+        with open(json_path, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+        if cached.get("stamp") != _template_cache_stamp():
+            return None
+        with open(pptx_path, 'rb') as f:
+            data = f.read()
+    except (OSError, ValueError):
+        return None
+    return data, cached["analysis"]
+
+
+def _write_template_cache(pptx_path: str, json_path: str, data: bytes,
+                          analysis: Dict[str, Any]) -> None:
+    """Write the cache files (the .json last, so it only exists with its .pptx)."""
+    try:
+        os.makedirs(os.path.dirname(pptx_path), exist_ok=True)
+        with open(pptx_path, 'wb') as f:
+            f.write(data)
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump({"stamp": _template_cache_stamp(), "analysis": analysis}, f)
+    except OSError as e:
+        logger.warning("Could not write template cache %s: %s", json_path, e)
+
+
+def load_template(template_path: str, use_cache: bool = True) -> tuple:
+    """
+    Return a template as clean .pptx bytes (no slides) plus its layout analysis.
+
+    Results are cached per template content (sha256): in memory for the rest
+    of the process, and on disk in TEMPLATE_CACHE_DIRNAME next to the template,
+    so the .potx conversion, slide removal, layout analysis, placeholder
+    formatting extraction and theme color parsing run once per template.
+
+    Args:
+        template_path: Path to the .pptx or .potx template
+        use_cache: Read and write the cache (False always re-analyzes)
+
+    Returns:
+        tuple: (clean template bytes, analysis dict for LayoutManager)
+    """
+    key = _template_sha256(template_path)
+    if use_cache and key in _prepared_templates:
+        return _prepared_templates[key]
+
+    cache_dir = os.path.join(os.path.dirname(os.path.abspath(template_path)), TEMPLATE_CACHE_DIRNAME)
+    pptx_path = os.path.join(cache_dir, f"{key}.pptx")
+    json_path = os.path.join(cache_dir, f"{key}.json")
+
+    prepared = _read_template_cache(pptx_path, json_path) if use_cache else None
+    if prepared is not None:
+        logger.info("Using cached template analysis: %s", json_path)
+    else:
+        buffer = io.BytesIO()
+        _open_template(template_path).save(buffer)
+        data = buffer.getvalue()
+        logger.info("Analyzing template layouts...")
+        analysis = LayoutManager(Presentation(io.BytesIO(data))).to_analysis()
+        prepared = (data, analysis)
+        if use_cache:
+            _write_template_cache(pptx_path, json_path, data, analysis)
+
+    if use_cache:
+        _prepared_templates[key] = prepared
+    return prepared
+
+
 # ============================================
 # POWERPOINT GENERATOR
 # ============================================
@@ -809,44 +1078,66 @@ def _get_fallback_blank_layout(prs: Presentation):
         return prs.slide_layouts[len(prs.slide_layouts) - 1]
 
 
-def convert_potx_to_pptx(potx_path: str) -> str:
+_TEMPLATE_MAIN_CT = b'application/vnd.openxmlformats-officedocument.presentationml.template.main+xml'
+_PRESENTATION_MAIN_CT = b'application/vnd.openxmlformats-officedocument.presentationml.presentation.main+xml'
+
+# Zip local file header: fixed part, then file name and extra field
+_ZIP_LOCAL_HEADER = struct.Struct('<4s5H3L2H')
+_ZIP_COPY_CHUNK = 1 << 20
+
+
+def _copy_zip_member_raw(src, info: zipfile.ZipInfo, zip_out: zipfile.ZipFile) -> None:
+    """Append a member's compressed bytes to zip_out without recompressing it."""
+    src.seek(info.header_offset)
+    header = _ZIP_LOCAL_HEADER.unpack(src.read(_ZIP_LOCAL_HEADER.size))
+    name_len, extra_len = header[-2:]
+    src.seek(name_len + extra_len, os.SEEK_CUR)
+
+    out = zip_out.fp
+    copied = copy.copy(info)
+    copied.header_offset = out.tell()
+    # CRC and sizes are known, so they go in the local header rather than
+    # a trailing data descriptor
+    copied.flag_bits &= ~0x08
+    out.write(copied.FileHeader())
+
+    remaining = info.compress_size
+    while remaining:
+        chunk = src.read(min(remaining, _ZIP_COPY_CHUNK))
+        if not chunk:
+            raise zipfile.BadZipFile(f"Truncated member: {info.filename}")
+        out.write(chunk)
+        remaining -= len(chunk)
+
+    zip_out.filelist.append(copied)
+    zip_out.NameToInfo[copied.filename] = copied
+    zip_out.start_dir = out.tell()
+    zip_out._didModify = True
+
+
+def convert_potx_to_pptx(potx_path: str) -> io.BytesIO:
     """Convert .potx template to .pptx by modifying content types.
     
+    Only [Content_Types].xml is decompressed and rewritten; every other
+    member (slide masters, media, fonts) is copied as its already
+    compressed bytes, so large branded templates convert at copy speed.
+    
     Returns:
-        Path to a temporary .pptx file. Caller is responsible for cleanup.
+        In-memory .pptx that Presentation() can open directly.
     """
-    temp_pptx = tempfile.NamedTemporaryFile(suffix='.pptx', delete=False)
-    temp_pptx.close()
-    
-    # Copy the potx file
-    shutil.copy2(potx_path, temp_pptx.name)
-    
-    # Modify the [Content_Types].xml to change template to presentation
-    with zipfile.ZipFile(temp_pptx.name, 'r') as zip_read:
-        # Read all files
-        file_list = zip_read.namelist()
-        
-        # Create a new zip with modified content
-        temp_zip = tempfile.NamedTemporaryFile(suffix='.zip', delete=False)
-        temp_zip.close()
-        
-        with zipfile.ZipFile(temp_zip.name, 'w', zipfile.ZIP_DEFLATED) as zip_write:
-            for file_name in file_list:
-                file_data = zip_read.read(file_name)
-                
-                # Modify [Content_Types].xml
-                if file_name == '[Content_Types].xml':
-                    file_data = file_data.replace(
-                        b'application/vnd.openxmlformats-officedocument.presentationml.template.main+xml',
-                        b'application/vnd.openxmlformats-officedocument.presentationml.presentation.main+xml'
-                    )
-                
-                zip_write.writestr(file_name, file_data)
-    
-    # Replace the original temp file
-    shutil.move(temp_zip.name, temp_pptx.name)
+    buffer = io.BytesIO()
+    with open(potx_path, 'rb') as src, zipfile.ZipFile(src) as zip_read, \
+            zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as zip_write:
+        for info in zip_read.infolist():
+            # Modify [Content_Types].xml to change template to presentation
+            if info.filename == '[Content_Types].xml':
+                data = zip_read.read(info).replace(_TEMPLATE_MAIN_CT, _PRESENTATION_MAIN_CT)
+                zip_write.writestr(info.filename, data)
+            else:
+                _copy_zip_member_raw(src, info, zip_write)
     
-    return temp_pptx.name
+    buffer.seek(0)
+    return buffer
 
 
 def create_clean_template(source_template: str, output_path: str) -> str:
@@ -869,14 +1160,7 @@ def create_clean_template(source_template: str, output_path: str) -> str:
     prs = Presentation(source_template)
     
     # Delete all slides
-    num_slides = len(prs.slides)
-    if num_slides > 0:
-        logger.info("Removing %d slides from template...", num_slides)
-        for i in range(num_slides - 1, -1, -1):
-            try:
-                delete_slide(prs, i)
-            except Exception:
-                pass
+    clear_template_slides(prs)
     
     # Clear metadata and save as the clean template
     _clear_metadata(prs)
@@ -887,6 +1171,64 @@ def create_clean_template(source_template: str, output_path: str) -> str:
     return output_path
 
 
+# Slide reference inside a PowerPoint 2010 section (p14:sectionLst)
+_P14_SLD_ID = '{http://schemas.microsoft.com/office/powerpoint/2010/main}sldId'
+
+
+def remove_slides(prs: Presentation, indices: Optional[Iterable[int]] = None) -> int:
+    """
+    Remove several slides (all of them by default) in one pass.
+
+    Deleting slides one at a time rescans presentation.xml for every slide,
+    which is quadratic on templates with many sample slides. This drops the
+    selected sldId entries, their section and custom-show references and
+    their presentation relationships together. python-pptx only saves parts
+    still reachable through relationships, so once nothing points at a slide
+    its notes, images, charts and embedded workbooks are left out of the
+    saved file as well.
+
+    Args:
+        prs: Presentation object
+        indices: 0-based slide indices to remove (None removes every slide)
+
+    Returns:
+        Number of parts no longer reachable from the presentation
+    """
+    pres_part = prs.part
+    sld_id_lst = prs.slides._sldIdLst
+    sld_ids = list(sld_id_lst)
+    if indices is None:
+        doomed = sld_ids
+    else:
+        doomed = [sld_ids[i] for i in sorted(set(indices))]
+    if not doomed:
+        return 0
+
+    reachable_before = set(pres_part.package.iter_parts())
+
+    doomed_rids = {sld_id.rId for sld_id in doomed}
+    doomed_ids = {str(sld_id.id) for sld_id in doomed}
+    for sld_id in doomed:
+        sld_id_lst.remove(sld_id)
+
+    # Section lists (PowerPoint 2010+) and custom shows refer to the same slides
+    pres_el = pres_part._element
+    for ref in list(pres_el.iter(_P14_SLD_ID)):
+        if ref.get('id') in doomed_ids:
+            ref.getparent().remove(ref)
+    for ref in pres_el.xpath('./p:custShowLst/p:custShow/p:sldLst/p:sld'):
+        if ref.get(qn('r:id')) in doomed_rids:
+            ref.getparent().remove(ref)
+
+    # Count the remaining r:id references once instead of once per slide
+    still_referenced = set(pres_el.xpath('//@r:id'))
+    for rId in doomed_rids - still_referenced:
+        pres_part.rels.pop(rId)
+
+    reachable_after = set(pres_part.package.iter_parts())
+    return len(reachable_before - reachable_after)
+
+
 def delete_slide(prs: Presentation, slide_index: int):
     """
     Delete a slide from the presentation by index.
@@ -896,29 +1238,7 @@ def delete_slide(prs: Presentation, slide_index: int):
         prs: Presentation object
         slide_index: Index of slide to delete (0-based)
     """
-    # Get the slide's relationship ID
-    slide_id = prs.slides._sldIdLst[slide_index].rId
-    
-    # Get the slide part before dropping the relationship
-    slide_part = prs.part.related_part(slide_id)
-    
-    # Remove the slide ID from the presentation's slide list
-    del prs.slides._sldIdLst[slide_index]
-    
-    # Drop the relationship (this disconnects the slide)
-    prs.part.drop_rel(slide_id)
-    
-    # Try to remove the slide part from the package
-    try:
-        # Access the package and remove the part
-        package = prs.part.package
-        if hasattr(package, '_parts'):
-            # Remove from parts collection if it exists
-            parts_to_remove = [p for p in package._parts if p is slide_part]
-            for p in parts_to_remove:
-                package._parts.remove(p)
-    except Exception:
-        pass  # If we can't remove the part, it's okay - file will still work
+    remove_slides(prs, [slide_index])
 
 
 def clear_template_slides(prs: Presentation):
@@ -932,64 +1252,45 @@ def clear_template_slides(prs: Presentation):
         return
     
     logger.info("Clearing %d existing template slides...", num_slides)
-    
-    # Delete slides from the end to avoid index shifting issues
-    deleted_count = 0
-    for i in range(num_slides - 1, -1, -1):
-        try:
-            delete_slide(prs, i)
-            deleted_count += 1
-        except Exception as e:
-            logger.warning("    Could not delete slide %d: %s", i + 1, e)
-    
-    logger.info("Template slides cleared (%d slides removed).", deleted_count)
+    released = remove_slides(prs)
+    logger.info("Template slides cleared (%d slides removed, %d parts released).",
+                num_slides, released)
+
+
+def _open_template(template_path: str) -> Presentation:
+    """Open a .pptx or .potx template and remove its slides."""
+    # Check if it's a .potx file
+    if template_path.lower().endswith('.potx'):
+        logger.info("Note: .potx template detected. Converting to .pptx format...")
+        prs = Presentation(convert_potx_to_pptx(template_path))
+    else:
+        prs = Presentation(template_path)
 
+    # Clear any existing slides from the template
+    if len(prs.slides) > 0:
+        clear_template_slides(prs)
 
-def create_presentation(template_path: Optional[str] = None) -> tuple:
+    return prs
+
+
+def create_presentation(template_path: Optional[str] = None, use_cache: bool = True) -> tuple:
     """
     Initialize presentation with template or default settings.
-    
+
+    Args:
+        template_path: Path to a .pptx/.potx template (optional)
+        use_cache: Use the template cache (see load_template)
+
     Returns:
         tuple: (Presentation, LayoutManager or None)
     """
-    temp_file = None
     layout_manager = None
-    
+
     if template_path and os.path.exists(template_path):
-        # Check if it's a .potx file
-        if template_path.lower().endswith('.potx'):
-            logger.info("Note: .potx template detected. Converting to .pptx format...")
-            temp_file = convert_potx_to_pptx(template_path)
-            
-            try:
-                prs = Presentation(temp_file)
-                logger.info("Using template: %s", template_path)
-            except Exception:
-                # Clean up temp file on failure, then re-raise
-                if temp_file:
-                    try:
-                        os.unlink(temp_file)
-                    except OSError:
-                        pass
-                raise
-            finally:
-                # Clean up temp file after presentation is loaded into memory
-                if temp_file:
-                    try:
-                        os.unlink(temp_file)
-                    except OSError:
-                        pass
-        else:
-            prs = Presentation(template_path)
-            logger.info("Using template: %s", template_path)
-        
-        # Clear any existing slides from the template
-        if len(prs.slides) > 0:
-            clear_template_slides(prs)
-        
-        # Initialize layout manager for template analysis
-        logger.info("Analyzing template layouts...")
-        layout_manager = LayoutManager(prs)
+        data, analysis = load_template(template_path, use_cache)
+        prs = Presentation(io.BytesIO(data))
+        logger.info("Using template: %s", template_path)
+        layout_manager = LayoutManager(prs, analysis)
     else:
         prs = Presentation()
         prs.slide_width = Inches(CONFIG["slide_width"])
@@ -1069,7 +1370,35 @@ def _extract_layout_formatting(shape, slide_layout):
     return result
 
 
-def _set_placeholder_text(shape, text, slide_layout=None, font_cfg_key="slide_title"):
+def _layout_placeholder_geometry(shape, slide_layout) -> Optional[tuple]:
+    """Explicit (left, top, width, height) of the matching layout placeholder, or None."""
+    ph_idx = shape.placeholder_format.idx
+    ph_type = shape.placeholder_format.type
+    for layout_ph in slide_layout.placeholders:
+        if (layout_ph.placeholder_format.idx == ph_idx
+                or layout_ph.placeholder_format.type == ph_type):
+            if layout_ph.left is not None:
+                return (layout_ph.left, layout_ph.top, layout_ph.width, layout_ph.height)
+            break
+    return None
+
+
+def _analyze_placeholder(shape, slide_layout, prs: Optional[Presentation] = None) -> Dict[str, Any]:
+    """Collect everything the slide builders read from a layout placeholder.
+
+    Only shape's placeholder idx/type are used, so shape may be a slide
+    placeholder or the layout placeholder itself.  See
+    LayoutManager.placeholder_info for the returned keys.
+    """
+    return {
+        "format": _extract_layout_formatting(shape, slide_layout),
+        "body_format": _extract_body_placeholder_format(shape, slide_layout, prs),
+        "geometry": _layout_placeholder_geometry(shape, slide_layout),
+    }
+
+
+def _set_placeholder_text(shape, text, slide_layout=None, font_cfg_key="slide_title",
+                          layout_manager: Optional[LayoutManager] = None):
     """Set text in a template placeholder with proper formatting.
     
     Extracts the color (and optionally size/bold) from the matching layout
@@ -1085,35 +1414,33 @@ def _set_placeholder_text(shape, text, slide_layout=None, font_cfg_key="slide_ti
         slide_layout: The SlideLayout object for formatting extraction.
         font_cfg_key: Key into CONFIG["fonts"] for font name/size defaults
                       (e.g. "title", "section", "slide_title").
+        layout_manager: LayoutManager holding the (cached) placeholder analysis
+                        of slide_layout; without it the layout is read directly.
     """
     from lxml import etree
-    
+
     # Extract formatting from the layout placeholder
     fmt = {"color": None, "size": None, "bold": None}
     if slide_layout is not None:
-        fmt = _extract_layout_formatting(shape, slide_layout)
-        
+        if layout_manager is not None:
+            info = layout_manager.placeholder_info(slide_layout, shape)
+            fmt, geometry = info["format"], info["geometry"]
+        else:
+            fmt = _extract_layout_formatting(shape, slide_layout)
+            geometry = _layout_placeholder_geometry(shape, slide_layout)
+
         # Copy explicit position/size from the layout placeholder to the
         # slide shape.  Without this, the slide shape has empty <p:spPr/>
         # and relies on inheritance, which can fail for special placeholder
         # indices (e.g. CENTER_TITLE idx=4294967295).  Making the geometry
         # explicit ensures the shape has a proper bounding box, appears in
         # thumbnails, and renders at the correct position.
-        ph_idx = shape.placeholder_format.idx
-        ph_type = shape.placeholder_format.type
-        for layout_ph in slide_layout.placeholders:
-            if (layout_ph.placeholder_format.idx == ph_idx
-                    or layout_ph.placeholder_format.type == ph_type):
-                if layout_ph.left is not None:
-                    shape.left = layout_ph.left
-                    shape.top = layout_ph.top
-                    shape.width = layout_ph.width
-                    shape.height = layout_ph.height
-                    logger.debug("    -> Copied explicit position from layout: "
-                                 "left=%.2f\", top=%.2f\", w=%.2f\", h=%.2f\"",
-                                 layout_ph.left.inches, layout_ph.top.inches,
-                                 layout_ph.width.inches, layout_ph.height.inches)
-                break
+        if geometry is not None:
+            shape.left, shape.top, shape.width, shape.height = geometry
+            logger.debug("    -> Copied explicit position from layout: "
+                         "left=%.2f\", top=%.2f\", w=%.2f\", h=%.2f\"",
+                         geometry[0].inches, geometry[1].inches,
+                         geometry[2].inches, geometry[3].inches)
     
     # Set the text (creates a bare run)
     shape.text = text
@@ -1179,13 +1506,15 @@ def add_title_slide(prs: Presentation, title: str, subtitle: str = "",
             
             # TITLE or CENTER_TITLE
             if ph_type in [PH_TITLE, PH_CENTER_TITLE] and not title_set:
-                _set_placeholder_text(shape, title, slide_layout=slide_layout, font_cfg_key="title")
+                _set_placeholder_text(shape, title, slide_layout=slide_layout, font_cfg_key="title",
+                                      layout_manager=layout_manager)
                 title_set = True
                 logger.debug("    -> Title set in placeholder type %s", ph_type)
             
             # SUBTITLE
             elif ph_type == PH_SUBTITLE and subtitle and not subtitle_set:
-                _set_placeholder_text(shape, subtitle, slide_layout=slide_layout, font_cfg_key="body")
+                _set_placeholder_text(shape, subtitle, slide_layout=slide_layout, font_cfg_key="body",
+                                      layout_manager=layout_manager)
                 subtitle_set = True
                 logger.debug("    -> Subtitle set in placeholder type %s", ph_type)
         
@@ -1261,7 +1590,8 @@ def add_section_slide(prs: Presentation, title: str,
             ph_type = shape.placeholder_format.type
             # TITLE or CENTER_TITLE
             if ph_type in [PH_TITLE, PH_CENTER_TITLE] and not title_set:
-                _set_placeholder_text(shape, title, slide_layout=slide_layout, font_cfg_key="section")
+                _set_placeholder_text(shape, title, slide_layout=slide_layout, font_cfg_key="section",
+                                      layout_manager=layout_manager)
                 title_set = True
                 logger.debug("    -> Section title set in placeholder type %s", ph_type)
                 break
@@ -1364,6 +1694,8 @@ def _populate_placeholder_bullets(shape, bullets: List[BulletItem],
                 r.font.bold = True
             if run_data.italic:
                 r.font.italic = True
+            if run_data.code:
+                r.font.name = CONFIG["fonts"]["code"]["name"]
             if run_data.link:
                 r.hyperlink.address = run_data.link
         
@@ -1380,12 +1712,60 @@ def _populate_placeholder_bullets(shape, bullets: List[BulletItem],
     logger.debug("    -> Populated body placeholder with %d bullet items", len(bullets))
 
 
+# PresentationPart -> theme color scheme (see _theme_colors); seeded from the
+# template cache by LayoutManager
+_theme_color_memo = weakref.WeakKeyDictionary()
+
+
+def _theme_colors(prs: Presentation) -> Dict[str, str]:
+    """Return the presentation's theme color scheme as {name: 'RRGGBB'}.
+
+    The theme XML is stored in a separate part linked via the slide master's
+    relationships, NOT embedded in the master element itself.  Masters are
+    searched in order and the first theme defining a color wins.  The result
+    is memoized per presentation, so the theme is parsed once.
+    """
+    try:
+        return _theme_color_memo[prs.part]
+    except KeyError:
+        pass
+
+    from lxml import etree as _etree
+
+    colors: Dict[str, str] = {}
+    try:
+        for master in prs.slide_masters:
+            # Access the theme through the master's OPC relationships
+            for rel in master.part.rels.values():
+                if 'theme' in rel.reltype.lower():
+                    theme_elem = _etree.fromstring(rel.target_part.blob)
+                    clrScheme = theme_elem.find('.//' + qn('a:clrScheme'))
+                    if clrScheme is None:
+                        continue
+                    for color_elem in clrScheme:
+                        if not isinstance(color_elem.tag, str):
+                            continue  # XML comment
+                        name = _etree.QName(color_elem).localname
+                        if name in colors:
+                            continue
+                        srgb = color_elem.find(qn('a:srgbClr'))
+                        sys_clr = color_elem.find(qn('a:sysClr'))
+                        if srgb is not None and srgb.get('val'):
+                            colors[name] = str(RGBColor.from_string(srgb.get('val')))
+                        elif sys_clr is not None and sys_clr.get('lastClr'):
+                            colors[name] = str(RGBColor.from_string(sys_clr.get('lastClr')))
+    except Exception:
+        pass
+
+    _theme_color_memo[prs.part] = colors
+    return colors
+
+
 def _resolve_scheme_color(prs: Presentation, scheme_name: str) -> Optional[RGBColor]:
     """Resolve a PowerPoint scheme/theme color name to an RGB value.
     
-    Looks up the color in the presentation's theme clrScheme.  The theme XML
-    is stored in a separate part linked via the slide master's relationships,
-    NOT embedded in the master element itself.
+    Looks up the color in the presentation's theme clrScheme (see
+    _theme_colors).
     
     Common scheme names: dk1, dk2, lt1, lt2, accent1-6, hlink, folHlink,
     tx1, tx2, bg1, bg2.
@@ -1397,31 +1777,12 @@ def _resolve_scheme_color(prs: Presentation, scheme_name: str) -> Optional[RGBCo
     Returns:
         RGBColor or None if not resolvable.
     """
-    from lxml import etree as _etree
-    
     # Map tx/bg aliases to their dk/lt equivalents
     _aliases = {"tx1": "dk1", "tx2": "dk2", "bg1": "lt1", "bg2": "lt2"}
     scheme_name = _aliases.get(scheme_name, scheme_name)
     
-    try:
-        for master in prs.slide_masters:
-            # Access the theme through the master's OPC relationships
-            for rel in master.part.rels.values():
-                if 'theme' in rel.reltype.lower():
-                    theme_elem = _etree.fromstring(rel.target_part.blob)
-                    clrScheme = theme_elem.find('.//' + qn('a:clrScheme'))
-                    if clrScheme is not None:
-                        color_elem = clrScheme.find(qn(f'a:{scheme_name}'))
-                        if color_elem is not None:
-                            srgb = color_elem.find(qn('a:srgbClr'))
-                            if srgb is not None and srgb.get('val'):
-                                return RGBColor.from_string(srgb.get('val'))
-                            sys_clr = color_elem.find(qn('a:sysClr'))
-                            if sys_clr is not None and sys_clr.get('lastClr'):
-                                return RGBColor.from_string(sys_clr.get('lastClr'))
-    except Exception:
-        pass
-    return None
+    value = _theme_colors(prs).get(scheme_name)
+    return RGBColor.from_string(value) if value else None
 
 
 def _extract_color_from_solidFill(solidFill, prs: Optional[Presentation] = None) -> Optional[RGBColor]:
@@ -1558,21 +1919,31 @@ def _estimate_bullets_height(bullets: List[BulletItem]) -> float:
     Uses PowerPoint's actual ~1.2× line-spacing (not the generous 1.5× used
     in earlier versions) and 6pt inter-item spacing.
     """
+    estimated = 0.0
+    for bullet in bullets:
+        estimated += _estimate_bullet_height(bullet)
+
+    return max(0.3, estimated)
+
+
+def _estimate_bullet_height(bullet: BulletItem, space_after_pt: float = 6,
+                            space_before_pt: float = 0) -> float:
+    """Estimated height (inches) of one bullet, including paragraph spacing.
+
+    The defaults are the tight reservation spacing of _estimate_bullets_height;
+    check_slide_layout passes the spacing add_bullets_to_slide really applies.
+    """
     body_size_pt = CONFIG["fonts"]["body"]["size"]
     line_height = body_size_pt * 1.2 / 72   # ~1.2× line-spacing (matches PPT)
-    space_after = 6 / 72                     # 6pt inter-item gap, in inches
+    space_after = (space_after_pt + space_before_pt) / 72   # in inches
     text_box_width_inches = 12.333
     avg_char_width_inches = body_size_pt * 0.006  # empirical approximation
 
-    estimated = 0.0
-    for bullet in bullets:
-        total_chars = sum(len(run.text) for run in bullet.text_runs)
-        indent_reduction = bullet.level * 0.5
-        effective_chars = max(20, (text_box_width_inches - indent_reduction) / avg_char_width_inches)
-        num_lines = max(1, -(-total_chars // int(effective_chars)))  # ceiling division
-        estimated += (num_lines * line_height) + space_after
-
-    return max(0.3, estimated)
+    total_chars = sum(len(run.text) for run in bullet.text_runs)
+    indent_reduction = bullet.level * 0.5
+    effective_chars = max(20, (text_box_width_inches - indent_reduction) / avg_char_width_inches)
+    num_lines = max(1, -(-total_chars // int(effective_chars)))  # ceiling division
+    return (num_lines * line_height) + space_after
 
 
 def add_content_slide(prs: Presentation, slide_content: SlideContent,
@@ -1605,7 +1976,8 @@ def add_content_slide(prs: Presentation, slide_content: SlideContent,
             
             # Title placeholder (TITLE or CENTER_TITLE)
             if ph_type in [PH_TITLE, PH_CENTER_TITLE] and not title_set:
-                _set_placeholder_text(shape, slide_content.title, slide_layout=slide_layout, font_cfg_key="slide_title")
+                _set_placeholder_text(shape, slide_content.title, slide_layout=slide_layout, font_cfg_key="slide_title",
+                                      layout_manager=layout_manager)
                 title_set = True
                 logger.debug("    -> Title set in placeholder type %s", ph_type)
             
@@ -1626,9 +1998,9 @@ def add_content_slide(prs: Presentation, slide_content: SlideContent,
             # Extract template body formatting (needed by both paths)
             body_format = None
             if body_placeholder:
-                body_format = _extract_body_placeholder_format(
-                    body_placeholder, slide_layout, prs
-                )
+                body_format = layout_manager.placeholder_info(
+                    slide_layout, body_placeholder
+                )["body_format"]
             
             if not has_tables and all_bullets and body_placeholder:
                 # ── Bullets-only: populate body placeholder directly ──
@@ -1810,6 +2182,37 @@ def _add_bullet_formatting(paragraph, level: int, is_ordered: bool = False,
         buChar.set('char', char)
 
 
+def _estimate_bullet_box_height(bullets: List[BulletItem]) -> float:
+    """Height (inches) add_bullets_to_slide gives a bullet textbox.
+
+    Deliberately more generous than _estimate_bullets_height (1.5x line
+    spacing, 8pt gaps): the result also sets where the next content block
+    starts, so under-estimating would overlap the blocks.
+    """
+    body_size_pt = CONFIG["fonts"]["body"]["size"]
+    line_height = body_size_pt * 1.5 / 72  # single line height in inches
+    space_after = 8 / 72  # 8pt space after each bullet, in inches
+    
+    # Available text width for estimating wraps (textbox width minus indent margins)
+    text_box_width_inches = 12.333
+    # Approximate characters per line at this font size
+    # Open Sans at 18pt: ~0.11 inches per character average
+    avg_char_width_inches = body_size_pt * 0.006  # empirical approximation
+    
+    estimated_height = 0.0
+    for bullet in bullets:
+        # Total text length across all runs
+        total_chars = sum(len(run.text) for run in bullet.text_runs)
+        # Reduce available width for nested bullets (indented)
+        indent_reduction = bullet.level * 0.5  # ~0.5 inches per indent level
+        effective_chars_per_line = max(20, (text_box_width_inches - indent_reduction) / avg_char_width_inches)
+        # Estimate number of wrapped lines (minimum 1)
+        num_lines = max(1, -(-total_chars // int(effective_chars_per_line)))  # ceiling division
+        estimated_height += (num_lines * line_height) + space_after
+    
+    return max(0.5, estimated_height)
+
+
 def add_bullets_to_slide(slide, bullets: List[BulletItem],
                          top: Optional[float] = None,
                          max_height: Optional[float] = None,
@@ -1844,29 +2247,7 @@ def add_bullets_to_slide(slide, bullets: List[BulletItem],
         top_inches = 1.5
     
     # Estimate bullet block height, accounting for text wrapping
-    body_size_pt = CONFIG["fonts"]["body"]["size"]
-    line_height = body_size_pt * 1.5 / 72  # single line height in inches
-    space_after = 8 / 72  # 8pt space after each bullet, in inches
-    
-    # Available text width for estimating wraps (textbox width minus indent margins)
-    text_box_width_inches = 12.333
-    # Approximate characters per line at this font size
-    # Open Sans at 18pt: ~0.11 inches per character average
-    avg_char_width_inches = body_size_pt * 0.006  # empirical approximation
-    chars_per_line = text_box_width_inches / avg_char_width_inches
-    
-    estimated_height = 0.0
-    for bullet in bullets:
-        # Total text length across all runs
-        total_chars = sum(len(run.text) for run in bullet.text_runs)
-        # Reduce available width for nested bullets (indented)
-        indent_reduction = bullet.level * 0.5  # ~0.5 inches per indent level
-        effective_chars_per_line = max(20, (text_box_width_inches - indent_reduction) / avg_char_width_inches)
-        # Estimate number of wrapped lines (minimum 1)
-        num_lines = max(1, -(-total_chars // int(effective_chars_per_line)))  # ceiling division
-        estimated_height += (num_lines * line_height) + space_after
-    
-    estimated_height = max(0.5, estimated_height)
+    estimated_height = _estimate_bullet_box_height(bullets)
     
     # Apply max_height constraint
     if max_height is not None:
@@ -1913,6 +2294,8 @@ def add_bullets_to_slide(slide, bullets: List[BulletItem],
                 r.font.bold = True
             if run.italic:
                 r.font.italic = True
+            if run.code:
+                r.font.name = CONFIG["fonts"]["code"]["name"]
             if run.link:
                 r.hyperlink.address = run.link
         
@@ -1930,41 +2313,6 @@ def add_bullets_to_slide(slide, bullets: List[BulletItem],
     return top_inches + estimated_height
 
 
-def parse_cell_formatting(cell_text: str) -> List[tuple]:
-    """
-    Parse markdown formatting in table cell text.
-    Returns list of (text, is_bold, is_italic) tuples.
-    """
-    result = []
-    text = str(cell_text)
-    current_pos = 0
-    
-    # Pattern for **bold** and *italic*
-    pattern = r'(\*\*.*?\*\*|\*.*?\*)'
-    
-    for match in re.finditer(pattern, text):
-        # Add text before match
-        if match.start() > current_pos:
-            result.append((text[current_pos:match.start()], False, False))
-        
-        matched_text = match.group(1)
-        
-        # Bold
-        if matched_text.startswith('**') and matched_text.endswith('**'):
-            result.append((matched_text[2:-2], True, False))
-        # Italic
-        elif matched_text.startswith('*') and matched_text.endswith('*'):
-            result.append((matched_text[1:-1], False, True))
-        
-        current_pos = match.end()
-    
-    # Add remaining text
-    if current_pos < len(text):
-        result.append((text[current_pos:], False, False))
-    
-    return result if result else [(text, False, False)]
-
-
 def _set_cell_border(cell, side: str, width_pt: float, color: RGBColor):
     """Set a single border on a table cell via XML manipulation.
     
@@ -2056,33 +2404,134 @@ def _apply_modern_table_borders(pptx_table, num_rows: int, num_cols: int,
                 _set_cell_border(cell, 'B', 0.5, row_border_color)
 
 
-def set_cell_text_with_formatting(cell, text: str, font_size: int, font_name: str, font_color):
+def set_cell_text_with_formatting(cell, text: str, font_size: float, font_name: str, font_color):
     """
-    Set cell text with markdown formatting support (bold/italic).
+    Set cell text with markdown formatting support (bold, italic, code, links).
     """
-    parts = parse_cell_formatting(text)
+    parts = lex_inline(str(text)) or (InlineRun(str(text)),)
     
     tf = cell.text_frame
     p = tf.paragraphs[0]
     
-    for i, (part_text, is_bold, is_italic) in enumerate(parts):
+    for i, part in enumerate(parts):
         if i == 0:
-            p.text = part_text
-            if p.runs:
-                run = p.runs[0]
-                run.font.size = Pt(font_size)
-                run.font.name = font_name
-                run.font.color.rgb = font_color
-                run.font.bold = is_bold
-                run.font.italic = is_italic
+            p.text = part.text
+            if not p.runs:
+                continue
+            run = p.runs[0]
         else:
             run = p.add_run()
-            run.text = part_text
-            run.font.size = Pt(font_size)
-            run.font.name = font_name
-            run.font.color.rgb = font_color
-            run.font.bold = is_bold
-            run.font.italic = is_italic
+            run.text = part.text
+        run.font.size = Pt(font_size)
+        run.font.name = CONFIG["fonts"]["code"]["name"] if part.code else font_name
+        run.font.color.rgb = font_color
+        run.font.bold = part.bold
+        run.font.italic = part.italic
+        if part.link:
+            run.hyperlink.address = part.link
+
+
+# Short numeric cell for uniform-column detection: "12,345", "$99", "~5%", "3.14", "77%"
+_UNIFORM_NUMBER_RE = re.compile(
+    r'^[~$±]?[\d,]+\.?\d*\s*[%]?$'
+    r'|^\d+\s*[%]$'
+    r'|^[0-9]+$'
+)
+
+# Numeric cell for right-alignment
+_NUMERIC_CELL_RE = re.compile(r'^[~$]?[\d,]+\.?\d*\s*[%]?$|^\d+[%]$')
+
+
+# Average character width as a fraction of the font size, used when the table
+# font's real metrics are not installed (see font_metrics)
+_AVG_CHAR_EM = 0.52
+
+
+def _table_metrics(table: TableData):
+    """Per-cell metrics for a slide table (header row first), memoized."""
+    return table_metrics([table.headers] + table.rows, len(table.headers))
+
+
+def _cell_widths_emu(metrics, font_size, font_name: str) -> np.ndarray:
+    """Single-line width of every cell at font_size, in EMU (1 pt = 12700 EMU).
+
+    Uses the font's real advance widths when available, otherwise the
+    average character width.
+    """
+    ems = metrics.em_widths(font_name)
+    if ems is None:
+        return metrics.length * int(font_size * _AVG_CHAR_EM * 12700)
+    return (ems * (font_size * 12700)).astype(np.int64)
+
+
+# Smallest table font size; used when no larger candidate size fits
+_MIN_TABLE_FONT_SIZE = 9
+
+
+def _fit_table_font_size(metrics, col_widths_in: np.ndarray, available_height: float,
+                         vert_overhead: float, font_name: str,
+                         target_size, step=1) -> tuple:
+    """Find the largest table font size whose estimated height fits.
+
+    Candidate sizes are target_size, target_size - step, ... down to (but
+    not including) _MIN_TABLE_FONT_SIZE.  Estimated height only grows with
+    font size, so a binary search over the candidates picks the same size
+    as stepping down one size at a time.
+
+    Returns:
+        (font_size, estimated_height): _MIN_TABLE_FONT_SIZE when no
+        candidate fits, target_size when it is already at or below the
+        minimum
+    """
+    num_candidates = max(0, math.ceil((target_size - _MIN_TABLE_FONT_SIZE) / step))
+    if num_candidates == 0:
+        return target_size, 0.0
+
+    def height_at(k):
+        return _estimate_table_height(metrics, col_widths_in, target_size - step * k,
+                                      vert_overhead, font_name)
+
+    # Smallest k (largest size) that fits; lo..hi is the unresolved range
+    lo, hi = 0, num_candidates
+    heights = {}
+    while lo < hi:
+        mid = (lo + hi) // 2
+        heights[mid] = height_at(mid)
+        if heights[mid] <= available_height:
+            hi = mid
+        else:
+            lo = mid + 1
+
+    if lo == num_candidates:
+        last = num_candidates - 1
+        return _MIN_TABLE_FONT_SIZE, heights.get(last, height_at(last))
+    return target_size - step * lo, heights.get(lo, height_at(lo))
+
+
+def _estimate_table_height(metrics, col_widths_in: np.ndarray, font_size,
+                           vert_overhead: float, font_name: str) -> float:
+    """Estimated table height in inches at font_size (header + data rows)."""
+    return sum(_estimate_table_row_heights(metrics, col_widths_in, font_size,
+                                           vert_overhead, font_name))
+
+
+def _estimate_table_row_heights(metrics, col_widths_in: np.ndarray, font_size,
+                                vert_overhead: float, font_name: str) -> List[float]:
+    """Estimated height in inches of each table row (header first) at font_size.
+
+    Each row is as tall as its cell with the most wrapped lines; line
+    height is ~1.2x the font size for single-spaced text.
+    """
+    line_ht = font_size * 1.2 / 72      # single-line height (inches)
+    ems = metrics.em_widths(font_name)
+    if ems is None:
+        char_w = font_size * _AVG_CHAR_EM / 72       # approx char width (inches)
+        chars_per_line = np.maximum(1, (col_widths_in / char_w).astype(np.int64))
+        cell_lines = np.maximum(1, -(-metrics.length // chars_per_line))   # ceil division
+    else:
+        cell_lines = np.maximum(1, np.ceil(ems * (font_size / 72) / col_widths_in))
+    row_max_lines = cell_lines.max(axis=1)
+    return (row_max_lines * line_ht + vert_overhead).tolist()
 
 
 def _detect_uniform_columns(table: TableData) -> set:
@@ -2108,24 +2557,14 @@ def _detect_uniform_columns(table: TableData) -> set:
         # Need at least 1 label column + 2 data columns
         return set()
 
-    _num_re = re.compile(
-        r'^[~$±]?[\d,]+\.?\d*\s*[%]?$'   # "12,345", "$99", "~5%", "3.14"
-        r'|^\d+\s*[%]$'                    # "77%"
-        r'|^[0-9]+$'                        # plain integer
-    )
+    metrics = _table_metrics(table)
+    max_lens = metrics.column_max(metrics.length, body_only=True)
+    numeric_counts = metrics.matches(_UNIFORM_NUMBER_RE)[1:].sum(axis=0)
 
     candidates = []
     for col_idx in range(num_cols):
-        max_len = 0
-        numeric_count = 0
-        for row in table.rows:
-            if col_idx < len(row):
-                text = row[col_idx].replace('**', '').replace('*', '').strip()
-                max_len = max(max_len, len(text))
-                if _num_re.match(text):
-                    numeric_count += 1
-
-        is_numeric = len(table.rows) > 0 and numeric_count / len(table.rows) >= 0.6
+        max_len = int(max_lens[col_idx])
+        is_numeric = len(table.rows) > 0 and numeric_counts[col_idx] / len(table.rows) >= 0.6
         is_short = max_len <= 12
 
         if is_numeric and is_short:
@@ -2145,7 +2584,7 @@ def _detect_uniform_columns(table: TableData) -> set:
 
 
 def _calculate_column_widths(table: TableData, total_width_emu: int,
-                             header_font_size: int, body_font_size: int,
+                             header_font_size: float, body_font_size: float,
                              uniform_cols: Optional[set] = None) -> list:
     """Calculate smart column widths that minimise wrapping in short columns.
 
@@ -2177,21 +2616,16 @@ def _calculate_column_widths(table: TableData, total_width_emu: int,
     if num_cols == 0:
         return []
 
-    # Character width in EMU: ~52% of font em for proportional sans-serif
-    char_w_emu = int(body_font_size * 0.52 * 12700)  # 1 pt = 12700 EMU
+    # One average character (~52% of font em) in EMU: floor for natural widths
+    char_w_emu = int(body_font_size * _AVG_CHAR_EM * 12700)  # 1 pt = 12700 EMU
     cell_margins_emu = 274320  # ~0.30" combined L+R cell margins
 
     # ---- Step 1: natural (single-line) width per column ----
-    natural_widths = []
-    for col_idx in range(num_cols):
-        header_text = table.headers[col_idx].replace('**', '').replace('*', '')
-        max_len = len(header_text)
-        for row in table.rows:
-            if col_idx < len(row):
-                cell_text = row[col_idx].replace('**', '').replace('*', '')
-                max_len = max(max_len, len(cell_text))
-        natural_w = max(1, max_len) * char_w_emu + cell_margins_emu
-        natural_widths.append(natural_w)
+    metrics = _table_metrics(table)
+    body_font = CONFIG["fonts"]["table_body"]["name"]
+    header_font = CONFIG["fonts"]["table_header"]["name"]
+    max_widths = metrics.column_max(_cell_widths_emu(metrics, body_font_size, body_font))
+    natural_widths = (np.maximum(char_w_emu, max_widths) + cell_margins_emu).tolist()
 
     total_natural = sum(natural_widths)
 
@@ -2246,12 +2680,8 @@ def _calculate_column_widths(table: TableData, total_width_emu: int,
                     widths[i] = per_col
 
     # ---- Enforce header minimum widths ----
-    header_min_widths = []
-    header_char_w_emu = int(header_font_size * 0.52 * 12700)
-    for col_idx in range(num_cols):
-        header_text = table.headers[col_idx].replace('**', '').replace('*', '')
-        min_w = int(len(header_text) * header_char_w_emu + cell_margins_emu)
-        header_min_widths.append(min_w)
+    header_widths = _cell_widths_emu(metrics, header_font_size, header_font)[0]
+    header_min_widths = (header_widths + cell_margins_emu).tolist()
 
     for i in range(num_cols):
         deficit = header_min_widths[i] - widths[i]
@@ -2304,15 +2734,15 @@ def _calculate_column_widths(table: TableData, total_width_emu: int,
     return widths
 
 
-def _estimate_natural_table_width(table: TableData, header_font_size: int,
-                                   body_font_size: int,
+def _estimate_natural_table_width(table: TableData, header_font_size: float,
+                                   body_font_size: float,
                                    cell_margin_left_emu: int,
                                    cell_margin_right_emu: int) -> int:
     """Estimate the natural width a table needs based on its content.
 
     Calculates per-column width from the longest cell text (header or body),
-    using approximate character-width metrics for proportional sans-serif
-    fonts.  The sum of all columns gives the natural (unwrapped) table width
+    measured with the table fonts' real metrics when installed, otherwise
+    with an average character width for proportional sans-serif fonts.  The sum of all columns gives the natural (unwrapped) table width
     in EMU.
 
     Args:
@@ -2329,56 +2759,52 @@ def _estimate_natural_table_width(table: TableData, header_font_size: int,
     if num_cols == 0:
         return 0
 
-    # Approximate character width: ~52% of font size for proportional
-    # sans-serif fonts (Calibri, Arial).  1 pt = 12700 EMU.
-    header_char_width = int(header_font_size * 0.52 * 12700)
-    body_char_width = int(body_font_size * 0.52 * 12700)
-
     cell_h_margins = cell_margin_left_emu + cell_margin_right_emu
 
-    total_natural = 0
-    for col_idx in range(num_cols):
-        # Header text width (strip markdown bold/italic markers)
-        header_text = table.headers[col_idx].replace('**', '').replace('*', '')
-        header_width = len(header_text) * header_char_width
+    # Header and longest body cell widths per column (markdown markers stripped)
+    metrics = _table_metrics(table)
+    header_widths = _cell_widths_emu(
+        metrics, header_font_size, CONFIG["fonts"]["table_header"]["name"])[0]
+    body_widths = metrics.column_max(_cell_widths_emu(
+        metrics, body_font_size, CONFIG["fonts"]["table_body"]["name"]), body_only=True)
 
-        # Maximum body cell width in this column
-        max_body_width = 0
-        for row in table.rows:
-            if col_idx < len(row):
-                cell_text = row[col_idx].replace('**', '').replace('*', '')
-                cell_width = len(cell_text) * body_char_width
-                max_body_width = max(max_body_width, cell_width)
+    # Natural column width = max(header, body) + cell margins
+    return int((np.maximum(header_widths, body_widths) + cell_h_margins).sum())
 
-        # Natural column width = max(header, body) + cell margins
-        col_natural = max(header_width, max_body_width) + cell_h_margins
-        total_natural += col_natural
 
-    return total_natural
+def _content_bottom_margin(use_template_position: bool) -> float:
+    """Inches kept free below slide content (footer/accent elements, page number)."""
+    return 0.9 if use_template_position else 0.4
 
 
-def add_table_to_slide(slide, prs: Presentation, table: TableData,
-                       top: Optional[float] = None,
-                       use_template_position: bool = False,
-                       bottom_reserve: float = 0.0,
-                       body_format: Optional[Dict[str, Any]] = None) -> float:
+@dataclass
+class TablePlan:
+    """Size and font decisions for one slide table (see _plan_table)"""
+    left_margin: Emu
+    table_width: Emu                 # widest allowed table (before shrink-to-fit)
+    top_inches: float
+    available_height: float          # inches the table may use
+    actual_table_height: float       # inches given to the table shape
+    cell_margins: tuple              # (top, bottom, left, right) Lengths
+    metrics: Any                     # table_metrics.TableMetrics
+    col_widths_est: np.ndarray       # column widths (inches) used for the estimates
+    vert_overhead: float             # per-row padding (inches)
+    font_size: float                 # header and body font size
+    est_total_height: float          # estimated content height at font_size
+
+
+def _plan_table(table: TableData, slide_width_inches: float, slide_height_inches: float,
+                top_inches: float, use_template_position: bool = False,
+                bottom_reserve: float = 0.0) -> TablePlan:
     """
-    Add a table to a slide with proper sizing and formatting.
-    
-    Args:
-        slide: The slide to add the table to
-        prs: Presentation object for dimensions
-        table: TableData object with headers and rows
-        top: Top position in inches (overrides use_template_position if set)
-        use_template_position: If True, position content lower to avoid template title area
-        bottom_reserve: Extra inches to reserve below the table for subsequent
-                        content blocks (e.g. bullet points after the table).
-        body_format: Optional dict with 'font_color' extracted from the template
-                     body placeholder, used to keep table text color consistent
-                     with bullet text color.
-    
+    Work out a table's area, row height, cell margins and font size.
+
+    Pure estimation (no shapes are created), shared by add_table_to_slide and
+    check_markdown_layout.  See add_table_to_slide for the arguments.
+
     Returns:
-        Bottom Y position in inches after the table
+        TablePlan; est_total_height above available_height means the rows
+        will grow past the table's area even at the smallest font size
     """
     num_cols = len(table.headers)
     num_rows = len(table.rows) + 1
@@ -2388,23 +2814,12 @@ def add_table_to_slide(slide, prs: Presentation, table: TableData,
     right_margin = Inches(0.8)  # Extra space for page number
     
     # Template slides need more bottom margin to clear footer/accent elements
-    bottom_margin = Inches(0.9) if use_template_position else Inches(0.4)
+    bottom_margin = Inches(_content_bottom_margin(use_template_position))
     
     # Available width (slide width minus margins)
-    slide_width_inches = prs.slide_width.inches
     table_width = Inches(slide_width_inches - left_margin.inches - right_margin.inches)
     
-    # Adjust position based on parameters
-    if top is not None:
-        top_inches = top
-    elif use_template_position:
-        top_inches = 1.5
-    else:
-        top_inches = 1.4
-    top_position = Inches(top_inches)
-    
     # Available height (slide height minus top position, bottom margin, and reserved space)
-    slide_height_inches = prs.slide_height.inches
     total_below_top = max(0.5, slide_height_inches - top_inches - bottom_margin.inches)
     
     # Smart bottom_reserve cap: ensure the table gets at least a minimum
@@ -2441,7 +2856,6 @@ def add_table_to_slide(slide, prs: Presentation, table: TableData,
     
     # Clamp table height to available space
     actual_table_height = min(available_height, row_height * num_rows)
-    table_height = Inches(actual_table_height)
     
     # ---- Font sizes & cell margins (computed before table creation so we ----
     # ---- can estimate natural table width from content)                  ----
@@ -2457,57 +2871,86 @@ def add_table_to_slide(slide, prs: Presentation, table: TableData,
     cell_margin_right = Inches(0.06) if is_large_table else Inches(0.10)
     
     # --- Intelligent font sizing: start at body size, reduce only if needed ---
-    # Estimate proportional column widths from max content length per column
+    # Estimate proportional column widths from the widest content per column
+    # (real font widths when installed, otherwise character counts)
     table_width_inches = int(table_width) / 914400
-    col_max_chars = []
-    for col_idx in range(num_cols):
-        max_len = len(table.headers[col_idx].replace('**', '').replace('*', ''))
-        for row in table.rows:
-            if col_idx < len(row):
-                cell_text = row[col_idx].replace('**', '').replace('*', '')
-                max_len = max(max_len, len(cell_text))
-        col_max_chars.append(max(1, max_len))
-    total_chars = sum(col_max_chars)
+    metrics = _table_metrics(table)
+    body_font = CONFIG["fonts"]["table_body"]["name"]
+    cell_ems = metrics.em_widths(body_font)
+    if cell_ems is None:
+        col_content = np.maximum(1, metrics.column_max(metrics.length))
+    else:
+        col_content = np.maximum(_AVG_CHAR_EM, metrics.column_max(cell_ems))
+    total_content = col_content.sum()
     h_margin_per_col = cell_margin_left.inches + cell_margin_right.inches
     usable_width = max(1.0, table_width_inches - num_cols * h_margin_per_col)
-    col_widths_est = [max(0.5, (c / total_chars) * usable_width) for c in col_max_chars]
+    col_widths_est = np.maximum(0.5, (col_content / total_content) * usable_width)
     
     # Vertical overhead per row (cell margins + breathing room)
     vert_overhead = cell_margin_top.inches + cell_margin_bottom.inches + 0.03
     
-    # Step down from target font size until estimated table height fits
-    # in the available vertical space.  Line height ≈ 1.2× font size for
-    # single-spaced Calibri; char width ≈ 0.52× font size.
-    table_font_size = target_font_size
-    est_total_height = 0.0
-    while table_font_size > 9:
-        line_ht = table_font_size * 1.2 / 72      # single-line height (inches)
-        char_w = table_font_size * 0.52 / 72       # approx char width (inches)
-        
-        # Estimate total table height at this font size (header + data rows)
-        est_total_height = 0.0
-        for row_idx in range(-1, len(table.rows)):   # -1 = header row
-            cells = table.headers if row_idx == -1 else table.rows[row_idx]
-            row_max_lines = 1
-            for col_idx in range(min(num_cols, len(cells))):
-                cell_text = cells[col_idx].replace('**', '').replace('*', '')
-                if not cell_text:
-                    continue
-                col_w = col_widths_est[col_idx] if col_idx < len(col_widths_est) else 2.0
-                cpl = max(1, int(col_w / char_w))            # chars per line
-                lines = max(1, -(-len(cell_text) // cpl))    # ceil division
-                row_max_lines = max(row_max_lines, lines)
-            est_total_height += row_max_lines * line_ht + vert_overhead
-        
-        if est_total_height <= available_height:
-            break
-        table_font_size -= 1
+    # Largest font size (from the target downward) whose estimated table
+    # height fits in the available vertical space
+    table_font_size, est_total_height = _fit_table_font_size(
+        metrics, col_widths_est, available_height, vert_overhead, body_font,
+        target_font_size, step=CONFIG.get("table_font_step", 1))
     
-    header_font_size = table_font_size
-    body_font_size = table_font_size
-    logger.debug("    Font scaling: target=%dpt -> table=%dpt (est_h=%.2f\", avail=%.2f\")",
+    logger.debug("    Font scaling: target=%gpt -> table=%gpt (est_h=%.2f\", avail=%.2f\")",
                  target_font_size, table_font_size, est_total_height, available_height)
     
+    return TablePlan(
+        left_margin=left_margin, table_width=table_width,
+        top_inches=top_inches, available_height=available_height,
+        actual_table_height=actual_table_height,
+        cell_margins=(cell_margin_top, cell_margin_bottom, cell_margin_left, cell_margin_right),
+        metrics=metrics, col_widths_est=col_widths_est, vert_overhead=vert_overhead,
+        font_size=table_font_size, est_total_height=est_total_height)
+
+
+def add_table_to_slide(slide, prs: Presentation, table: TableData,
+                       top: Optional[float] = None,
+                       use_template_position: bool = False,
+                       bottom_reserve: float = 0.0,
+                       body_format: Optional[Dict[str, Any]] = None) -> float:
+    """
+    Add a table to a slide with proper sizing and formatting.
+    
+    Args:
+        slide: The slide to add the table to
+        prs: Presentation object for dimensions
+        table: TableData object with headers and rows
+        top: Top position in inches (overrides use_template_position if set)
+        use_template_position: If True, position content lower to avoid template title area
+        bottom_reserve: Extra inches to reserve below the table for subsequent
+                        content blocks (e.g. bullet points after the table).
+        body_format: Optional dict with 'font_color' extracted from the template
+                     body placeholder, used to keep table text color consistent
+                     with bullet text color.
+    
+    Returns:
+        Bottom Y position in inches after the table
+    """
+    # Adjust position based on parameters
+    if top is not None:
+        top_inches = top
+    elif use_template_position:
+        top_inches = 1.5
+    else:
+        top_inches = 1.4
+    top_position = Inches(top_inches)
+    
+    plan = _plan_table(table, prs.slide_width.inches, prs.slide_height.inches,
+                       top_inches, use_template_position, bottom_reserve)
+    num_cols = len(table.headers)
+    num_rows = len(table.rows) + 1
+    left_margin, table_width = plan.left_margin, plan.table_width
+    actual_table_height = plan.actual_table_height
+    table_height = Inches(actual_table_height)
+    cell_margin_top, cell_margin_bottom, cell_margin_left, cell_margin_right = plan.cell_margins
+    metrics = plan.metrics
+    header_font_size = plan.font_size
+    body_font_size = plan.font_size
+    
     # ---- Content-aware table width: shrink to fit content, center ----
     available_width_emu = int(table_width)
     natural_width_emu = _estimate_natural_table_width(
@@ -2557,17 +3000,11 @@ def add_table_to_slide(slide, prs: Presentation, table: TableData,
     # Detect numeric columns for right-alignment.
     # A column is "numeric" if the majority of its data cells look like numbers
     # (digits, commas, periods, %, $, ~, +/-, or short words like "Yes"/"No").
-    _numeric_pattern = re.compile(r'^[~$]?[\d,]+\.?\d*\s*[%]?$|^\d+[%]$')
+    numeric_counts = metrics.matches(_NUMERIC_CELL_RE)[1:].sum(axis=0)
     numeric_cols = set()
-    for col_idx in range(num_cols):
-        numeric_count = 0
-        for row in table.rows:
-            if col_idx < len(row):
-                cell_text = row[col_idx].replace('**', '').replace('*', '').strip()
-                if _numeric_pattern.match(cell_text):
-                    numeric_count += 1
-        if len(table.rows) > 0 and numeric_count / len(table.rows) >= 0.6:
-            numeric_cols.add(col_idx)
+    if len(table.rows) > 0:
+        numeric_cols = {col_idx for col_idx in range(num_cols)
+                        if numeric_counts[col_idx] / len(table.rows) >= 0.6}
     
     # Header row
     for i, header in enumerate(table.headers):
@@ -2688,6 +3125,435 @@ def add_table_to_slide(slide, prs: Presentation, table: TableData,
     return top_inches + actual_table_height
 
 
+# ============================================
+# LAYOUT CHECK
+# ============================================
+
+# Overflows up to this many inches are rounding and not reported
+_CHECK_TOLERANCE = 0.01
+
+
+@dataclass
+class SlideOverflow:
+    """A content slide whose estimated content is taller than its content area"""
+    slide_number: int
+    title: str
+    needed: float      # inches of content below the top of the content area
+    available: float   # inches between the top of the content area and the footer margin
+    split_points: List[Tuple[int, str]] = field(default_factory=list)  # (source line, item)
+    source_line: int = 0   # first markdown line of the slide
+
+    @property
+    def overflow(self) -> float:
+        return self.needed - self.available
+
+
+def _excerpt(text: str, limit: int = 40) -> str:
+    """Short quoted excerpt of item text for the check report."""
+    text = " ".join(text.split())
+    return f'"{text[:limit - 3]}..."' if len(text) > limit else f'"{text}"'
+
+
+def _content_area(slide_content: SlideContent, slide_height_inches: float,
+                  layout_manager: Optional[LayoutManager]) -> tuple:
+    """
+    Where add_content_slide puts a slide's content, without building the slide.
+
+    Returns:
+        (top, bottom, use_template_position, in_placeholder) in inches;
+        in_placeholder is True for bullets-only slides that fill the
+        layout's body placeholder
+    """
+    if layout_manager:
+        slide_layout = layout_manager.get_layout_for_slide(slide_content)
+        ph_types = [shape.placeholder_format.type for shape in slide_layout.placeholders]
+        if PH_TITLE in ph_types or PH_CENTER_TITLE in ph_types:
+            body = next((shape for shape in slide_layout.placeholders
+                         if shape.placeholder_format.type in (PH_BODY, PH_OBJECT)), None)
+            bullets_only = all(block.block_type == "bullets"
+                               for block in slide_content.content_blocks)
+            if bullets_only and body is not None and body.top is not None:
+                return (body.top.inches, Emu(body.top + body.height).inches, True, True)
+            return (1.5, slide_height_inches - _content_bottom_margin(True), True, False)
+    return (1.4, slide_height_inches - _content_bottom_margin(False), False, False)
+
+
+def check_slide_layout(slide_content: SlideContent, slide_number: int,
+                       slide_width_inches: float, slide_height_inches: float,
+                       layout_manager: Optional[LayoutManager] = None) -> Optional[SlideOverflow]:
+    """
+    Estimate a content slide's height the way add_content_slide lays it out.
+
+    Blocks are stacked exactly as the renderer places them (bullet boxes at
+    their _estimate_bullet_box_height, tables at their planned height, 0.15"
+    gaps).  The content height counts bullets with _estimate_bullet_height at
+    the paragraph spacing add_bullets_to_slide applies (8pt after, 12pt
+    before labels), since the tighter reservation estimate would hide
+    overflows, and tables at the larger of their shape height and their
+    estimated rows.
+
+    Split points come from the same stacking: each bullet and table row
+    keeps the position it gets above, and a split is suggested before the
+    first item that ends below the content area, which then starts the next
+    slide (after the repeated header for a table row).  An overflowing slide
+    always gets at least one split point when it has more than one item.
+
+    Returns:
+        SlideOverflow, or None when the content fits
+    """
+    top, bottom, use_template_position, _ = _content_area(
+        slide_content, slide_height_inches, layout_manager)
+    available = bottom - top
+    gap = 0.15
+
+    # (line, label, start, end, header_height) per bullet / table row, in the
+    # stacked positions that also give content_bottom
+    items = []
+    content_bottom = top
+    current_top = top
+    block_estimated_heights = [
+        _estimate_bullets_height(block.bullets)
+        if block.block_type == "bullets" and block.bullets else 0.0
+        for block in slide_content.content_blocks
+    ]
+    for idx, block in enumerate(slide_content.content_blocks):
+        if block.block_type == "bullets" and block.bullets:
+            y = current_top
+            for i, bullet in enumerate(block.bullets):
+                text = "".join(run.text for run in bullet.text_runs)
+                height = _estimate_bullet_height(
+                    bullet, 8, 12 if bullet.is_label and i > 0 else 0)
+                items.append((bullet.line, f"bullet {_excerpt(text)}", y, y + height, 0.0))
+                y += height
+            content_bottom = max(content_bottom, y)
+            current_top += _estimate_bullet_box_height(block.bullets) + gap
+        elif block.block_type == "table" and block.table:
+            remaining_height = sum(
+                block_estimated_heights[j] + gap
+                for j in range(idx + 1, len(slide_content.content_blocks))
+                if block_estimated_heights[j] > 0
+            )
+            plan = _plan_table(block.table, slide_width_inches, slide_height_inches,
+                               current_top, use_template_position, remaining_height)
+            row_heights = _estimate_table_row_heights(
+                plan.metrics, plan.col_widths_est, plan.font_size, plan.vert_overhead,
+                CONFIG["fonts"]["table_body"]["name"])
+            table_height = max(plan.actual_table_height, plan.est_total_height)
+            # Spread the rows over the table's height so its last row ends where
+            # the table does
+            scale = table_height / sum(row_heights) if sum(row_heights) > 0 else 1.0
+            header_height = row_heights[0] * scale
+            y = current_top + header_height
+            items.append((block.table.line, "table", current_top, y, 0.0))
+            for r, (row, height) in enumerate(zip(block.table.rows, row_heights[1:])):
+                first_cell = row[0] if row else ""
+                items.append((block.table.row_line(r),
+                              f"table row {block.table.first_row + r + 1} "
+                              f"{_excerpt(first_cell.replace('*', ''))}",
+                              y, y + height * scale, header_height))
+                y += height * scale
+            content_bottom = max(content_bottom, current_top + table_height)
+            current_top += plan.actual_table_height + gap
+
+    needed = content_bottom - top
+    if needed - available <= _CHECK_TOLERANCE:
+        return None
+
+    split_points = []
+    slide_top = top
+    for k, (line, label, start, end, header_height) in enumerate(items):
+        if k > 0 and start > slide_top and end - slide_top > available + _CHECK_TOLERANCE:
+            split_points.append((line, label))
+            slide_top = start - header_height
+    if not split_points and len(items) > 1:
+        # Only the first item runs past the area; everything after it moves
+        split_points.append(items[1][:2])
+
+    source_line = slide_content.source_lines[0] if slide_content.source_lines else 0
+    return SlideOverflow(slide_number, slide_content.title, needed, available,
+                         split_points, source_line)
+
+
+def check_markdown_layout(markdown_path: str, template_path: Optional[str] = None,
+                          use_template_cache: bool = True) -> List[SlideOverflow]:
+    """
+    Report slides whose content would overflow, without building the deck.
+
+    Parses the markdown and runs the renderer's height estimates only (no
+    shapes, no file), so it is fast enough to run on every save.
+
+    Args:
+        markdown_path: Path to input markdown file
+        template_path: Path to PowerPoint template file (optional); decides
+                       the slide size and which slides use template layouts
+        use_template_cache: Reuse the cached template analysis (see load_template)
+
+    Returns:
+        SlideOverflow per overflowing content slide, in slide order
+    """
+    if template_path and os.path.exists(template_path):
+        prs, layout_manager = create_presentation(template_path, use_template_cache)
+        slide_width, slide_height = prs.slide_width.inches, prs.slide_height.inches
+    else:
+        layout_manager = None
+        slide_width, slide_height = CONFIG["slide_width"], CONFIG["slide_height"]
+
+    overflows = []
+    with open(markdown_path, 'r', encoding='utf-8') as f:
+        parser = MarkdownToSlides(f, markdown_path)
+        slides = paginate_slides(parser.iter_slides(), slide_width, slide_height,
+                                 layout_manager)
+        for number, slide_content in enumerate(slides, start=1):
+            if slide_content.slide_type != SlideType.CONTENT:
+                continue
+            overflow = check_slide_layout(slide_content, number, slide_width, slide_height,
+                                          layout_manager)
+            if overflow is not None:
+                overflows.append(overflow)
+    return overflows
+
+
+def report_layout_check(overflows: List[SlideOverflow], source_name: str = "<markdown>") -> None:
+    """Log the result of check_markdown_layout, citing source lines as file:line."""
+    for item in overflows:
+        logger.warning("%s:%d: slide %d '%s': content needs %.2f\" of %.2f\" (over by %.2f\")",
+                       source_name, item.source_line, item.slide_number, item.title,
+                       item.needed, item.available, item.overflow)
+        for line, label in item.split_points:
+            logger.warning("%s:%d:     split before %s", source_name, line, label)
+    if not overflows:
+        logger.info("No slide overflow found")
+
+
+# ============================================
+# TABLE PAGINATION
+# ============================================
+
+CONTINUED_SUFFIX = " (cont.)"
+
+
+def _table_fits(plan: TablePlan, min_font_size: float) -> bool:
+    """True when a planned table keeps min_font_size and fits its area."""
+    return plan.font_size >= min_font_size and plan.est_total_height <= plan.available_height
+
+
+def _table_slice(table: TableData, start: int, stop: int) -> TableData:
+    """Data rows start:stop of a table, under the same headers."""
+    return TableData(table.headers, table.rows[start:stop], table.line,
+                     table.first_row + start)
+
+
+def _split_table_rows(table: TableData, slide_width_inches: float,
+                      slide_height_inches: float, first_top: float, area_top: float,
+                      use_template_position: bool, min_font_size: float) -> List[Tuple[int, int]]:
+    """
+    Choose the data rows of each page of a table that is too tall for one slide.
+
+    Row heights are estimated once for the whole table at min_font_size and
+    pages are cut with searchsorted on their running total.  Every page is
+    re-planned with _plan_table and gives up rows until it keeps
+    min_font_size.  Filling each page gives the page count; the rows are
+    then spread evenly over that many pages, so the last page is not left
+    with a row or two (kept only when it needs no extra page).
+
+    Args:
+        first_top: Top of the table on its first page (inches); below
+                   area_top when other blocks come before it
+        area_top: Top of the content area of a continuation slide
+
+    Returns:
+        (start, stop) data-row ranges, one per page; the first range is empty
+        when not even one row fits below the blocks before the table
+    """
+    num_rows = len(table.rows)
+    font_name = CONFIG["fonts"]["table_body"]["name"]
+    plan = _plan_table(table, slide_width_inches, slide_height_inches, area_top,
+                       use_template_position)
+    heights = np.asarray(_estimate_table_row_heights(
+        plan.metrics, plan.col_widths_est, min_font_size, plan.vert_overhead, font_name))
+    ends = np.cumsum(heights[1:])
+    header_height = heights[0]
+    page_room = plan.available_height - header_height
+    first_room = _plan_table(table, slide_width_inches, slide_height_inches, first_top,
+                             use_template_position).available_height - header_height
+
+    def rows_within(start, room):
+        """Rows from start whose total height is at most room."""
+        base = ends[start - 1] if start else 0.0
+        return int(np.searchsorted(ends, base + room, side='right')) - start
+
+    def rows_reaching(start, height):
+        """Rows from start up to the one whose end reaches height."""
+        base = ends[start - 1] if start else 0.0
+        return int(np.searchsorted(ends, base + height, side='left')) - start + 1
+
+    # Leave the first slide to the blocks above when no row fits below them
+    skip_first = first_top > area_top and rows_within(0, first_room) == 0
+
+    def pack(pages: Optional[int]) -> List[Tuple[int, int]]:
+        """Fill each page (pages=None) or spread the rows over that many pages."""
+        ranges = [(0, 0)] if skip_first else []
+        start, pages_left = 0, pages
+        top, room = (area_top, page_room) if skip_first else (first_top, first_room)
+        while start < num_rows:
+            count = rows_within(start, room)
+            if pages_left:
+                remaining = ends[-1] - (ends[start - 1] if start else 0.0)
+                count = min(count, rows_reaching(start, remaining / pages_left))
+                pages_left = max(1, pages_left - 1)
+            count = max(1, count)
+            while count > 1 and not _table_fits(
+                    _plan_table(_table_slice(table, start, start + count), slide_width_inches,
+                                slide_height_inches, top, use_template_position),
+                    min_font_size):
+                count -= 1
+            ranges.append((start, start + count))
+            start += count
+            top, room = area_top, page_room
+        return ranges
+
+    filled = pack(None)
+    balanced = pack(sum(1 for start, stop in filled if stop > start))
+    return balanced if len(balanced) <= len(filled) else filled
+
+
+def _block_line(block: ContentBlock) -> int:
+    """First markdown line of a content block (0 = unknown)."""
+    if block.block_type == "table" and block.table:
+        return block.table.row_line(0) if block.table.first_row else block.table.line
+    return block.bullets[0].line if block.bullets else 0
+
+
+def paginate_slide(slide_content: SlideContent, slide_width_inches: float,
+                   slide_height_inches: float,
+                   layout_manager: Optional[LayoutManager] = None) -> List[SlideContent]:
+    """
+    Split a content slide whose tables are too tall into continuation slides.
+
+    A table stays on its slide when add_table_to_slide can fit it at
+    CONFIG["table_min_font_size"] or larger.  Otherwise its rows are spread
+    over continuation slides (see _split_table_rows) that repeat the header
+    row and add CONTINUED_SUFFIX to the title.  A table that does not start
+    on its own slide takes the label line just above it along.  Blocks after
+    a split table follow its last rows, or start another slide when they
+    would push that page below the minimum font size or past the footer.
+
+    Returns:
+        [slide_content] when nothing is split, else the slides in order
+    """
+    min_font_size = CONFIG.get("table_min_font_size")
+    blocks = slide_content.content_blocks
+    if (not min_font_size or slide_content.slide_type != SlideType.CONTENT
+            or not any(block.block_type == "table" and block.table for block in blocks)):
+        return [slide_content]
+
+    area_top, _, use_template_position, _ = _content_area(
+        slide_content, slide_height_inches, layout_manager)
+    gap = 0.15
+    block_estimated_heights = [
+        _estimate_bullets_height(block.bullets)
+        if block.block_type == "bullets" and block.bullets else 0.0
+        for block in blocks
+    ]
+
+    pages = [[]]
+    top = area_top
+    for idx, block in enumerate(blocks):
+        if not (block.block_type == "table" and block.table):
+            pages[-1].append(block)
+            if block.bullets:
+                top += _estimate_bullet_box_height(block.bullets) + gap
+            continue
+
+        remaining_height = sum(
+            block_estimated_heights[j] + gap
+            for j in range(idx + 1, len(blocks))
+            if block_estimated_heights[j] > 0
+        )
+        table = block.table
+        plan = _plan_table(table, slide_width_inches, slide_height_inches, top,
+                           use_template_position, remaining_height)
+        if _table_fits(plan, min_font_size) or len(table.rows) < 2:
+            pages[-1].append(block)
+            top += plan.actual_table_height + gap
+            continue
+
+        ranges = _split_table_rows(table, slide_width_inches, slide_height_inches, top,
+                                   area_top, use_template_position, min_font_size)
+        moved = ranges[0][1] == 0
+        if moved:
+            # The table starts on a new slide; a label introducing it
+            # ("**Filtering Logic:**") goes along
+            previous = pages[-1][-1]
+            if previous.block_type == "bullets" and len(previous.bullets) > 1 \
+                    and previous.bullets[-1].is_label:
+                pages[-1][-1] = ContentBlock(block_type="bullets", bullets=previous.bullets[:-1])
+                pages.append([ContentBlock(block_type="bullets", bullets=previous.bullets[-1:])])
+                top = area_top + _estimate_bullet_box_height(previous.bullets[-1:]) + gap
+                ranges = _split_table_rows(table, slide_width_inches, slide_height_inches, top,
+                                           area_top, use_template_position, min_font_size)
+            else:
+                pages.append([])
+                top = area_top
+                ranges = ranges[1:]
+
+        parts = [r for r in ranges if r[1] > r[0]]
+        if len(parts) > 1:
+            logger.info("    Table at line %d split across %d slides to keep %gpt text",
+                        table.line, len(parts), min_font_size)
+        elif moved:
+            logger.info("    Table at line %d moved to a continuation slide", table.line)
+        for n, (start, stop) in enumerate(ranges):
+            if n > 0:
+                pages.append([])
+                top = area_top
+            if stop > start:
+                part = _table_slice(table, start, stop)
+                pages[-1].append(ContentBlock(block_type="table", table=part))
+        plan = _plan_table(part, slide_width_inches, slide_height_inches, top,
+                           use_template_position, remaining_height)
+        with_rest = SlideContent(slide_type=SlideType.CONTENT, title=slide_content.title,
+                                 content_blocks=pages[-1] + blocks[idx + 1:])
+        if remaining_height > 0 and (
+                not _table_fits(plan, min_font_size)
+                or check_slide_layout(with_rest, 0, slide_width_inches, slide_height_inches,
+                                      layout_manager) is not None):
+            logger.info("    Content after the table at line %d moved to a continuation slide",
+                        table.line)
+            pages.append([])
+            top = area_top
+        else:
+            top += plan.actual_table_height + gap
+
+    if len(pages) == 1:
+        return [slide_content]
+
+    last_line = slide_content.source_lines[1] if slide_content.source_lines else 0
+    slides = []
+    for n, page_blocks in enumerate(pages):
+        if n == 0:
+            title, source_lines = slide_content.title, slide_content.source_lines
+        else:
+            title = slide_content.title + CONTINUED_SUFFIX
+            first_line = _block_line(page_blocks[0]) if page_blocks else 0
+            source_lines = (first_line, last_line) if slide_content.source_lines else None
+        slides.append(SlideContent(slide_type=slide_content.slide_type, title=title,
+                                   subtitle=slide_content.subtitle,
+                                   content_blocks=page_blocks,
+                                   has_image=slide_content.has_image,
+                                   source_lines=source_lines))
+    return slides
+
+
+def paginate_slides(slides: Iterable[SlideContent], slide_width_inches: float,
+                    slide_height_inches: float,
+                    layout_manager: Optional[LayoutManager] = None) -> Iterator[SlideContent]:
+    """Stream slides through paginate_slide."""
+    for slide_content in slides:
+        yield from paginate_slide(slide_content, slide_width_inches, slide_height_inches,
+                                  layout_manager)
+
+
 # ============================================
 # MAIN CONVERSION FUNCTION
 # ============================================
@@ -2695,7 +3561,10 @@ def add_table_to_slide(slide, prs: Presentation, table: TableData,
 def convert_markdown_to_pptx(
     markdown_path: str, 
     output_path: Optional[str] = None,
-    template_path: Optional[str] = None
+    template_path: Optional[str] = None,
+    use_template_cache: bool = True,
+    presentation: Optional[tuple] = None,
+    markdown: Optional[str] = None
 ) -> str:
     """
     Convert markdown file to PowerPoint presentation
@@ -2704,41 +3573,65 @@ def convert_markdown_to_pptx(
         markdown_path: Path to input markdown file
         output_path: Path to output PPTX file (optional)
         template_path: Path to PowerPoint template file (optional)
+        use_template_cache: Reuse the cached template analysis (see load_template)
+        presentation: (Presentation, LayoutManager or None) to build into, e.g.
+                      a copy of a prepared blank template; replaces template_path
+        markdown: Markdown text to convert instead of reading markdown_path,
+                  which then only names the source in messages and the
+                  default output path
     
     Returns:
         Path to generated PPTX file
     """
-    # Read markdown file
-    with open(markdown_path, 'r', encoding='utf-8') as f:
-        markdown_text = f.read()
-    
-    # Parse markdown
-    logger.info("Parsing markdown...")
-    parser = MarkdownToSlides(markdown_text)
-    slides = parser.parse()
-    logger.info("Found %d slides", len(slides))
-    
     # Create presentation with layout manager
     logger.info("Creating presentation...")
-    prs, layout_manager = create_presentation(template_path)
+    if presentation is not None:
+        prs, layout_manager = presentation
+    else:
+        prs, layout_manager = create_presentation(template_path, use_template_cache)
     
     if layout_manager:
         logger.info("Intelligent layout selection enabled with %d layouts available", len(layout_manager.layouts))
     else:
         logger.info("Using manual slide creation (no template)")
     
-    # Generate slides with intelligent layout selection
-    logger.info("Generating slides...")
-    for i, slide_content in enumerate(slides):
-        title_display = (slide_content.title[:50] + "...") if len(slide_content.title) > 50 else slide_content.title
-        logger.info("Slide %d: %s - '%s'", i + 1, slide_content.slide_type.value, title_display)
-        
-        if slide_content.slide_type == SlideType.TITLE:
-            add_title_slide(prs, slide_content.title, slide_content.subtitle, layout_manager)
-        elif slide_content.slide_type == SlideType.SECTION:
-            add_section_slide(prs, slide_content.title, layout_manager)
-        elif slide_content.slide_type == SlideType.CONTENT:
-            add_content_slide(prs, slide_content, layout_manager)
+    # Parse and generate slides as they stream out of the parser, with
+    # intelligent layout selection
+    logger.info("Parsing markdown and generating slides...")
+    slide_width, slide_height = prs.slide_width.inches, prs.slide_height.inches
+    source = (open(markdown_path, 'r', encoding='utf-8') if markdown is None
+              else io.StringIO(markdown))
+    with source as f:
+        parser = MarkdownToSlides(f, markdown_path)
+        slides = paginate_slides(parser.iter_slides(), slide_width, slide_height,
+                                 layout_manager)
+        for i, slide_content in enumerate(slides):
+            title_display = (slide_content.title[:50] + "...") if len(slide_content.title) > 50 else slide_content.title
+            logger.info("Slide %d: %s - '%s'", i + 1, slide_content.slide_type.value, title_display)
+            first_line = slide_content.source_lines[0]
+            
+            try:
+                if slide_content.slide_type == SlideType.TITLE:
+                    add_title_slide(prs, slide_content.title, slide_content.subtitle, layout_manager)
+                elif slide_content.slide_type == SlideType.SECTION:
+                    add_section_slide(prs, slide_content.title, layout_manager)
+                elif slide_content.slide_type == SlideType.CONTENT:
+                    add_content_slide(prs, slide_content, layout_manager)
+            except Exception as e:
+                logger.error("%s: error building slide %d '%s': %s",
+                             parser.source_ref(first_line), i + 1, slide_content.title, e)
+                raise
+            
+            if slide_content.slide_type == SlideType.CONTENT:
+                overflow = check_slide_layout(slide_content, i + 1, slide_width, slide_height,
+                                              layout_manager)
+                if overflow is not None:
+                    split = (f"; split before line {overflow.split_points[0][0]}"
+                             if overflow.split_points else "")
+                    logger.warning("%s: slide %d '%s' may overflow by %.2f\"%s",
+                                   parser.source_ref(first_line), i + 1,
+                                   slide_content.title, overflow.overflow, split)
+    logger.info("Generated %d slides", len(prs.slides))
     
     # Ensure slide-number placeholders are present on every slide
     # (python-pptx doesn't copy decorator placeholders from the layout)
@@ -2761,6 +3654,117 @@ def convert_markdown_to_pptx(
     return output_path
 
 
+# ============================================
+# BATCH CONVERSION
+# ============================================
+
+# Set in each pool worker by _init_batch_worker:
+# (blank template Presentation, template analysis), or None without a template
+_batch_template: Optional[tuple] = None
+
+
+def discover_markdown_files(paths: List[str]) -> List[str]:
+    """Expand files and directories (searched recursively) into .md paths."""
+    found = []
+    for path in paths:
+        if os.path.isdir(path):
+            for dirpath, dirnames, filenames in os.walk(path):
+                dirnames[:] = sorted(d for d in dirnames if not d.startswith(('.', '__')))
+                found.extend(os.path.join(dirpath, name) for name in sorted(filenames)
+                             if name.lower().endswith('.md'))
+        else:
+            found.append(path)
+    return found
+
+
+def _init_batch_worker(template_data: Optional[bytes], analysis: Optional[Dict[str, Any]]):
+    """Pool initializer: open the prepared template once per worker and quiet logging."""
+    global _batch_template
+    logger.setLevel(logging.WARNING)
+    if template_data is not None:
+        _batch_template = (Presentation(io.BytesIO(template_data)), analysis)
+
+
+def _convert_batch_item(markdown_path: str, output_path: str) -> tuple:
+    """Pool task: build one deck from a copy of the blank template.
+
+    Returns:
+        tuple: (markdown_path, elapsed seconds, error message or None)
+    """
+    start = time.perf_counter()
+    try:
+        presentation = None
+        if _batch_template is not None:
+            blank, analysis = _batch_template
+            prs = copy.deepcopy(blank)
+            presentation = (prs, LayoutManager(prs, analysis))
+        convert_markdown_to_pptx(markdown_path, output_path, presentation=presentation)
+    except Exception as e:
+        return markdown_path, time.perf_counter() - start, f"{type(e).__name__}: {e}"
+    return markdown_path, time.perf_counter() - start, None
+
+
+def convert_batch(paths: List[str], template_path: Optional[str] = None,
+                  workers: Optional[int] = None, use_template_cache: bool = True) -> int:
+    """
+    Convert many markdown files in a process pool, sharing one template load.
+
+    The template is converted and analyzed once (see load_template); each
+    worker opens the prepared blank presentation once and deep-copies it for
+    every deck.  Each .md is written to a .pptx next to it.
+
+    Args:
+        paths: Markdown files and/or directories (searched recursively)
+        template_path: Path to PowerPoint template file (optional)
+        workers: Worker process count (defaults to the CPU count)
+        use_template_cache: Reuse the cached template analysis
+
+    Returns:
+        int: Number of decks that failed to convert
+    """
+    sources = discover_markdown_files(paths)
+    if not sources:
+        logger.info("No markdown files found in: %s", ", ".join(paths))
+        return 0
+
+    start = time.perf_counter()
+    template_data, analysis = None, None
+    if template_path:
+        template_data, analysis = load_template(template_path, use_template_cache)
+        logger.info("Using template: %s", template_path)
+    template_time = time.perf_counter() - start
+
+    workers = max(1, min(workers or os.cpu_count() or 1, len(sources)))
+    logger.info("Converting %d markdown file(s) with %d worker(s)...", len(sources), workers)
+
+    results = {}
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_batch_worker,
+                             initargs=(template_data, analysis)) as pool:
+        futures = [pool.submit(_convert_batch_item, md_path, os.path.splitext(md_path)[0] + '.pptx')
+                   for md_path in sources]
+        for future in as_completed(futures):
+            md_path, elapsed, error = future.result()
+            results[md_path] = (elapsed, error)
+    wall_time = time.perf_counter() - start
+
+    # Per-deck timing summary, in input order
+    names = {md_path: os.path.relpath(md_path) for md_path in sources}
+    width = max(len(name) for name in names.values())
+    logger.info("")
+    logger.info("%-*s  %9s  %s", width, "Deck", "Time (s)", "Status")
+    for md_path in sources:
+        elapsed, error = results[md_path]
+        logger.info("%-*s  %9.2f  %s", width, names[md_path], elapsed,
+                    f"FAILED ({error})" if error else "converted")
+
+    failures = sum(1 for _, error in results.values() if error)
+    logger.info("")
+    logger.info("  - Converted %d, failed %d", len(results) - failures, failures)
+    logger.info("  - Template load %.2f s; wall time %.2f s (sum of per-deck times %.2f s)",
+                template_time, wall_time, sum(elapsed for elapsed, _ in results.values()))
+    return failures
+
+
 # ============================================
 # COMMAND LINE INTERFACE
 # ============================================
@@ -2775,6 +3779,12 @@ Examples:
   python md_to_pptx_converter.py document.md --template template.pptx
   python md_to_pptx_converter.py document.md -o output.pptx
   
+  # Report slides that would overflow, with split points (no file written):
+  python md_to_pptx_converter.py document.md --check
+  
+  # Convert every .md under a folder (one template load, parallel workers):
+  python md_to_pptx_converter.py --batch ../../Deliverables --workers 4
+  
   # Create a clean template (no slides) from an existing one:
   python md_to_pptx_converter.py --clean-template source.pptx -o clean_template.pptx
         """
@@ -2802,6 +3812,33 @@ Examples:
         help='Create a clean template (no slides) from SOURCE template file'
     )
     
+    parser.add_argument(
+        '--batch',
+        nargs='+',
+        metavar='PATH',
+        help='Convert many markdown files (files or folders, searched recursively) '
+             'in parallel; each .pptx is written next to its source'
+    )
+    
+    parser.add_argument(
+        '--workers',
+        type=int,
+        help='Worker processes for --batch (default: CPU count)'
+    )
+    
+    parser.add_argument(
+        '--check',
+        action='store_true',
+        help='Only estimate slide layout and report overflowing slides with '
+             'suggested split points; no file is written (exit code 1 on overflow)'
+    )
+    
+    parser.add_argument(
+        '--no-template-cache',
+        action='store_true',
+        help=f'Re-analyze the template instead of using {TEMPLATE_CACHE_DIRNAME}/ next to it'
+    )
+    
     parser.add_argument(
         '-v', '--verbose',
         action='store_true',
@@ -2831,13 +3868,19 @@ Examples:
             logger.error("Error creating clean template: %s", e)
             return 1
     
-    # Normal conversion mode requires markdown file
-    if not args.markdown_file:
+    # Normal conversion mode requires markdown file (or --batch)
+    if not args.markdown_file and not args.batch:
         parser.print_help()
         return 1
     
+    if args.batch and (args.markdown_file or args.output):
+        parser.error("--batch cannot be combined with a markdown file or --output")
+    
+    if args.check and (args.batch or args.output):
+        parser.error("--check cannot be combined with --batch or --output")
+    
     # Validate input file
-    if not os.path.exists(args.markdown_file):
+    if args.markdown_file and not os.path.exists(args.markdown_file):
         logger.error("Error: Input file not found: %s", args.markdown_file)
         return 1
     
@@ -2857,12 +3900,26 @@ Examples:
         logger.warning("Proceeding with default styling...")
         args.template = None
     
+    if args.check:
+        start = time.perf_counter()
+        overflows = check_markdown_layout(args.markdown_file, args.template,
+                                          use_template_cache=not args.no_template_cache)
+        report_layout_check(overflows, args.markdown_file)
+        logger.info("Checked in %.0f ms", (time.perf_counter() - start) * 1000)
+        return 1 if overflows else 0
+    
+    if args.batch:
+        failures = convert_batch(args.batch, args.template, workers=args.workers,
+                                 use_template_cache=not args.no_template_cache)
+        return 1 if failures else 0
+    
     # Convert
     try:
         output_path = convert_markdown_to_pptx(
             args.markdown_file,
             args.output,
-            args.template
+            args.template,
+            use_template_cache=not args.no_template_cache
         )
         logger.info("Success! Created: %s", output_path)
         return 0
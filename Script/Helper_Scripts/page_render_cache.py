@@ -0,0 +1,528 @@
+"""
+Page Render Cache
+
+Rasterizes PDF pages for the visual feedback loops (docx_to_images.py,
+pptx_to_images.py) and compares render runs.
+
+- rasterize_pages: renders pages in parallel worker processes (PyMuPDF)
+- render_pdf_cached: fingerprints every page (content stream plus all the
+  fonts, images and other resources it uses) and re-rasterizes only pages
+  whose fingerprint is new; unchanged pages are copied from the cache
+- diff_renders: perceptual diff of two render folders, with a changed-page
+  list and a heatmap image per changed page
+
+Everything here works on any PDF on any platform (no Word or PowerPoint).
+
+Usage:
+    python page_render_cache.py render input.pdf [-o out_dir] [--width 1920] [--format png]
+                                                 [--prefix page] [--workers N] [--diff report_dir]
+    python page_render_cache.py diff old_dir new_dir [-o report_dir] [--min-pixels 4]
+
+Requirements:
+    pip install PyMuPDF
+    pip install Pillow numpy      (diffs only: diff_renders, --diff)
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import os
+import re
+import shutil
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import fitz  # PyMuPDF
+
+# Folder inside the output directory holding cached page images and the manifest
+CACHE_DIRNAME = "_render_cache"
+# Bump when the fingerprint recipe changes
+_FINGERPRINT_VERSION = 2
+
+# Page dictionary entries besides the content stream that change the raster:
+# resources (inherited from the page tree when the page has none), the
+# annotations get_pixmap draws, and the transparency group
+_PAGE_RENDER_KEYS = ("Resources", "Annots", "Group")
+_INHERITED_KEYS = {"Resources"}
+
+# Indirect reference "12 0 R"; /Parent and /P point back up the page tree and
+# are left out of fingerprints (following them would pull in every page)
+_REF_RE = re.compile(r"(\d+)\s+(\d+)\s+R\b")
+_BACKREF_RE = re.compile(r"/(?:Parent|P)\s+\d+\s+\d+\s+R\b")
+
+# Perceptual diff defaults: per-pixel luminance change (0-255, after a small
+# blur that absorbs anti-aliasing noise) and the number of changed pixels at
+# which a page counts as changed.  An absolute count, not a share of the page,
+# so a one-digit edit in body text still shows up at any render width.
+DIFF_TOLERANCE = 24
+DIFF_MIN_PIXELS = 4
+
+
+def page_filename(page_number: int, page_count: int, img_format: str = "png",
+                  prefix: str = "page") -> str:
+    """
+    Output file name for a page: page_01.png, page_02.png, ...
+
+    Page numbers are zero-padded to at least two digits, or to the width of
+    page_count for longer documents (page_001 ... page_200), so names sort in
+    page order and depend only on the page number and page count.
+    """
+    digits = max(2, len(str(page_count)))
+    return f"{prefix}_{page_number:0{digits}d}.{img_format}"
+
+
+# ---------------------------------------------------------------------------
+# Rasterization
+# ---------------------------------------------------------------------------
+
+
+def _rasterize_chunk(pdf_path: str, jobs: list, width: int, img_format: str) -> list[str]:
+    """
+    Render (page_number, output_path) jobs of one PDF.
+
+    Runs in a pool worker, so it opens its own document handle.
+    """
+    written = []
+    pdf = fitz.open(pdf_path)
+    try:
+        for page_number, filepath in jobs:
+            page = pdf[page_number - 1]
+
+            # Calculate zoom factor to reach the target width
+            zoom = width / page.rect.width
+            mat = fitz.Matrix(zoom, zoom)
+            pix = page.get_pixmap(matrix=mat)
+
+            if img_format == "jpg":
+                pix.save(filepath, jpg_quality=95)
+            else:
+                pix.save(filepath)
+            written.append(filepath)
+    finally:
+        pdf.close()
+    return written
+
+
+def _page_span(jobs: list) -> str:
+    """'page 5' or 'pages 5-8' for a chunk of jobs."""
+    first, last = jobs[0][0], jobs[-1][0]
+    return f"page {first}" if first == last else f"pages {first}-{last}"
+
+
+def rasterize_pages(pdf_path: str, jobs: list, width: int = 1920,
+                    img_format: str = "png", workers: int = None) -> list[str]:
+    """
+    Render PDF pages to image files in parallel.
+
+    Jobs are split into consecutive chunks (a few per worker, to even out
+    pages of uneven cost) and rendered in a process pool.
+
+    Args:
+        pdf_path: Path to the PDF file
+        jobs: List of (1-based page number, output image path)
+        width: Image width in pixels (height follows the page aspect ratio)
+        img_format: 'png' or 'jpg'
+        workers: Worker process count (default: CPU count; 1 renders in-process)
+
+    Returns:
+        List of written image paths, in job order
+    """
+    if not jobs:
+        return []
+
+    workers = max(1, min(workers or os.cpu_count() or 1, len(jobs)))
+    size = math.ceil(len(jobs) / min(len(jobs), workers * 4))
+    chunks = [jobs[i:i + size] for i in range(0, len(jobs), size)]
+
+    written = {}
+    if workers == 1:
+        for idx, chunk in enumerate(chunks):
+            written[idx] = _rasterize_chunk(pdf_path, chunk, width, img_format)
+            print(f"  Rendered {_page_span(chunk)}")
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(_rasterize_chunk, pdf_path, chunk, width, img_format): idx
+                       for idx, chunk in enumerate(chunks)}
+            for future in as_completed(futures):
+                idx = futures[future]
+                written[idx] = future.result()
+                print(f"  Rendered {_page_span(chunks[idx])}")
+
+    return [path for idx in range(len(chunks)) for path in written[idx]]
+
+
+# ---------------------------------------------------------------------------
+# Page fingerprints
+# ---------------------------------------------------------------------------
+
+
+def _object_digest(pdf, xref: int, memo: dict) -> bytes:
+    """
+    Digest of a PDF object and everything it references.
+
+    References are replaced by the digest of their target, so renumbering
+    objects between exports does not change the result.  Shared objects
+    (fonts, images) are hashed once per document through memo.
+    """
+    if xref in memo:
+        return memo[xref]
+    if not 0 < xref < pdf.xref_length():
+        return b"invalid"  # "n 0 R"-like text inside a string, not a reference
+    memo[xref] = b"cycle"
+
+    digest = hashlib.sha256()
+    source = _BACKREF_RE.sub("", pdf.xref_object(xref, compressed=True))
+    _update_with_source(pdf, source, digest, memo)
+    if pdf.xref_is_stream(xref):
+        digest.update(pdf.xref_stream_raw(xref))
+
+    memo[xref] = digest.digest()
+    return memo[xref]
+
+
+def _update_with_source(pdf, source: str, digest, memo: dict) -> None:
+    """Hash PDF object source text with each reference replaced by its target's digest."""
+    position = 0
+    for match in _REF_RE.finditer(source):
+        digest.update(source[position:match.start()].encode("latin-1", "replace"))
+        digest.update(_object_digest(pdf, int(match.group(1)), memo))
+        position = match.end()
+    digest.update(source[position:].encode("latin-1", "replace"))
+
+
+def _page_key(pdf, page_xref: int, key: str) -> tuple:
+    """
+    Return (kind, value) of a page dictionary entry, as fitz xref_get_key does.
+
+    Inheritable entries missing from the page are looked up on its /Parent
+    page-tree nodes, the way viewers resolve them.
+    """
+    kind, value = pdf.xref_get_key(page_xref, key)
+    if key not in _INHERITED_KEYS:
+        return kind, value
+    xref, seen = page_xref, set()
+    while kind == "null" and xref not in seen:
+        seen.add(xref)
+        parent_kind, parent = pdf.xref_get_key(xref, "Parent")
+        if parent_kind != "xref":
+            break
+        xref = int(parent.split()[0])
+        kind, value = pdf.xref_get_key(xref, key)
+    return kind, value
+
+
+def page_fingerprints(pdf_path: str, width: int = 1920, img_format: str = "png") -> list[str]:
+    """
+    Fingerprint every page of a PDF for the render cache.
+
+    A page's fingerprint covers its decoded content stream, its resources
+    (fonts, images, form XObjects, ... followed recursively, including
+    resources inherited from the page tree), its annotations and their
+    appearance streams, its transparency group, its page box and rotation,
+    and the render settings, so equal fingerprints render to identical images.
+
+    Returns:
+        List of hex digests, one per page
+    """
+    fingerprints = []
+    memo = {}
+    pdf = fitz.open(pdf_path)
+    try:
+        for page in pdf:
+            digest = hashlib.sha256()
+            digest.update(f"v{_FINGERPRINT_VERSION}|{width}|{img_format}|"
+                          f"{tuple(page.rect)}|{page.rotation}|".encode())
+            digest.update(page.read_contents())
+            for key in _PAGE_RENDER_KEYS:
+                kind, value = _page_key(pdf, page.xref, key)
+                digest.update(f"|{key}|{kind}|".encode())
+                _update_with_source(pdf, value, digest, memo)
+            fingerprints.append(digest.hexdigest())
+    finally:
+        pdf.close()
+    return fingerprints
+
+
+# ---------------------------------------------------------------------------
+# Cached rendering
+# ---------------------------------------------------------------------------
+
+
+def _load_manifest(path: str) -> list:
+    """Page fingerprints of the previous run (empty if none)."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)["pages"]
+    except (OSError, ValueError, KeyError):
+        return []
+
+
+def render_pdf_cached(pdf_path: str, output_dir: str = None, width: int = 1920,
+                      img_format: str = "png", workers: int = None,
+                      prefix: str = "page", diff_dir: str = None) -> tuple:
+    """
+    Render every page of a PDF, re-rasterizing only pages that changed.
+
+    Page images are kept in output_dir/_render_cache/ under their fingerprint.
+    A page whose fingerprint is already cached is copied from there, even when
+    it moved (e.g. after a page was inserted before it), and only new
+    fingerprints are rasterized.  Cache entries no longer used are removed.
+
+    Args:
+        pdf_path: Path to the PDF file
+        output_dir: Output directory (default: _temp-pdf-to-png/ next to the PDF)
+        width: Image width in pixels
+        img_format: 'png' or 'jpg'
+        workers: Worker processes for rasterization (default: CPU count)
+        prefix: Output file name prefix ('page' or 'slide')
+        diff_dir: If given, write a diff_renders report for the changed pages
+                  against the previous run into this folder
+
+    Returns:
+        tuple: (list of page image paths in page order,
+                list of 1-based page numbers that differ from the previous run)
+    """
+    pdf_path = os.path.abspath(pdf_path)
+    if not os.path.exists(pdf_path):
+        print(f"Error: File not found: {pdf_path}")
+        sys.exit(1)
+
+    if output_dir is None:
+        output_dir = os.path.join(os.path.dirname(pdf_path), "_temp-pdf-to-png")
+    output_dir = os.path.abspath(output_dir)
+    cache_dir = os.path.join(output_dir, CACHE_DIRNAME)
+    os.makedirs(cache_dir, exist_ok=True)
+    manifest_path = os.path.join(cache_dir, "manifest.json")
+
+    start = time.perf_counter()
+    fingerprints = page_fingerprints(pdf_path, width, img_format)
+    previous = _load_manifest(manifest_path)
+    page_count = len(fingerprints)
+
+    def cached(fingerprint):
+        return os.path.join(cache_dir, f"{fingerprint}.{img_format}")
+
+    # Rasterize each new fingerprint once
+    jobs, queued = [], set()
+    for number, fingerprint in enumerate(fingerprints, start=1):
+        if fingerprint not in queued and not os.path.exists(cached(fingerprint)):
+            jobs.append((number, cached(fingerprint)))
+            queued.add(fingerprint)
+    print(f"  {page_count} page(s): {len(jobs)} to render, "
+          f"{page_count - len(jobs)} from cache")
+    rasterize_pages(pdf_path, jobs, width, img_format, workers)
+
+    # Copy pages whose image differs from the previous run into place
+    changed = []
+    exported_files = []
+    for number, fingerprint in enumerate(fingerprints, start=1):
+        filepath = os.path.join(output_dir, page_filename(number, page_count, img_format, prefix))
+        unchanged = number <= len(previous) and previous[number - 1] == fingerprint
+        if not unchanged:
+            changed.append(number)
+        if not unchanged or not os.path.exists(filepath):
+            shutil.copyfile(cached(fingerprint), filepath)
+        exported_files.append(filepath)
+
+    if diff_dir is not None and changed:
+        pairs = [(page_filename(n, page_count, img_format, prefix),
+                  cached(previous[n - 1]) if n <= len(previous) else None,
+                  cached(fingerprints[n - 1]))
+                 for n in changed]
+        # Every page here has a new fingerprint, so list it even if no pixel moved
+        _write_diff_report(pairs, diff_dir, known_changed=True)
+
+    # Drop page files left over from a longer previous run, and unused cache entries
+    current = {os.path.basename(p) for p in exported_files}
+    page_name = re.compile(rf"^{re.escape(prefix)}_\d+\.{img_format}$")
+    for name in os.listdir(output_dir):
+        if page_name.match(name) and name not in current:
+            os.remove(os.path.join(output_dir, name))
+    keep = {f"{fingerprint}.{img_format}" for fingerprint in fingerprints}
+    for name in os.listdir(cache_dir):
+        if name != "manifest.json" and name not in keep:
+            os.remove(os.path.join(cache_dir, name))
+
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump({"pages": fingerprints}, f)
+
+    print(f"  Changed pages: {', '.join(map(str, changed)) if changed else 'none'} "
+          f"({time.perf_counter() - start:.1f}s)")
+    return exported_files, changed
+
+
+# ---------------------------------------------------------------------------
+# Perceptual diff
+# ---------------------------------------------------------------------------
+
+
+def _luminance(path: str, size: tuple = None) -> tuple:
+    """Open an image; return (RGB image, blurred luminance as int16 array)."""
+    import numpy as np
+    from PIL import Image, ImageFilter
+
+    image = Image.open(path).convert("RGB")
+    if size is not None and image.size != size:
+        image = image.resize(size, Image.LANCZOS)
+    gray = image.convert("L").filter(ImageFilter.GaussianBlur(1))
+    return image, np.asarray(gray, dtype=np.int16)
+
+
+def compare_images(old_path: str, new_path: str,
+                   tolerance: int = DIFF_TOLERANCE) -> tuple:
+    """
+    Perceptual difference between two renders of a page.
+
+    Both images are converted to luminance and slightly blurred (absorbing
+    anti-aliasing noise); pixels whose luminance moved by more than tolerance
+    count as changed.  The old image is resized to the new one if needed.
+
+    numpy and Pillow are imported here, so rendering (cached or not) only
+    needs PyMuPDF.
+
+    Returns:
+        tuple: (number of changed pixels, share of changed pixels 0-1,
+                heatmap PIL image)
+    """
+    import numpy as np
+    from PIL import Image
+
+    new_image, new_luma = _luminance(new_path)
+    _, old_luma = _luminance(old_path, new_image.size)
+    delta = np.abs(new_luma - old_luma)
+    changed = delta > tolerance
+
+    # Heatmap: faded new render with changes in red (stronger = larger change)
+    faded = np.asarray(new_image, dtype=np.float32) * 0.35 + 165
+    alpha = np.where(changed, 0.35 + 0.65 * delta / 255.0, 0.0)[..., None]
+    heat = faded * (1 - alpha) + np.array([230, 0, 0], dtype=np.float32) * alpha
+    heatmap = Image.fromarray(heat.clip(0, 255).astype(np.uint8))
+
+    return int(changed.sum()), float(changed.mean()), heatmap
+
+
+def _write_diff_report(pairs: list, report_dir: str, tolerance: int = DIFF_TOLERANCE,
+                       min_pixels: int = DIFF_MIN_PIXELS, known_changed: bool = False) -> dict:
+    """
+    Compare (name, old path or None, new path or None) pairs; write heatmaps and report.
+
+    With known_changed (pages whose fingerprint changed) every pair is listed
+    as changed with a heatmap, however few pixels moved.
+
+    Returns:
+        Report dict (also written to report_dir/diff_report.json)
+    """
+    os.makedirs(report_dir, exist_ok=True)
+    report = {"changed": [], "added": [], "removed": [], "unchanged": []}
+
+    for name, old_path, new_path in pairs:
+        if old_path is None or not os.path.exists(old_path):
+            report["added"].append(name)
+        elif new_path is None or not os.path.exists(new_path):
+            report["removed"].append(name)
+        else:
+            count, share, heatmap = compare_images(old_path, new_path, tolerance)
+            if known_changed or count >= min_pixels:
+                heatmap_path = os.path.join(report_dir, f"diff_{os.path.splitext(name)[0]}.png")
+                heatmap.save(heatmap_path)
+                report["changed"].append({"page": name, "changed_pixels": count,
+                                          "changed_share": round(share, 6),
+                                          "heatmap": heatmap_path})
+            else:
+                report["unchanged"].append(name)
+
+    with open(os.path.join(report_dir, "diff_report.json"), "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+    print(f"  Visual diff: {len(report['changed'])} changed, {len(report['added'])} added, "
+          f"{len(report['removed'])} removed, {len(report['unchanged'])} unchanged")
+    for entry in report["changed"]:
+        print(f"    {entry['page']}: {entry['changed_pixels']:,} pixels "
+              f"({entry['changed_share']:.2%}) -> {os.path.basename(entry['heatmap'])}")
+    return report
+
+
+def diff_renders(old_dir: str, new_dir: str, report_dir: str = None,
+                 tolerance: int = DIFF_TOLERANCE, min_pixels: int = DIFF_MIN_PIXELS) -> dict:
+    """
+    Perceptual diff of two render runs (folders of page/slide images).
+
+    Images are matched by file name.  A page is changed when at least
+    min_pixels of its pixels moved by more than tolerance in luminance; a
+    heatmap is written for each changed page.
+
+    Args:
+        old_dir: Folder of the earlier render
+        new_dir: Folder of the later render
+        report_dir: Where to write heatmaps and diff_report.json
+                    (default: _render-diff/ inside new_dir)
+        tolerance: Per-pixel luminance change (0-255) that counts as changed
+        min_pixels: Number of changed pixels that marks a page as changed
+
+    Returns:
+        Dict with 'changed' (page, changed_pixels, changed_share, heatmap), 'added',
+        'removed' and 'unchanged' lists
+    """
+    if report_dir is None:
+        report_dir = os.path.join(new_dir, "_render-diff")
+
+    def images(folder):
+        return {name for name in os.listdir(folder)
+                if name.lower().endswith((".png", ".jpg")) and not name.startswith("diff_")}
+
+    old_names, new_names = images(old_dir), images(new_dir)
+    pairs = [(name,
+              os.path.join(old_dir, name) if name in old_names else None,
+              os.path.join(new_dir, name) if name in new_names else None)
+             for name in sorted(old_names | new_names)]
+    return _write_diff_report(pairs, report_dir, tolerance, min_pixels)
+
+
+def main():
+    """
+    Main execution function.
+    """
+    parser = argparse.ArgumentParser(
+        description="Cached PDF page rendering and visual diffs of render runs")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    render = commands.add_parser("render", help="Render a PDF, re-rasterizing only changed pages")
+    render.add_argument("pdf", help="Path to the PDF file")
+    render.add_argument("-o", "--output", default=None,
+                        help="Output directory (default: _temp-pdf-to-png/)")
+    render.add_argument("--width", type=int, default=1920,
+                        help="Image width in pixels (default: 1920)")
+    render.add_argument("--format", choices=["png", "jpg"], default="png",
+                        help="Image format (default: png)")
+    render.add_argument("--prefix", default="page", help="File name prefix (default: page)")
+    render.add_argument("--workers", type=int, default=None,
+                        help="Processes for rasterization (default: CPU count)")
+    render.add_argument("--diff", metavar="REPORT_DIR", default=None,
+                        help="Write heatmaps of changed pages vs the previous run")
+
+    diff = commands.add_parser("diff", help="Perceptual diff of two render folders")
+    diff.add_argument("old_dir", help="Earlier render folder")
+    diff.add_argument("new_dir", help="Later render folder")
+    diff.add_argument("-o", "--output", default=None,
+                      help="Report folder (default: NEW_DIR/_render-diff/)")
+    diff.add_argument("--tolerance", type=int, default=DIFF_TOLERANCE,
+                      help=f"Per-pixel luminance change 0-255 (default: {DIFF_TOLERANCE})")
+    diff.add_argument("--min-pixels", type=int, default=DIFF_MIN_PIXELS,
+                      help=f"Changed pixels for a changed page (default: {DIFF_MIN_PIXELS})")
+
+    args = parser.parse_args()
+
+    if args.command == "render":
+        files, _ = render_pdf_cached(args.pdf, args.output, args.width, args.format,
+                                     args.workers, args.prefix, args.diff)
+        print(f"\nDone! {len(files)} pages in: {os.path.dirname(files[0]) if files else '-'}")
+    else:
+        report = diff_renders(args.old_dir, args.new_dir, args.output,
+                              args.tolerance, args.min_pixels)
+        sys.exit(1 if report["changed"] or report["added"] or report["removed"] else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,517 @@
+"""
+PPTX Layout Preview
+
+Headless preview of a generated .pptx for Linux / CI, where pptx_to_images.py
+(PowerPoint COM) is not available.  Each slide is drawn with Pillow as a
+wireframe: shape bounding boxes, table grids and text wrapped with estimated
+line breaks.  Shapes whose estimated extent runs past the slide edges or into
+the footer area are outlined in red and listed in the report.
+
+The estimate is deliberately simple (greedy word wrap on Calibri advance
+widths from font_metrics, or an average character width without fontTools;
+1.2 x font size line height; table rows grown to fit their wrapped cell
+text), so it is fast enough to run on every build: a 60-slide deck takes well
+under a few seconds, and --no-images skips drawing for a pure overflow check.
+
+Usage:
+    python pptx_preview.py deck.pptx
+    python pptx_preview.py deck.pptx -o preview_folder --width 1280
+    python pptx_preview.py deck.pptx --format jpg         # faster to write
+    python pptx_preview.py deck.pptx --no-images          # overflow check only
+    python pptx_preview.py deck.pptx --footer 0.9         # footer zone height (in)
+
+Output:
+    Creates a folder (default: _temp-pptx-preview/ next to the input file) with:
+        slide_01.png, slide_02.png, ...
+    Exit code is 1 when any shape overflows, so it can gate a build.
+
+Requirements:
+    pip install python-pptx Pillow  (fonttools for Calibri/Carlito widths)
+"""
+
+import argparse
+import os
+import sys
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+
+from PIL import Image, ImageDraw, ImageFont
+from pptx import Presentation
+from pptx.enum.shapes import MSO_SHAPE_TYPE, PP_PLACEHOLDER
+from pptx.enum.text import MSO_AUTO_SIZE
+from pptx.util import Emu, Pt
+
+import font_metrics
+
+EMU_PER_INCH = 914400
+
+# Placeholders PowerPoint draws in the footer band (slide number, footer, date)
+FOOTER_PLACEHOLDERS = {PP_PLACEHOLDER.FOOTER, PP_PLACEHOLDER.SLIDE_NUMBER,
+                       PP_PLACEHOLDER.DATE}
+
+# Footer band height used when the layout has no footer placeholders; matches
+# the bottom margin add_table_to_slide keeps on slides without a template
+DEFAULT_FOOTER_INCHES = 0.4
+
+# Font size assumed for runs whose size is inherited from the layout/master
+DEFAULT_FONT_PT = 18
+
+# Average character width in em, used when no font metrics are installed
+# (same value as md_to_pptx_converter._AVG_CHAR_EM)
+AVG_CHAR_EM = 0.52
+
+# Line height as a multiple of the font size (PowerPoint single spacing)
+LINE_SPACING = 1.2
+
+# Default text insets (bodyPr lIns/rIns 0.1", tIns/bIns 0.05")
+DEFAULT_INSET_X = 91440
+DEFAULT_INSET_Y = 45720
+
+# Overflows smaller than this (EMU, about 0.02") are rounding, not problems
+OVERFLOW_TOLERANCE = 18288
+
+_COLORS = {
+    "background": (255, 255, 255),
+    "slide": (90, 90, 90),
+    "shape": (150, 170, 200),
+    "picture": (230, 230, 230),
+    "table": (120, 140, 170),
+    "text": (40, 40, 40),
+    "footer": (255, 236, 200),
+    "overflow": (220, 30, 30),
+}
+
+
+@dataclass
+class OverflowIssue:
+    """One shape whose estimated extent leaves the usable slide area."""
+    slide_number: int
+    slide_title: str
+    shape_name: str
+    area: str        # 'slide bounds' or 'footer area'
+    edge: str        # 'right', 'bottom' or 'left'/'top' for negative offsets
+    amount: float    # Overflow in inches
+
+    def __str__(self):
+        title = f" '{self.slide_title}'" if self.slide_title else ""
+        return (f"Slide {self.slide_number}{title}: {self.shape_name} extends "
+                f"{self.amount:.2f}\" past the {self.edge} of the {self.area}")
+
+
+# ============================================
+# TEXT ESTIMATION
+# ============================================
+
+@lru_cache(maxsize=65_536)
+def _text_width(text: str, size_pt: float, bold: bool) -> float:
+    """Width of a single line of text in points."""
+    width = font_metrics.text_width(text, size_pt, bold=bold)
+    if width is None:
+        width = len(text) * size_pt * AVG_CHAR_EM
+    return width
+
+
+def _wrap(text: str, size_pt: float, bold: bool, max_width_pt: float) -> list[str]:
+    """
+    Greedy word wrap of one paragraph.
+
+    Words longer than a line are kept whole (PowerPoint breaks them, but the
+    line count is the same for the estimate).
+    """
+    if not text:
+        return [""]
+    lines = []
+    current = ""
+    for word in text.split(" "):
+        candidate = f"{current} {word}" if current else word
+        if current and _text_width(candidate, size_pt, bold) > max_width_pt:
+            lines.append(current)
+            current = word
+        else:
+            current = candidate
+    lines.append(current)
+    return lines
+
+
+def _paragraph_style(paragraph) -> tuple[float, bool]:
+    """Font size (pt) and bold flag of a paragraph, from its first sized run."""
+    size = paragraph.font.size
+    bold = bool(paragraph.font.bold)
+    for run in paragraph.runs:
+        if run.font.size is not None:
+            size = run.font.size
+            bold = bool(run.font.bold)
+            break
+    return (size.pt if size is not None else DEFAULT_FONT_PT), bold
+
+
+def layout_text(text_frame, width: int, insets: tuple = None) -> tuple[list[tuple], int]:
+    """
+    Estimate the wrapped lines of a text frame.
+
+    Args:
+        text_frame: python-pptx TextFrame
+        width: Width of the containing shape (EMU)
+        insets: (left, right, top, bottom) EMU, e.g. table cell margins;
+            default reads them from the text frame
+
+    Returns:
+        (lines, height): lines as (text, size_pt, bold, y, indent), with y
+        the offset from the top of the shape and indent the paragraph
+        indent (EMU), and the total text height in EMU including insets
+    """
+    if insets is None:
+        insets = (text_frame.margin_left, text_frame.margin_right,
+                  text_frame.margin_top, text_frame.margin_bottom)
+    inset_l, inset_r, inset_t, inset_b = (
+        default if value is None else value
+        for value, default in zip(insets, (DEFAULT_INSET_X, DEFAULT_INSET_X,
+                                           DEFAULT_INSET_Y, DEFAULT_INSET_Y)))
+    wrap = text_frame.word_wrap is not False
+
+    lines = []
+    y = inset_t
+    for paragraph in text_frame.paragraphs:
+        size_pt, bold = _paragraph_style(paragraph)
+        line_height = Pt(size_pt * LINE_SPACING)
+        if paragraph.space_before is not None:
+            y += paragraph.space_before
+        indent = Emu(int(EMU_PER_INCH * 0.375 * paragraph.level))
+        available = Emu(max(width - inset_l - inset_r - indent, EMU_PER_INCH // 4)).pt
+        text = "".join(run.text for run in paragraph.runs) or paragraph.text
+        wrapped = _wrap(text, size_pt, bold, available) if wrap else [text]
+        for line in wrapped:
+            lines.append((line, size_pt, bold, y, indent))
+            y += line_height
+        if paragraph.space_after is not None:
+            y += paragraph.space_after
+    return lines, y + inset_b
+
+
+def _table_layout(table) -> tuple[list[int], list[int], list]:
+    """
+    Column widths, estimated row heights and per-cell wrapped lines of a table.
+
+    A row is at least its stored height, and taller when the wrapped text of
+    any cell needs more room; this is how PowerPoint grows rows on open.
+    """
+    col_widths = [col.width for col in table.columns]
+    row_heights = []
+    cell_lines = []
+    for row in table.rows:
+        row_height = row.height
+        row_cells = []
+        for c, cell in enumerate(row.cells):
+            if c >= len(col_widths):
+                break
+            insets = (cell.margin_left, cell.margin_right, cell.margin_top, cell.margin_bottom)
+            lines, height = layout_text(cell.text_frame, col_widths[c], insets)
+            row_height = max(row_height, height)
+            row_cells.append((cell, lines))
+        row_heights.append(row_height)
+        cell_lines.append(row_cells)
+    return col_widths, row_heights, cell_lines
+
+
+# ============================================
+# SLIDE ANALYSIS
+# ============================================
+
+def _iter_shapes(shapes):
+    """Yield every shape, descending into groups."""
+    for shape in shapes:
+        if shape.shape_type == MSO_SHAPE_TYPE.GROUP:
+            yield from _iter_shapes(shape.shapes)
+        else:
+            yield shape
+
+
+def _is_footer_placeholder(shape) -> bool:
+    return shape.is_placeholder and shape.placeholder_format.type in FOOTER_PLACEHOLDERS
+
+
+def footer_top(slide, slide_height: int, footer_inches: float = None) -> int:
+    """
+    Top edge (EMU) of the footer band of a slide.
+
+    With footer_inches the band is that tall.  Otherwise it starts at the
+    highest footer / slide-number / date placeholder of the slide's layout
+    (falling back to the master), or DEFAULT_FOOTER_INCHES above the bottom.
+    """
+    if footer_inches is not None:
+        return slide_height - int(footer_inches * EMU_PER_INCH)
+    for source in (slide.slide_layout, slide.slide_layout.slide_master):
+        tops = [shape.top for shape in source.placeholders
+                if _is_footer_placeholder(shape) and shape.top is not None]
+        if tops:
+            return min(tops)
+    return slide_height - int(DEFAULT_FOOTER_INCHES * EMU_PER_INCH)
+
+
+def _slide_title(slide) -> str:
+    """Text of the slide's title placeholder, else of its first text shape."""
+    title = slide.shapes.title
+    if title is not None and title.has_text_frame and title.text_frame.text.strip():
+        return title.text_frame.text.strip().splitlines()[0]
+    for shape in slide.shapes:
+        if shape.has_text_frame and shape.text_frame.text.strip():
+            return shape.text_frame.text.strip().splitlines()[0]
+    return ""
+
+
+def _shape_extent(shape):
+    """
+    Estimated drawn extent of a shape and what to draw inside it.
+
+    Returns:
+        (left, top, right, bottom, content) in EMU, where content is
+        ('table', layout), ('text', lines), ('picture', None) or (None, None).
+        bottom includes text or table rows that outgrow the shape.
+    """
+    left, top = shape.left or 0, shape.top or 0
+    right, bottom = left + (shape.width or 0), top + (shape.height or 0)
+
+    if getattr(shape, "has_table", False) and shape.has_table:
+        layout = _table_layout(shape.table)
+        col_widths, row_heights, _ = layout
+        right = max(right, left + sum(col_widths))
+        bottom = max(bottom, top + sum(row_heights))
+        return left, top, right, bottom, ("table", layout)
+
+    if shape.shape_type == MSO_SHAPE_TYPE.PICTURE:
+        return left, top, right, bottom, ("picture", None)
+
+    if shape.has_text_frame and shape.text_frame.text.strip():
+        text_frame = shape.text_frame
+        lines, text_height = layout_text(text_frame, right - left)
+        # Shrink-on-overflow text is scaled by PowerPoint to fit the shape
+        if text_frame.auto_size != MSO_AUTO_SIZE.TEXT_TO_FIT_SHAPE:
+            bottom = max(bottom, top + text_height)
+        return left, top, right, bottom, ("text", lines)
+
+    return left, top, right, bottom, (None, None)
+
+
+def analyze_slide(slide, slide_number: int, slide_width: int, slide_height: int,
+                  footer_inches: float = None):
+    """
+    Estimate every shape's extent on one slide and collect overflows.
+
+    A shape is flagged for the slide bounds when it reaches past any slide
+    edge, and for the footer area when its content (text, table or picture)
+    starts above the footer band but ends inside it.  Background shapes
+    without content and the footer placeholders themselves are not checked
+    against the footer band.
+
+    Returns:
+        (shapes, issues, footer): shapes as (name, extent, flagged) tuples,
+        the OverflowIssue list, and the footer band top (EMU)
+    """
+    title = _slide_title(slide)
+    footer = footer_top(slide, slide_height, footer_inches)
+    issues = []
+    shapes = []
+
+    def flag(shape, area, edge, amount):
+        issues.append(OverflowIssue(slide_number, title, shape.name, area, edge,
+                                    amount / EMU_PER_INCH))
+
+    for shape in _iter_shapes(slide.shapes):
+        extent = _shape_extent(shape)
+        left, top, right, bottom, (kind, _) = extent
+        before = len(issues)
+
+        if right - slide_width > OVERFLOW_TOLERANCE:
+            flag(shape, "slide bounds", "right", right - slide_width)
+        if bottom - slide_height > OVERFLOW_TOLERANCE:
+            flag(shape, "slide bounds", "bottom", bottom - slide_height)
+        if -left > OVERFLOW_TOLERANCE:
+            flag(shape, "slide bounds", "left", -left)
+        if -top > OVERFLOW_TOLERANCE:
+            flag(shape, "slide bounds", "top", -top)
+
+        if (kind is not None and not _is_footer_placeholder(shape)
+                and top < footer and bottom - footer > OVERFLOW_TOLERANCE
+                and bottom <= slide_height + OVERFLOW_TOLERANCE):
+            flag(shape, "footer area", "top", bottom - footer)
+
+        shapes.append((shape.name, extent, len(issues) > before))
+
+    return shapes, issues, footer
+
+
+# ============================================
+# DRAWING
+# ============================================
+
+@lru_cache(maxsize=256)
+def _pil_font(size_px: int, bold: bool):
+    """Calibri/Carlito at a pixel size, or Pillow's bundled font."""
+    path = font_metrics.find_font_file("Calibri", bold)
+    size_px = max(size_px, 6)
+    if path:
+        try:
+            return ImageFont.truetype(path, size_px)
+        except OSError:
+            pass
+    return ImageFont.load_default(size=size_px)
+
+
+def _draw_lines(draw, lines, x0, y0, scale):
+    """Draw estimated text lines starting at (x0, y0) EMU; nothing is clipped."""
+    for text, size_pt, bold, y, indent in lines:
+        if not text:
+            continue
+        font = _pil_font(round(Pt(size_pt) * scale), bold)
+        x = (x0 + indent) * scale
+        draw.text((x, (y0 + y) * scale), text, fill=_COLORS["text"], font=font)
+
+
+def render_slide(shapes, footer: int, slide_width: int, slide_height: int,
+                 width: int) -> Image.Image:
+    """
+    Draw a wireframe preview of one analyzed slide.
+
+    The canvas extends below and to the right of the slide when shapes
+    overflow it, so the overflow stays visible; the slide outline marks the
+    real bounds and the shaded band marks the footer area.
+    """
+    scale = width / slide_width
+    max_right = max([slide_width] + [extent[2] for _, extent, _ in shapes])
+    max_bottom = max([slide_height] + [extent[3] for _, extent, _ in shapes])
+    canvas_w = round(max_right * scale) + 1
+    canvas_h = round(max_bottom * scale) + 1
+
+    image = Image.new("RGB", (canvas_w, canvas_h), _COLORS["background"])
+    draw = ImageDraw.Draw(image)
+    draw.rectangle([0, footer * scale, slide_width * scale, slide_height * scale],
+                   fill=_COLORS["footer"])
+
+    for _, (left, top, right, bottom, (kind, content)), flagged in shapes:
+        box = [left * scale, top * scale, right * scale, bottom * scale]
+        outline = _COLORS["overflow"] if flagged else _COLORS["shape"]
+
+        if kind == "picture":
+            draw.rectangle(box, fill=_COLORS["picture"], outline=outline)
+            draw.line(box, fill=_COLORS["shape"])
+            draw.line([box[0], box[3], box[2], box[1]], fill=_COLORS["shape"])
+        elif kind == "table":
+            col_widths, row_heights, cell_lines = content
+            y = top
+            for row_height, row_cells in zip(row_heights, cell_lines):
+                x = left
+                for c, (cell, lines) in enumerate(row_cells):
+                    cell_box = [x * scale, y * scale,
+                                (x + col_widths[c]) * scale, (y + row_height) * scale]
+                    draw.rectangle(cell_box, outline=_COLORS["table"])
+                    _draw_lines(draw, lines, x, y, scale)
+                    x += col_widths[c]
+                y += row_height
+            draw.rectangle(box, outline=outline, width=2 if flagged else 1)
+        else:
+            draw.rectangle(box, outline=outline, width=2 if flagged else 1)
+            if kind == "text":
+                _draw_lines(draw, content, left, top, scale)
+
+    draw.rectangle([0, 0, slide_width * scale, slide_height * scale],
+                   outline=_COLORS["slide"])
+    return image
+
+
+# ============================================
+# MAIN
+# ============================================
+
+def preview_presentation(pptx_path: str, output_dir: str = None, width: int = 1280,
+                         img_format: str = "png", draw_images: bool = True,
+                         footer_inches: float = None) -> tuple[list[OverflowIssue], list[str]]:
+    """
+    Preview every slide of a presentation and check it for overflow.
+
+    Args:
+        pptx_path: Path to the .pptx file
+        output_dir: Output directory (default: _temp-pptx-preview/ next to input)
+        width: Width of the slide area in the preview images, in pixels
+        img_format: Image format - 'png' or 'jpg'
+        draw_images: If False, only run the overflow check
+        footer_inches: Footer band height; default derives it from the layouts
+
+    Returns:
+        (issues, files): OverflowIssue list in slide order, and the preview
+        image paths (empty when draw_images is False)
+    """
+    pptx_path = os.path.abspath(pptx_path)
+    if not os.path.exists(pptx_path):
+        print(f"Error: File not found: {pptx_path}")
+        sys.exit(1)
+
+    prs = Presentation(pptx_path)
+    slide_width, slide_height = prs.slide_width, prs.slide_height
+    slide_count = len(prs.slides)
+
+    if draw_images:
+        if output_dir is None:
+            output_dir = os.path.join(os.path.dirname(pptx_path), "_temp-pptx-preview")
+        output_dir = os.path.abspath(output_dir)
+        os.makedirs(output_dir, exist_ok=True)
+
+    digits = max(2, len(str(slide_count)))
+    issues = []
+    files = []
+    for number, slide in enumerate(prs.slides, start=1):
+        shapes, slide_issues, footer = analyze_slide(slide, number, slide_width,
+                                                     slide_height, footer_inches)
+        issues.extend(slide_issues)
+        if draw_images:
+            image = render_slide(shapes, footer, slide_width, slide_height, width)
+            path = os.path.join(output_dir, f"slide_{number:0{digits}d}.{img_format}")
+            if img_format == "jpg":
+                image.save(path, quality=90)
+            else:
+                image.save(path, compress_level=1)  # flat wireframes; speed over size
+            files.append(path)
+
+    return issues, files
+
+
+def main():
+    """
+    Main execution function.
+    """
+    parser = argparse.ArgumentParser(
+        description="Headless wireframe preview and overflow check of a .pptx")
+    parser.add_argument("pptx", help="Path to the .pptx file")
+    parser.add_argument("-o", "--output", default=None,
+                        help="Output directory (default: _temp-pptx-preview/)")
+    parser.add_argument("--width", type=int, default=1280,
+                        help="Slide width in pixels (default: 1280)")
+    parser.add_argument("--format", choices=["png", "jpg"], default="png",
+                        help="Image format (default: png)")
+    parser.add_argument("--no-images", action="store_true",
+                        help="Only check for overflow; do not write preview images")
+    parser.add_argument("--footer", type=float, default=None, metavar="INCHES",
+                        help="Footer band height (default: from the layout's footer "
+                             f"placeholders, else {DEFAULT_FOOTER_INCHES})")
+
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    issues, files = preview_presentation(args.pptx, args.output, args.width, args.format,
+                                         not args.no_images, args.footer)
+    elapsed = time.perf_counter() - start
+
+    if files:
+        print(f"Wrote {len(files)} preview(s) to: {os.path.dirname(files[0])}")
+    if issues:
+        print(f"{len(issues)} overflow(s):")
+        for issue in issues:
+            print(f"  {issue}")
+    else:
+        print("No overflow found")
+    print(f"Checked in {elapsed:.2f}s")
+    sys.exit(1 if issues else 0)
+
+
+if __name__ == "__main__":
+    main()
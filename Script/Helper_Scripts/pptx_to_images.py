@@ -10,14 +10,19 @@ Usage:
     python pptx_to_images.py input.pptx -o output_folder
     python pptx_to_images.py input.pptx --width 1920
     python pptx_to_images.py input.pptx --format jpg
+    python pptx_to_images.py input.pptx --cache [--diff report_folder]
 
 Output:
     Creates a folder (default: _temp-pptx-to-png/ next to the input file) with:
         slide_01.png, slide_02.png, ...
 
+With --cache the deck is saved as PDF and rendered with PyMuPDF through
+page_render_cache.py, so only slides that changed since the previous --cache
+run are re-rendered; --diff also writes heatmaps of the changed slides.
+
 Requirements:
     - Windows with Microsoft PowerPoint installed
-    - pip install comtypes Pillow
+    - pip install comtypes Pillow  (--cache also needs PyMuPDF; --diff also numpy)
 """
 
 import argparse
@@ -29,8 +34,74 @@ import time
 from pathlib import Path
 
 
+def _save_as_pdf_via_powerpoint(pptx_path: str, pdf_path: str) -> None:
+    """Save a presentation as PDF through PowerPoint's COM interface."""
+    comtypes.CoInitialize()
+    powerpoint = None
+    presentation = None
+    
+    try:
+        powerpoint = comtypes.client.CreateObject("PowerPoint.Application")
+        presentation = powerpoint.Presentations.Open(
+            pptx_path,
+            ReadOnly=True,
+            Untitled=False,
+            WithWindow=False
+        )
+        presentation.SaveAs(pdf_path, 32)  # ppSaveAsPDF = 32
+        print(f"Found {presentation.Slides.Count} slide(s)")
+    except comtypes.COMError as e:
+        print(f"\nCOM Error: {e}")
+        print("Make sure Microsoft PowerPoint is installed.")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\nError: {e}")
+        sys.exit(1)
+    finally:
+        try:
+            if presentation:
+                presentation.Close()
+        except Exception:
+            pass
+        try:
+            if powerpoint:
+                powerpoint.Quit()
+        except Exception:
+            pass
+        comtypes.CoUninitialize()
+
+
+def _export_slides_cached(pptx_path: str, output_dir: str, width: int,
+                          img_format: str, diff_dir: str = None) -> list[str]:
+    """
+    Export slides through a PDF, re-rendering only slides that changed.
+    
+    PowerPoint saves the deck as PDF; page_render_cache then renders only
+    the slides whose PDF content differs from the previous cached run.
+    """
+    # PyMuPDF and numpy are only needed for --cache
+    from page_render_cache import render_pdf_cached
+    
+    pdf_path = os.path.join(output_dir, "_temp_render.pdf")
+    _save_as_pdf_via_powerpoint(pptx_path, pdf_path)
+    
+    try:
+        exported_files, _ = render_pdf_cached(pdf_path, output_dir, width, img_format,
+                                              prefix="slide", diff_dir=diff_dir)
+    finally:
+        try:
+            os.remove(pdf_path)
+        except OSError:
+            pass
+    
+    print()
+    print(f"Done! {len(exported_files)} slides exported to: {output_dir}")
+    return exported_files
+
+
 def export_slides(pptx_path: str, output_dir: str = None, 
-                  width: int = 1920, img_format: str = "png") -> list[str]:
+                  width: int = 1920, img_format: str = "png",
+                  use_cache: bool = False, diff_dir: str = None) -> list[str]:
     """
     Export all slides from a .pptx file to individual images.
     
@@ -39,6 +110,9 @@ def export_slides(pptx_path: str, output_dir: str = None,
         output_dir: Output directory (default: _temp-pptx-to-png/)
         width: Width of exported images in pixels (height auto-calculated)
         img_format: Image format - 'png' or 'jpg'
+        use_cache: Render via PDF and re-render only slides that changed
+                   since the last cached run (see page_render_cache)
+        diff_dir: With use_cache, write heatmaps of changed slides to this folder
     
     Returns:
         List of paths to the exported image files
@@ -66,6 +140,9 @@ def export_slides(pptx_path: str, output_dir: str = None,
     print(f"Format: {img_format.upper()}")
     print()
     
+    if use_cache:
+        return _export_slides_cached(pptx_path, output_dir, width, img_format, diff_dir)
+    
     # Initialize COM
     comtypes.CoInitialize()
     powerpoint = None
@@ -147,6 +224,7 @@ Examples:
     python pptx_to_images.py presentation.pptx -o my_slides
     python pptx_to_images.py presentation.pptx --width 2560
     python pptx_to_images.py presentation.pptx --format jpg
+    python pptx_to_images.py presentation.pptx --cache --diff _diff
         """
     )
     
@@ -157,10 +235,15 @@ Examples:
                         help="Image width in pixels (default: 1920)")
     parser.add_argument("--format", choices=["png", "jpg"], default="png",
                         help="Image format (default: png)")
+    parser.add_argument("--cache", action="store_true", default=False,
+                        help="Render via PDF, re-rendering only slides changed since the last --cache run")
+    parser.add_argument("--diff", metavar="REPORT_DIR", default=None,
+                        help="Write heatmaps of slides changed since the last run (implies --cache)")
     
     args = parser.parse_args()
     
-    export_slides(args.input, args.output, args.width, args.format)
+    export_slides(args.input, args.output, args.width, args.format,
+                  args.cache or args.diff is not None, args.diff)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,152 @@
+"""
+Table Metrics
+
+Per-cell text measurements shared by the table layout code in md_to_docx.py
+(_compute_column_widths) and md_to_pptx_converter.py (_calculate_column_widths,
+_estimate_natural_table_width and the font-size search in add_table_to_slide).
+
+Every cell's markdown is stripped and measured once into NumPy arrays (rendered
+length, longest word, bold flag), so the column-width solvers work on whole
+columns with array reductions instead of re-stripping each cell for every
+column pass and font size.  Both converters render the same inline markup
+(see inline_format), so a cell is stripped the same way for either and metrics
+are memoized per table: a table measured for the report is reused for the deck.
+
+Widths measured from real font files (see font_metrics) are available through
+em_widths() / word_em_widths(); both return None when no font metrics are
+installed, and callers then fall back to character counts.
+
+Usage:
+    from table_metrics import table_metrics
+    metrics = table_metrics(rows, num_cols)
+    natural_chars = metrics.column_max(metrics.length)
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+import font_metrics
+from inline_format import visible_text
+
+
+class TableMetrics:
+    """
+    Per-cell measurements of one table (header row first).
+
+    Attributes:
+        num_rows: Number of rows, including the header row
+        num_cols: Number of columns
+        text: (num_rows, num_cols) object array of visible cell text (inline
+              markup stripped as inline_format lexes it; '' when missing)
+        present: bool array, True where the source row has a cell in that column
+        length: int64 array of rendered character counts
+        longest_word: int64 array of the longest whitespace-delimited word
+        bold: bool array, True for header cells and cells containing **bold**
+    """
+
+    def __init__(self, rows, num_cols):
+        self.num_rows = len(rows)
+        self.num_cols = num_cols
+        shape = (self.num_rows, num_cols)
+
+        self.text = np.full(shape, '', dtype=object)
+        self.present = np.zeros(shape, dtype=bool)
+        self.length = np.zeros(shape, dtype=np.int64)
+        self.longest_word = np.zeros(shape, dtype=np.int64)
+        self.bold = np.zeros(shape, dtype=bool)
+        self._matches = {}
+        self._measured = {}
+
+        for row_idx, row in enumerate(rows):
+            for col_idx, raw in enumerate(row[:num_cols]):
+                text = visible_text(raw)
+                self.text[row_idx, col_idx] = text
+                self.present[row_idx, col_idx] = True
+                self.length[row_idx, col_idx] = len(text)
+                self.longest_word[row_idx, col_idx] = max(map(len, text.split()), default=0)
+                self.bold[row_idx, col_idx] = row_idx == 0 or '**' in raw
+
+        for values in (self.text, self.present, self.length, self.longest_word, self.bold):
+            values.flags.writeable = False
+
+    def column_max(self, values, body_only=False):
+        """Column-wise maximum of a per-cell array (0 for empty columns)."""
+        if body_only:
+            values = values[1:]
+        return values.max(axis=0, initial=0)
+
+    def _measure(self, kind, font):
+        key = (kind, font)
+        if key not in self._measured:
+            widths = None
+            if font_metrics.available(font):
+                widths = np.zeros(self.text.shape)
+                for (row_idx, col_idx), text in np.ndenumerate(self.text):
+                    if not text:
+                        continue
+                    bold = bool(self.bold[row_idx, col_idx])
+                    if kind == 'text':
+                        widths[row_idx, col_idx] = font_metrics.em_width(text, font, bold)
+                    else:
+                        widths[row_idx, col_idx] = max(
+                            (font_metrics.em_width(word, font, bold) for word in text.split()),
+                            default=0.0,
+                        )
+                widths.flags.writeable = False
+            self._measured[key] = widths
+        return self._measured[key]
+
+    def em_widths(self, font='Calibri'):
+        """
+        Per-cell single-line widths in em (points at a 1 pt font size).
+
+        Bold cells are measured with the bold face.
+
+        Returns:
+            np.ndarray of float64, or None when font metrics are unavailable
+        """
+        return self._measure('text', font)
+
+    def word_em_widths(self, font='Calibri'):
+        """Per-cell width of the widest word in em, or None without font metrics."""
+        return self._measure('word', font)
+
+    def matches(self, pattern):
+        """
+        Per-cell regex match flags on the stripped, whitespace-trimmed text.
+
+        Args:
+            pattern: Compiled regular expression (matched with .match)
+
+        Returns:
+            np.ndarray: bool array, False for missing cells; memoized per pattern
+        """
+        key = (pattern.pattern, pattern.flags)
+        if key not in self._matches:
+            flags = np.zeros(self.text.shape, dtype=bool)
+            for (row_idx, col_idx), text in np.ndenumerate(self.text):
+                if self.present[row_idx, col_idx] and pattern.match(text.strip()):
+                    flags[row_idx, col_idx] = True
+            flags.flags.writeable = False
+            self._matches[key] = flags
+        return self._matches[key]
+
+
+@lru_cache(maxsize=256)
+def _cached_metrics(rows, num_cols):
+    return TableMetrics(rows, num_cols)
+
+
+def table_metrics(rows, num_cols):
+    """
+    Return (memoized) metrics for a table, shared by the DOCX and PPTX layouts.
+
+    Args:
+        rows: List of rows (header first), each a list of raw markdown cell strings
+        num_cols: Number of columns to measure
+
+    Returns:
+        TableMetrics: Shared instance; treat its arrays as read-only
+    """
+    return _cached_metrics(tuple(map(tuple, rows)), num_cols)
@@ -9,26 +9,15 @@ Date: 2026-01-15
 """
 
 import pandas as pd
-import numpy as np
 import os
+import sys
 from pathlib import Path
 
+# The crosswalk engine lives with the active scripts one level up
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-def clean_numeric_column(series):
-    """
-    Clean numeric columns by removing commas and converting to float.
-    Handle missing values appropriately.
-    
-    Args:
-        series: pandas Series with numeric data (possibly as strings with commas)
-    
-    Returns:
-        pandas Series with cleaned numeric values
-    """
-    if series.dtype == 'object':
-        # Remove commas and convert to numeric
-        return pd.to_numeric(series.str.replace(',', ''), errors='coerce')
-    return pd.to_numeric(series, errors='coerce')
+from hs_crosswalk import build_hs_sctg_map, compute_container_ratios
+from us_trade_io import load_trade_data
 
 
 def load_data(base_path):
@@ -52,22 +41,9 @@ def load_data(base_path):
     commodity_hs_df = pd.read_excel(commodity_dict_path, sheet_name='Commodity_HS')
     commodity_sctg2_df = pd.read_excel(commodity_dict_path, sheet_name='Commodity_SCTG2')
     
-    # Load Port-level Imports.csv
+    # Load Port-level Imports.csv (value/weight columns parsed as numbers at read time)
     print(f"  Reading {port_imports_path}")
-    port_imports_df = pd.read_csv(port_imports_path)
-    
-    # Clean numeric columns in port_imports_df
-    print("  Cleaning numeric columns...")
-    numeric_columns = [
-        'Vessel Customs Value (Gen) ($US)',
-        'Customs Containerized Vessel Value (Gen) ($US)',
-        'Vessel SWT (Gen) (kg)',
-        'Containerized Vessel SWT (Gen) (kg)'
-    ]
-    
-    for col in numeric_columns:
-        if col in port_imports_df.columns:
-            port_imports_df[col] = clean_numeric_column(port_imports_df[col])
+    port_imports_df = load_trade_data(port_imports_path)
     
     print(f"  Loaded Commodity_HS: {commodity_hs_df.shape[0]} rows")
     print(f"  Loaded Commodity_SCTG2: {commodity_sctg2_df.shape[0]} rows")
@@ -76,90 +52,28 @@ def load_data(base_path):
     return commodity_hs_df, commodity_sctg2_df, port_imports_df
 
 
-def extract_hs_code(commodity_str):
+def process_commodity_hs(commodity_hs_df, hs_ratios):
     """
-    Extract 2-digit HS code from commodity string.
-    
-    Args:
-        commodity_str: String like "02 Meat And Edible Meat Offal"
-    
-    Returns:
-        int: 2-digit HS code (e.g., 2)
-    """
-    if pd.isna(commodity_str):
-        return None
-    
-    # Extract first 2 characters and convert to int
-    try:
-        hs_code = int(str(commodity_str).split()[0])
-        return hs_code
-    except (ValueError, IndexError):
-        return None
-
-
-def process_commodity_hs(commodity_hs_df, port_imports_df):
-    """
-    Process Commodity_HS sheet: match HS codes and calculate container ratios.
+    Process Commodity_HS sheet: match HS codes and attach container ratios.
     
     Args:
         commodity_hs_df: DataFrame with HS commodity information
-        port_imports_df: DataFrame with port-level import data
+        hs_ratios: HS-level ratios from hs_crosswalk.compute_container_ratios
     
     Returns:
         DataFrame: Updated commodity_hs_df with new ratio columns
     """
     print("\nProcessing Commodity_HS sheet...")
     
-    # Extract HS code from port imports commodity column
-    port_imports_df['HS_Code_Extracted'] = port_imports_df['Commodity'].apply(extract_hs_code)
-    
-    # Group by HS code and sum the values
-    hs_aggregated = port_imports_df.groupby('HS_Code_Extracted').agg({
-        'Vessel Customs Value (Gen) ($US)': 'sum',
-        'Customs Containerized Vessel Value (Gen) ($US)': 'sum',
-        'Vessel SWT (Gen) (kg)': 'sum',
-        'Containerized Vessel SWT (Gen) (kg)': 'sum'
-    }).reset_index()
-    
-    # Rename for clarity
-    hs_aggregated.columns = [
-        'HS_Code',
-        'Total_Vessel_Value',
-        'Total_Containerized_Value',
-        'Total_Vessel_Weight',
-        'Total_Containerized_Weight'
-    ]
-    
-    # Merge with commodity_hs_df
+    # Crosswalk codes keep leading zeros ("02"); the dictionary stores integers
+    hs_ratios = hs_ratios.assign(HS_Code=hs_ratios['HS_Code'].astype(int))
+    
     commodity_hs_df = commodity_hs_df.merge(
-        hs_aggregated,
+        hs_ratios[['HS_Code', 'Container_Ratio_Value', 'Container_Ratio_Tons']],
         on='HS_Code',
         how='left'
     )
     
-    # Calculate ratios
-    # Container_Ratio_Value
-    commodity_hs_df['Container_Ratio_Value'] = np.where(
-        commodity_hs_df['Total_Vessel_Value'] > 0,
-        commodity_hs_df['Total_Containerized_Value'] / commodity_hs_df['Total_Vessel_Value'],
-        np.nan
-    )
-    
-    # Container_Ratio_Tons
-    commodity_hs_df['Container_Ratio_Tons'] = np.where(
-        commodity_hs_df['Total_Vessel_Weight'] > 0,
-        commodity_hs_df['Total_Containerized_Weight'] / commodity_hs_df['Total_Vessel_Weight'],
-        np.nan
-    )
-    
-    # Drop intermediate columns
-    commodity_hs_df = commodity_hs_df.drop(columns=[
-        'Total_Vessel_Value',
-        'Total_Containerized_Value',
-        'Total_Vessel_Weight',
-        'Total_Containerized_Weight'
-    ])
-    
     # Count matches
     matched_count = commodity_hs_df['Container_Ratio_Value'].notna().sum()
     print(f"  Matched {matched_count} out of {len(commodity_hs_df)} HS codes")
@@ -167,78 +81,25 @@ def process_commodity_hs(commodity_hs_df, port_imports_df):
     return commodity_hs_df
 
 
-def process_commodity_sctg2(commodity_hs_df, commodity_sctg2_df, port_imports_df):
+def process_commodity_sctg2(commodity_sctg2_df, sctg_ratios):
     """
-    Process Commodity_SCTG2 sheet: map HS to SCTG2, aggregate, and calculate ratios.
+    Process Commodity_SCTG2 sheet: attach container ratios aggregated from HS to SCTG2.
     
     Args:
-        commodity_hs_df: DataFrame with HS commodity information (includes HS to SCTG2 mapping)
         commodity_sctg2_df: DataFrame with SCTG2 commodity information
-        port_imports_df: DataFrame with port-level import data
+        sctg_ratios: SCTG2-level ratios from hs_crosswalk.compute_container_ratios
     
     Returns:
         DataFrame: Updated commodity_sctg2_df with new ratio columns
     """
     print("\nProcessing Commodity_SCTG2 sheet...")
     
-    # Extract HS code from port imports
-    port_imports_df['HS_Code_Extracted'] = port_imports_df['Commodity'].apply(extract_hs_code)
-    
-    # Merge port imports with HS to SCTG2 mapping
-    port_with_sctg = port_imports_df.merge(
-        commodity_hs_df[['HS_Code', 'SCTG_Code']],
-        left_on='HS_Code_Extracted',
-        right_on='HS_Code',
-        how='left'
-    )
-    
-    # Group by SCTG_Code and sum
-    sctg_aggregated = port_with_sctg.groupby('SCTG_Code').agg({
-        'Vessel Customs Value (Gen) ($US)': 'sum',
-        'Customs Containerized Vessel Value (Gen) ($US)': 'sum',
-        'Vessel SWT (Gen) (kg)': 'sum',
-        'Containerized Vessel SWT (Gen) (kg)': 'sum'
-    }).reset_index()
-    
-    # Rename for clarity
-    sctg_aggregated.columns = [
-        'SCTG_Code',
-        'Total_Vessel_Value',
-        'Total_Containerized_Value',
-        'Total_Vessel_Weight',
-        'Total_Containerized_Weight'
-    ]
-    
-    # Merge with commodity_sctg2_df
     commodity_sctg2_df = commodity_sctg2_df.merge(
-        sctg_aggregated,
+        sctg_ratios[['SCTG_Code', 'Container_Ratio_Value', 'Container_Ratio_Tons']],
         on='SCTG_Code',
         how='left'
     )
     
-    # Calculate ratios
-    # Container_Ratio_Value
-    commodity_sctg2_df['Container_Ratio_Value'] = np.where(
-        commodity_sctg2_df['Total_Vessel_Value'] > 0,
-        commodity_sctg2_df['Total_Containerized_Value'] / commodity_sctg2_df['Total_Vessel_Value'],
-        np.nan
-    )
-    
-    # Container_Ratio_Tons
-    commodity_sctg2_df['Container_Ratio_Tons'] = np.where(
-        commodity_sctg2_df['Total_Vessel_Weight'] > 0,
-        commodity_sctg2_df['Total_Containerized_Weight'] / commodity_sctg2_df['Total_Vessel_Weight'],
-        np.nan
-    )
-    
-    # Drop intermediate columns
-    commodity_sctg2_df = commodity_sctg2_df.drop(columns=[
-        'Total_Vessel_Value',
-        'Total_Containerized_Value',
-        'Total_Vessel_Weight',
-        'Total_Containerized_Weight'
-    ])
-    
     # Count matches
     matched_count = commodity_sctg2_df['Container_Ratio_Value'].notna().sum()
     print(f"  Matched {matched_count} out of {len(commodity_sctg2_df)} SCTG2 codes")
@@ -290,11 +151,17 @@ def main():
     # Load data
     commodity_hs_df, commodity_sctg2_df, port_imports_df = load_data(base_path)
     
+    # Compute HS and SCTG2 ratios in a single grouped pass over the port imports
+    hs_ratios, sctg_ratios = compute_container_ratios(
+        port_imports_df,
+        hs_sctg_map=build_hs_sctg_map(commodity_hs_df),
+    )
+    
     # Process Commodity_HS
-    commodity_hs_df = process_commodity_hs(commodity_hs_df, port_imports_df)
+    commodity_hs_df = process_commodity_hs(commodity_hs_df, hs_ratios)
     
     # Process Commodity_SCTG2
-    commodity_sctg2_df = process_commodity_sctg2(commodity_hs_df, commodity_sctg2_df, port_imports_df)
+    commodity_sctg2_df = process_commodity_sctg2(commodity_sctg2_df, sctg_ratios)
     
     # Save results
     save_results(commodity_hs_df, commodity_sctg2_df, base_path)
@@ -5,12 +5,23 @@ This script analyzes the FAF Hawaii data to produce summary statistics for SICT
 including share of Honolulu Harbor (scoped to SICT cargo types: Containers, RO/RO,
 Break-Bulk) and top commodities by tonnage.
 
+The result frames are saved to SICT_Analysis_Results.xlsx, with percentages
+rounded to two decimals, and cached as Parquet at full precision, where
+build_deliverables.py reads them to fill in the report and slide numbers.
+
 Author: Adithya Ajith
 Date: 2026-02-04
 """
 
+import hashlib
+import shutil
+from pathlib import Path
+
+import numpy as np
 import pandas as pd
 
+from pier_tensor import PierTensor
+
 # Import shared constants and paths from the processing script
 from process_FAF_Region import (
     PROCESSED_DATA_DIR,
@@ -25,6 +36,27 @@ PIER_OPERATIONS_PATH = PROCESSED_DATA_DIR / "Honolulu Harbor Pier Operations and
 # Output file
 OUTPUT_PATH = PROCESSED_DATA_DIR / "SICT_Analysis_Results.xlsx"
 
+# Result frames are also cached here as Parquet (one file per sheet), keyed by
+# the workbook's size and modification time, so decks can be rebuilt from the
+# unrounded results without reading the workbook (see build_deliverables.py)
+RESULTS_CACHE_DIR = PROCESSED_DATA_DIR / "SICT_Results_Cache"
+
+# Bump when the result frames change shape so stale cache files are ignored
+RESULTS_CACHE_VERSION = 2
+
+# Percentage columns are rounded to this many decimals in the workbook only
+PERCENT_COLUMNS = ['SICT_Share_Tons_Pct', 'SICT_Share_Value_Pct', 'Pct_of_Total']
+WORKBOOK_DECIMALS = 2
+
+# Sheets of the results workbook, in order
+RESULT_SHEETS = [
+    'Pier_Proportions',
+    'SICT_Share_Total',
+    'SICT_Share_by_Commodity',
+    'TopCommodities_FAF_Tons',
+    'TopCommodities_Scaled_Tons',
+]
+
 # Constants
 TOP_N = 5
 
@@ -60,6 +92,134 @@ def load_pier_proportions():
     return df
 
 
+def _kernel_inputs(distribution, measures):
+    """
+    Integer keys and measure arrays for build_sict_kernel.
+    
+    A long frame is read column by column: only commodity and cargo type are
+    factorized, and is_SICT is a single comparison against SICT_PIER_VALUE, so
+    no PierTensor is built just to be reduced once.  A PierTensor supplies its
+    coordinates directly.
+    
+    Args:
+        distribution: Long pier distribution frame or PierTensor
+        measures: Measure names to read (missing ones are skipped)
+    
+    Returns:
+        tuple: (commodity labels, cargo_type labels, commodity codes,
+                cargo_type codes, is_SICT int array, dict of measure -> float64 array)
+    """
+    if isinstance(distribution, PierTensor):
+        sict_code = distribution.axes['pier'].get_indexer([SICT_PIER_VALUE])[0]
+        is_sict = (distribution.coords['pier'] == sict_code).astype(np.int64)
+        values = {}
+        for name in measures:
+            try:
+                values[name] = distribution.measure(name)
+            except ValueError:
+                continue
+        return (distribution.axes['commodity'], distribution.axes['cargo_type'],
+                distribution.coords['commodity'], distribution.coords['cargo_type'],
+                is_sict, values)
+    
+    axes = []
+    for column in ['SCTG2_Commodity', 'cargo_type']:
+        codes, labels = pd.factorize(distribution[column], sort=False)
+        if (codes < 0).any():
+            raise ValueError(f"Pier distribution has missing values in column '{column}'.")
+        axes.append((codes.astype(np.int64, copy=False), pd.Index(labels, name=column)))
+    (commodity_codes, commodity_labels), (cargo_codes, cargo_labels) = axes
+    is_sict = (distribution['Pier'] == SICT_PIER_VALUE).to_numpy(dtype=np.int64)
+    
+    values = {}
+    for name in measures:
+        if name in distribution.columns:
+            column = distribution[name].to_numpy(dtype=np.float64)
+            # Missing measures count as 0, as in a groupby sum
+            values[name] = np.nan_to_num(column, nan=0.0) if np.isnan(column).any() else column
+    return commodity_labels, cargo_labels, commodity_codes, cargo_codes, is_sict, values
+
+
+def build_sict_kernel(df_honolulu_piers, tonnage_scale=None):
+    """
+    Aggregate a pier distribution in one pass, keyed by (commodity, cargo_type, is_SICT).
+    
+    Every share and top-N table is derived from this grouped result, so the long
+    frame is only scanned once.
+    
+    Args:
+        df_honolulu_piers: DataFrame (or PierTensor) with Honolulu_Piers data; a
+                           SICT-only frame (SICT_Piers_FAF / SICT_Piers_byPortTons)
+                           also works
+        tonnage_scale: Optional Series of SICT tonnage scale factors indexed by
+                       (SCTG2_Commodity, cargo_type), used to add a scaled_tons
+                       column for the SICT cells
+    
+    Returns:
+        pd.DataFrame: Indexed by (SCTG2_Commodity, cargo_type, is_SICT), sorted by
+                      commodity, with tons_2024, current_value_2024, rows (entry
+                      count) and, when available, scaled_tons
+    """
+    commodities, cargo_types, commodity_codes, cargo_codes, is_sict, values = _kernel_inputs(
+        df_honolulu_piers, ['tons_2024', 'current_value_2024', 'scaled_tons']
+    )
+    
+    # Single pass: one flat key per entry, then one bincount per measure
+    flat = commodity_codes * len(cargo_types)
+    flat += cargo_codes
+    flat *= 2
+    flat += is_sict
+    size = len(commodities) * len(cargo_types) * 2
+    columns = {
+        'tons_2024': np.bincount(flat, weights=values['tons_2024'], minlength=size),
+        'current_value_2024': np.bincount(flat, weights=values['current_value_2024'], minlength=size),
+        'rows': np.bincount(flat, minlength=size),
+    }
+    if 'scaled_tons' in values:
+        columns['scaled_tons'] = np.bincount(flat, weights=values['scaled_tons'], minlength=size)
+    
+    index = pd.MultiIndex.from_product(
+        [commodities, cargo_types, [False, True]],
+        names=['SCTG2_Commodity', 'cargo_type', 'is_SICT'],
+    )
+    kernel = pd.DataFrame(columns, index=index)
+    kernel = kernel[kernel['rows'] > 0].sort_index(level='SCTG2_Commodity', sort_remaining=False)
+    
+    if tonnage_scale is not None:
+        scale = tonnage_scale.reindex(kernel.index.droplevel('is_SICT')).to_numpy()
+        sict_rows = kernel.index.get_level_values('is_SICT')
+        kernel['scaled_tons'] = np.where(sict_rows, kernel['tons_2024'].to_numpy() * scale, 0.0)
+    
+    return kernel
+
+
+def _as_sict_kernel(data):
+    """Return data as a SICT kernel, aggregating a pier distribution frame if needed."""
+    if isinstance(data, pd.DataFrame) and data.index.names == ['SCTG2_Commodity', 'cargo_type', 'is_SICT']:
+        return data
+    return build_sict_kernel(data)
+
+
+def _sict_cells(kernel):
+    """Kernel rows for SICT pier entries only."""
+    return kernel[kernel.index.get_level_values('is_SICT')]
+
+
+def _commodity_totals(kernel, measure):
+    """
+    Sum a kernel measure by commodity (commodities with kernel rows only).
+    
+    Args:
+        kernel: SICT kernel (see build_sict_kernel)
+        measure: Measure column (e.g. 'tons_2024', 'scaled_tons')
+    
+    Returns:
+        pd.DataFrame: SCTG2_Commodity and measure columns, sorted by commodity
+    """
+    totals = kernel.groupby(level='SCTG2_Commodity', sort=True)[measure].sum()
+    return totals.reset_index()
+
+
 def analyze_sict_share_total(df_honolulu_piers):
     """
     Calculate overall SICT share of Honolulu Harbor.
@@ -68,7 +228,8 @@ def analyze_sict_share_total(df_honolulu_piers):
     (Containers, RO/RO, Break-Bulk) so that the comparison is like-for-like.
     
     Args:
-        df_honolulu_piers: DataFrame with Honolulu_Piers data
+        df_honolulu_piers: DataFrame (or PierTensor) with Honolulu_Piers data, or
+                           its SICT kernel
         
     Returns:
         pd.DataFrame: Single row with total share statistics
@@ -76,17 +237,19 @@ def analyze_sict_share_total(df_honolulu_piers):
     print("\nCalculating SICT share (total)...")
     print(f"  - Scoped to SICT cargo types: {sorted(SICT_CARGO_TYPES)}")
     
+    kernel = _as_sict_kernel(df_honolulu_piers)
+    
     # Filter to only the cargo types SICT handles
-    df_scoped = df_honolulu_piers[df_honolulu_piers['cargo_type'].isin(SICT_CARGO_TYPES)]
+    scoped = kernel[kernel.index.get_level_values('cargo_type').isin(SICT_CARGO_TYPES)]
     
     # Calculate Honolulu totals (scoped)
-    honolulu_total_tons = df_scoped['tons_2024'].sum()
-    honolulu_total_value = df_scoped['current_value_2024'].sum()
+    honolulu_total_tons = scoped['tons_2024'].sum()
+    honolulu_total_value = scoped['current_value_2024'].sum()
     
     # Calculate SICT totals (scoped)
-    df_sict = df_scoped[df_scoped['Pier'] == SICT_PIER_VALUE]
-    sict_total_tons = df_sict['tons_2024'].sum()
-    sict_total_value = df_sict['current_value_2024'].sum()
+    sict = _sict_cells(scoped)
+    sict_total_tons = sict['tons_2024'].sum()
+    sict_total_value = sict['current_value_2024'].sum()
     
     # Calculate percentages
     sict_share_tons_pct = (sict_total_tons / honolulu_total_tons * 100) if honolulu_total_tons > 0 else 0
@@ -95,10 +258,10 @@ def analyze_sict_share_total(df_honolulu_piers):
     result = pd.DataFrame([{
         'Honolulu_Total_Tons': honolulu_total_tons,
         'SICT_Total_Tons': sict_total_tons,
-        'SICT_Share_Tons_Pct': round(sict_share_tons_pct, 2),
+        'SICT_Share_Tons_Pct': sict_share_tons_pct,
         'Honolulu_Total_Value': honolulu_total_value,
         'SICT_Total_Value': sict_total_value,
-        'SICT_Share_Value_Pct': round(sict_share_value_pct, 2)
+        'SICT_Share_Value_Pct': sict_share_value_pct
     }])
     
     print(f"  - Honolulu total tons (scoped): {honolulu_total_tons:,.0f}")
@@ -113,36 +276,32 @@ def analyze_sict_share_by_commodity(df_honolulu_piers):
     Calculate SICT share by commodity.
     
     Args:
-        df_honolulu_piers: DataFrame with Honolulu_Piers data
+        df_honolulu_piers: DataFrame (or PierTensor) with Honolulu_Piers data, or
+                           its SICT kernel
         
     Returns:
         pd.DataFrame: Per-commodity share statistics
     """
     print("\nCalculating SICT share by commodity...")
     
-    # Group Honolulu totals by commodity
-    honolulu_by_commodity = df_honolulu_piers.groupby('SCTG2_Commodity').agg({
-        'tons_2024': 'sum',
-        'current_value_2024': 'sum'
-    }).reset_index()
-    honolulu_by_commodity.columns = ['SCTG2_Commodity', 'Honolulu_Tons', 'Honolulu_Value']
+    kernel = _as_sict_kernel(df_honolulu_piers)
+    measures = ['tons_2024', 'current_value_2024']
     
-    # Group SICT totals by commodity
-    df_sict = df_honolulu_piers[df_honolulu_piers['Pier'] == SICT_PIER_VALUE]
-    sict_by_commodity = df_sict.groupby('SCTG2_Commodity').agg({
-        'tons_2024': 'sum',
-        'current_value_2024': 'sum'
-    }).reset_index()
-    sict_by_commodity.columns = ['SCTG2_Commodity', 'SICT_Tons', 'SICT_Value']
+    # Honolulu and SICT totals by commodity (commodities with no SICT entries sum to 0)
+    honolulu_by_commodity = kernel.groupby(level='SCTG2_Commodity', sort=True)[measures].sum()
+    sict_by_commodity = _sict_cells(kernel).groupby(level='SCTG2_Commodity')[measures].sum()
+    sict_by_commodity = sict_by_commodity.reindex(honolulu_by_commodity.index, fill_value=0)
     
-    # Merge
-    result = honolulu_by_commodity.merge(sict_by_commodity, on='SCTG2_Commodity', how='left')
-    result['SICT_Tons'] = result['SICT_Tons'].fillna(0)
-    result['SICT_Value'] = result['SICT_Value'].fillna(0)
+    result = pd.DataFrame({
+        'Honolulu_Tons': honolulu_by_commodity['tons_2024'],
+        'Honolulu_Value': honolulu_by_commodity['current_value_2024'],
+        'SICT_Tons': sict_by_commodity['tons_2024'],
+        'SICT_Value': sict_by_commodity['current_value_2024'],
+    }).reset_index()
     
     # Calculate percentages
-    result['SICT_Share_Tons_Pct'] = (result['SICT_Tons'] / result['Honolulu_Tons'] * 100).round(2)
-    result['SICT_Share_Value_Pct'] = (result['SICT_Value'] / result['Honolulu_Value'] * 100).round(2)
+    result['SICT_Share_Tons_Pct'] = (result['SICT_Tons'] / result['Honolulu_Tons'] * 100)
+    result['SICT_Share_Value_Pct'] = (result['SICT_Value'] / result['Honolulu_Value'] * 100)
     
     # Reorder columns
     result = result[['SCTG2_Commodity', 'Honolulu_Tons', 'SICT_Tons', 'SICT_Share_Tons_Pct',
@@ -161,7 +320,8 @@ def get_top_commodities_faf(df_sict_faf, top_n=TOP_N):
     Get top commodities from SICT_Piers_FAF by tonnage.
     
     Args:
-        df_sict_faf: DataFrame with SICT_Piers_FAF data
+        df_sict_faf: DataFrame with SICT_Piers_FAF data, or the Honolulu_Piers
+                     SICT kernel (only its SICT cells are used)
         top_n: Number of top commodities to return
         
     Returns:
@@ -170,15 +330,13 @@ def get_top_commodities_faf(df_sict_faf, top_n=TOP_N):
     print("\nGetting top commodities from FAF model...")
     
     # Aggregate by commodity
-    by_commodity = df_sict_faf.groupby('SCTG2_Commodity').agg({
-        'tons_2024': 'sum',
-    }).reset_index()
+    by_commodity = _commodity_totals(_sict_cells(_as_sict_kernel(df_sict_faf)), 'tons_2024')
     
     total_tons = by_commodity['tons_2024'].sum()
     
     # Top by tonnage
     top_tons = by_commodity.nlargest(top_n, 'tons_2024').copy()
-    top_tons['Pct_of_Total'] = (top_tons['tons_2024'] / total_tons * 100).round(2)
+    top_tons['Pct_of_Total'] = (top_tons['tons_2024'] / total_tons * 100)
     top_tons = top_tons[['SCTG2_Commodity', 'tons_2024', 'Pct_of_Total']]
     top_tons.columns = ['SCTG2_Commodity', 'Tons', 'Pct_of_Total']
     
@@ -192,32 +350,52 @@ def get_top_commodities_scaled(df_sict_scaled, top_n=TOP_N):
     Get top commodities from scaled SICT data by tonnage.
     
     Args:
-        df_sict_scaled: DataFrame with SICT_Piers_byPortTons data
+        df_sict_scaled: DataFrame with SICT_Piers_byPortTons data, or a
+                        Honolulu_Piers SICT kernel built with tonnage_scale
         top_n: Number of top commodities to return
     
     Returns:
         pd.DataFrame: Top commodities by scaled tonnage
     """
     # Aggregate by commodity
-    by_commodity = df_sict_scaled.groupby('SCTG2_Commodity').agg({
-        'scaled_tons': 'sum',
-    }).reset_index()
+    by_commodity = _commodity_totals(_sict_cells(_as_sict_kernel(df_sict_scaled)), 'scaled_tons')
     
     total_tons = by_commodity['scaled_tons'].sum()
     
     # Top by tonnage
     top_tons = by_commodity.nlargest(top_n, 'scaled_tons').copy()
-    top_tons['Pct_of_Total'] = (top_tons['scaled_tons'] / total_tons * 100).round(2)
+    top_tons['Pct_of_Total'] = (top_tons['scaled_tons'] / total_tons * 100)
     top_tons = top_tons[['SCTG2_Commodity', 'scaled_tons', 'Pct_of_Total']]
     top_tons.columns = ['SCTG2_Commodity', 'Scaled_Tons', 'Pct_of_Total']
     
     return top_tons.reset_index(drop=True)
 
 
+def load_tonnage_scale(df_sict_byporttons):
+    """
+    Extract the SICT tonnage scale factor per (commodity, cargo_type).
+    
+    The factor is constant within each (SICT_Type, Containerized) group, which is
+    itself determined by commodity and cargo type.
+    
+    Args:
+        df_sict_byporttons: DataFrame with SICT_Piers_byPortTons data
+    
+    Returns:
+        pd.Series: tonnage_scale indexed by (SCTG2_Commodity, cargo_type)
+    """
+    return df_sict_byporttons.drop_duplicates(['SCTG2_Commodity', 'cargo_type']).set_index(
+        ['SCTG2_Commodity', 'cargo_type']
+    )['tonnage_scale']
+
+
 def save_results(results_dict, output_path):
     """
     Save all results to Excel file with multiple sheets.
     
+    Percentages are rounded to WORKBOOK_DECIMALS in the workbook; the Parquet
+    cache written next to it keeps the frames as computed.
+    
     Args:
         results_dict: Dictionary of sheet_name -> DataFrame
         output_path: Path for output Excel file
@@ -229,7 +407,8 @@ def save_results(results_dict, output_path):
         
         with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
             for sheet_name, df in results_dict.items():
-                df.to_excel(writer, sheet_name=sheet_name, index=False)
+                decimals = {col: WORKBOOK_DECIMALS for col in PERCENT_COLUMNS if col in df.columns}
+                df.round(decimals).to_excel(writer, sheet_name=sheet_name, index=False)
                 print(f"  - Saved {sheet_name}: {len(df)} rows")
         
         print(f"  - Successfully saved to {output_path}")
@@ -237,6 +416,135 @@ def save_results(results_dict, output_path):
     except Exception as e:
         print(f"Error saving results: {e}")
         raise
+    
+    write_results_cache(results_dict, output_path)
+
+
+def _results_cache_dir(workbook_path):
+    """Return the Parquet cache folder for a results workbook (keyed by path, size, mtime)."""
+    workbook_path = Path(workbook_path).resolve()
+    stat = workbook_path.stat()
+    key = f"{RESULTS_CACHE_VERSION}|{workbook_path}|{stat.st_size}|{stat.st_mtime_ns}"
+    digest = hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]
+    return RESULTS_CACHE_DIR / f"{workbook_path.stem}-{digest}"
+
+
+def write_results_cache(results_dict, workbook_path):
+    """
+    Cache result frames as Parquet next to the processed data.
+    
+    Args:
+        results_dict: Dictionary of sheet_name -> DataFrame (unrounded), as saved
+                      to workbook_path
+        workbook_path: Results workbook the frames were saved to
+    """
+    cache_dir = _results_cache_dir(workbook_path)
+    try:
+        # Drop cache folders left over from earlier versions of this workbook
+        if RESULTS_CACHE_DIR.exists():
+            for stale in RESULTS_CACHE_DIR.glob(f"{Path(workbook_path).stem}-*"):
+                if stale != cache_dir:
+                    shutil.rmtree(stale, ignore_errors=True)
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        for sheet_name, df in results_dict.items():
+            # Parquet columns hold one type; labels like Pier mix numbers and text
+            mixed = [col for col in df.columns
+                     if df[col].dtype == object and df[col].map(type).nunique() > 1]
+            if mixed:
+                df = df.astype({col: str for col in mixed})
+            df.to_parquet(cache_dir / f"{sheet_name}.parquet", index=False)
+    except ImportError:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+        print("  - Note: pyarrow/fastparquet not installed; results cache disabled")
+
+
+def load_cached_results(workbook_path=OUTPUT_PATH):
+    """
+    Load the full-precision result frames cached when the workbook was saved.
+    
+    The workbook itself holds rounded percentages, so it is not read here.
+    
+    Args:
+        workbook_path: Results workbook written by save_results
+    
+    Returns:
+        dict: sheet_name -> DataFrame, in RESULT_SHEETS order, or None when the
+              cache is missing, older than the workbook or cannot be read
+    """
+    if not Path(workbook_path).exists():
+        return None
+    cache_dir = _results_cache_dir(workbook_path)
+    if not all((cache_dir / f"{sheet}.parquet").exists() for sheet in RESULT_SHEETS):
+        return None
+    try:
+        return {sheet: pd.read_parquet(cache_dir / f"{sheet}.parquet") for sheet in RESULT_SHEETS}
+    except ImportError:
+        return None
+
+
+def run_analysis():
+    """
+    Load the input data and compute every result frame (nothing is saved).
+    
+    Returns:
+        dict: sheet_name -> DataFrame, in RESULT_SHEETS order
+    """
+    # Load input data
+    print("\nLoading input data...")
+    df_honolulu_piers = pd.read_excel(FAF_INPUT_PATH, sheet_name='Honolulu_Piers')
+    df_sict_byporttons = pd.read_excel(FAF_INPUT_PATH, sheet_name='SICT_Piers_byPortTons')
+    
+    print(f"  - Honolulu_Piers: {len(df_honolulu_piers):,} rows")
+    print(f"  - SICT_Piers_byPortTons: {len(df_sict_byporttons):,} rows")
+    
+    # Load pier proportions
+    df_pier_proportions = load_pier_proportions()
+    
+    # Single aggregation pass over Honolulu_Piers; SICT_Piers_FAF is the SICT
+    # slice of the same data and the scaled model only adds per-group factors
+    kernel = build_sict_kernel(df_honolulu_piers, load_tonnage_scale(df_sict_byporttons))
+    
+    # Calculate SICT share
+    df_share_total = analyze_sict_share_total(kernel)
+    df_share_by_commodity = analyze_sict_share_by_commodity(kernel)
+    
+    # Get top commodities from FAF model
+    print("\nAnalyzing FAF model top commodities...")
+    top_faf_tons = get_top_commodities_faf(kernel)
+    
+    # Get top commodities from scaled model
+    print("\nAnalyzing scaled model top commodities...")
+    top_scaled_tons = get_top_commodities_scaled(kernel)
+    print(f"  - Top {TOP_N} by tonnage: {list(top_scaled_tons['SCTG2_Commodity'])}")
+    
+    # Compile results
+    return {
+        'Pier_Proportions': df_pier_proportions,
+        'SICT_Share_Total': df_share_total,
+        'SICT_Share_by_Commodity': df_share_by_commodity,
+        'TopCommodities_FAF_Tons': top_faf_tons,
+        'TopCommodities_Scaled_Tons': top_scaled_tons,
+    }
+
+
+def print_presentation_summary(results):
+    """
+    Print the headline numbers used in the presentation.
+    
+    Args:
+        results: Dictionary of sheet_name -> DataFrame (see run_analysis)
+    """
+    df_share_total = results['SICT_Share_Total']
+    top_scaled_tons = results['TopCommodities_Scaled_Tons']
+    
+    print("\n--- SUMMARY FOR PRESENTATION ---")
+    print(f"\nSICT Share of Honolulu Harbor:")
+    print(f"  - Tonnage: {df_share_total['SICT_Share_Tons_Pct'].iloc[0]:.1f}%")
+    print(f"  - Value: {df_share_total['SICT_Share_Value_Pct'].iloc[0]:.1f}%")
+    
+    print(f"\nTop 5 Commodities by Tonnage (Scaled Model):")
+    for i, row in top_scaled_tons.iterrows():
+        print(f"  {i+1}. {row['SCTG2_Commodity']}: {row['Scaled_Tons']:,.0f} tons ({row['Pct_of_Total']:.1f}%)")
 
 
 def main():
@@ -248,40 +556,7 @@ def main():
     print("=" * 70)
     
     try:
-        # Load input data
-        print("\nLoading input data...")
-        df_honolulu_piers = pd.read_excel(FAF_INPUT_PATH, sheet_name='Honolulu_Piers')
-        df_sict_faf = pd.read_excel(FAF_INPUT_PATH, sheet_name='SICT_Piers_FAF')
-        df_sict_byporttons = pd.read_excel(FAF_INPUT_PATH, sheet_name='SICT_Piers_byPortTons')
-        
-        print(f"  - Honolulu_Piers: {len(df_honolulu_piers):,} rows")
-        print(f"  - SICT_Piers_FAF: {len(df_sict_faf):,} rows")
-        print(f"  - SICT_Piers_byPortTons: {len(df_sict_byporttons):,} rows")
-        
-        # Load pier proportions
-        df_pier_proportions = load_pier_proportions()
-        
-        # Calculate SICT share
-        df_share_total = analyze_sict_share_total(df_honolulu_piers)
-        df_share_by_commodity = analyze_sict_share_by_commodity(df_honolulu_piers)
-        
-        # Get top commodities from FAF model
-        print("\nAnalyzing FAF model top commodities...")
-        top_faf_tons = get_top_commodities_faf(df_sict_faf)
-        
-        # Get top commodities from scaled model
-        print("\nAnalyzing scaled model top commodities...")
-        top_scaled_tons = get_top_commodities_scaled(df_sict_byporttons)
-        print(f"  - Top {TOP_N} by tonnage: {list(top_scaled_tons['SCTG2_Commodity'])}")
-        
-        # Compile results
-        results = {
-            'Pier_Proportions': df_pier_proportions,
-            'SICT_Share_Total': df_share_total,
-            'SICT_Share_by_Commodity': df_share_by_commodity,
-            'TopCommodities_FAF_Tons': top_faf_tons,
-            'TopCommodities_Scaled_Tons': top_scaled_tons,
-        }
+        results = run_analysis()
         
         # Save results
         save_results(results, OUTPUT_PATH)
@@ -290,15 +565,7 @@ def main():
         print("Analysis completed successfully!")
         print("=" * 70)
         
-        # Print summary for presentation
-        print("\n--- SUMMARY FOR PRESENTATION ---")
-        print(f"\nSICT Share of Honolulu Harbor:")
-        print(f"  - Tonnage: {df_share_total['SICT_Share_Tons_Pct'].iloc[0]:.1f}%")
-        print(f"  - Value: {df_share_total['SICT_Share_Value_Pct'].iloc[0]:.1f}%")
-        
-        print(f"\nTop 5 Commodities by Tonnage (Scaled Model):")
-        for i, row in top_scaled_tons.iterrows():
-            print(f"  {i+1}. {row['SCTG2_Commodity']}: {row['Scaled_Tons']:,.0f} tons ({row['Pct_of_Total']:.1f}%)")
+        print_presentation_summary(results)
         
     except Exception as e:
         print(f"\n{'=' * 70}")
@@ -0,0 +1,202 @@
+"""
+SICT Aggregation Kernel Benchmark
+
+Times the SICT share and top-N tables on a large synthetic Honolulu_Piers-style
+distribution, three ways:
+
+    - the original per-table filter/groupby/merge passes over the long frames
+      (kept here as _result_tables_legacy, unchanged apart from the rounding that
+      now happens when the workbook is saved)
+    - the single-pass kernel from analyze_SICT_results, fed the long frame
+    - the single-pass kernel fed a PierTensor (coordinates already factorized)
+
+All three must produce the same tables.
+
+Usage:
+    python benchmark_SICT_kernel.py [--rows 2000000] [--repeats 3]
+
+Date: 2026-10-18
+"""
+
+import argparse
+import contextlib
+import io
+import time
+
+import numpy as np
+import pandas as pd
+
+from analyze_SICT_results import (
+    SICT_CARGO_TYPES,
+    TOP_N,
+    analyze_sict_share_by_commodity,
+    analyze_sict_share_total,
+    build_sict_kernel,
+    get_top_commodities_faf,
+    get_top_commodities_scaled,
+    load_tonnage_scale,
+)
+from pier_tensor import PierTensor
+from process_FAF_Region import SICT_PIER_VALUE
+
+
+def make_synthetic_distribution(n_rows, n_piers=40, n_commodities=43, seed=0):
+    """
+    Build a large synthetic Honolulu_Piers-style distribution for benchmarking.
+
+    Args:
+        n_rows: Number of rows
+        n_piers: Number of piers (one of which is the SICT pier)
+        n_commodities: Number of commodities
+        seed: Random seed
+
+    Returns:
+        tuple: (df_honolulu_piers, df_sict_faf, df_sict_byporttons)
+    """
+    rng = np.random.default_rng(seed)
+    piers = np.array([SICT_PIER_VALUE] + [f"Pier {i}" for i in range(1, n_piers)], dtype=object)
+    commodities = np.array([f"Commodity {i:02d}" for i in range(n_commodities)], dtype=object)
+    cargo_types = np.array(sorted(SICT_CARGO_TYPES | {"Dry-Bulk", "Liquid-Bulk"}), dtype=object)
+
+    df_honolulu_piers = pd.DataFrame({
+        'Pier': piers[rng.integers(0, n_piers, n_rows)],
+        'SCTG2_Commodity': commodities[rng.integers(0, n_commodities, n_rows)],
+        'cargo_type': cargo_types[rng.integers(0, len(cargo_types), n_rows)],
+        'tons_2024': rng.gamma(2.0, 50.0, n_rows),
+        'current_value_2024': rng.gamma(2.0, 5e4, n_rows),
+    })
+
+    df_sict_faf = df_honolulu_piers[df_honolulu_piers['Pier'] == SICT_PIER_VALUE].copy()
+    scale = 0.5 + (df_sict_faf['cargo_type'] == 'Containers') * 0.25
+    df_sict_byporttons = df_sict_faf.assign(tonnage_scale=scale, scaled_tons=df_sict_faf['tons_2024'] * scale)
+
+    return df_honolulu_piers, df_sict_faf, df_sict_byporttons
+
+
+def _result_tables_legacy(df_honolulu_piers, df_sict_faf, df_sict_byporttons, top_n=TOP_N):
+    """
+    Baseline: the original per-table filter/groupby/merge passes over the long
+    frames (share total, share by commodity, top FAF, top scaled).
+    """
+    # SICT share (total), scoped to SICT cargo types
+    df_scoped = df_honolulu_piers[df_honolulu_piers['cargo_type'].isin(SICT_CARGO_TYPES)]
+    honolulu_total_tons = df_scoped['tons_2024'].sum()
+    honolulu_total_value = df_scoped['current_value_2024'].sum()
+    df_sict = df_scoped[df_scoped['Pier'] == SICT_PIER_VALUE]
+    sict_total_tons = df_sict['tons_2024'].sum()
+    sict_total_value = df_sict['current_value_2024'].sum()
+    share_total = pd.DataFrame([{
+        'Honolulu_Total_Tons': honolulu_total_tons,
+        'SICT_Total_Tons': sict_total_tons,
+        'SICT_Share_Tons_Pct': sict_total_tons / honolulu_total_tons * 100,
+        'Honolulu_Total_Value': honolulu_total_value,
+        'SICT_Total_Value': sict_total_value,
+        'SICT_Share_Value_Pct': sict_total_value / honolulu_total_value * 100,
+    }])
+
+    # SICT share by commodity
+    honolulu_by_commodity = df_honolulu_piers.groupby('SCTG2_Commodity').agg({
+        'tons_2024': 'sum',
+        'current_value_2024': 'sum'
+    }).reset_index()
+    honolulu_by_commodity.columns = ['SCTG2_Commodity', 'Honolulu_Tons', 'Honolulu_Value']
+    df_sict = df_honolulu_piers[df_honolulu_piers['Pier'] == SICT_PIER_VALUE]
+    sict_by_commodity = df_sict.groupby('SCTG2_Commodity').agg({
+        'tons_2024': 'sum',
+        'current_value_2024': 'sum'
+    }).reset_index()
+    sict_by_commodity.columns = ['SCTG2_Commodity', 'SICT_Tons', 'SICT_Value']
+    by_commodity = honolulu_by_commodity.merge(sict_by_commodity, on='SCTG2_Commodity', how='left')
+    by_commodity['SICT_Tons'] = by_commodity['SICT_Tons'].fillna(0)
+    by_commodity['SICT_Value'] = by_commodity['SICT_Value'].fillna(0)
+    by_commodity['SICT_Share_Tons_Pct'] = by_commodity['SICT_Tons'] / by_commodity['Honolulu_Tons'] * 100
+    by_commodity['SICT_Share_Value_Pct'] = by_commodity['SICT_Value'] / by_commodity['Honolulu_Value'] * 100
+    by_commodity = by_commodity[['SCTG2_Commodity', 'Honolulu_Tons', 'SICT_Tons', 'SICT_Share_Tons_Pct',
+                                 'Honolulu_Value', 'SICT_Value', 'SICT_Share_Value_Pct']]
+    by_commodity = by_commodity.sort_values('SICT_Tons', ascending=False).reset_index(drop=True)
+
+    # Top commodities, FAF and scaled
+    top_tables = []
+    for df, measure, label in [(df_sict_faf, 'tons_2024', 'Tons'),
+                               (df_sict_byporttons, 'scaled_tons', 'Scaled_Tons')]:
+        totals = df.groupby('SCTG2_Commodity').agg({measure: 'sum'}).reset_index()
+        top = totals.nlargest(top_n, measure).copy()
+        top['Pct_of_Total'] = top[measure] / totals[measure].sum() * 100
+        top = top[['SCTG2_Commodity', measure, 'Pct_of_Total']]
+        top.columns = ['SCTG2_Commodity', label, 'Pct_of_Total']
+        top_tables.append(top.reset_index(drop=True))
+
+    return (share_total, by_commodity, *top_tables)
+
+
+def _result_tables_kernel(distribution, tonnage_scale):
+    """The four tables from one build_sict_kernel pass over distribution."""
+    kernel = build_sict_kernel(distribution, tonnage_scale)
+    return (
+        analyze_sict_share_total(kernel),
+        analyze_sict_share_by_commodity(kernel),
+        get_top_commodities_faf(kernel),
+        get_top_commodities_scaled(kernel),
+    )
+
+
+def run_benchmark(n_rows=2_000_000, repeats=3):
+    """
+    Compare the original per-table passes against the single-pass kernel.
+
+    Args:
+        n_rows: Rows in the synthetic pier distribution
+        repeats: Timing repetitions (best time is reported)
+    """
+    df_honolulu_piers, df_sict_faf, df_sict_byporttons = make_synthetic_distribution(n_rows)
+    tensor = PierTensor.from_frame(df_honolulu_piers)
+    tonnage_scale = load_tonnage_scale(df_sict_byporttons)
+    print(f"\nSynthetic Honolulu_Piers: {len(df_honolulu_piers):,} rows "
+          f"({len(df_sict_faf):,} SICT rows)")
+
+    methods = [
+        ('Original per-table', lambda: _result_tables_legacy(
+            df_honolulu_piers, df_sict_faf, df_sict_byporttons)),
+        ('Kernel, long frame', lambda: _result_tables_kernel(df_honolulu_piers, tonnage_scale)),
+        ('Kernel, PierTensor', lambda: _result_tables_kernel(tensor, tonnage_scale)),
+    ]
+
+    timings = {}
+    outputs = {}
+    for label, func in methods:
+        best = None
+        for _ in range(repeats):
+            with contextlib.redirect_stdout(io.StringIO()):
+                start = time.perf_counter()
+                outputs[label] = func()
+                elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        timings[label] = best
+
+    baseline = timings['Original per-table']
+    print(f"\n{'Method':<22}{'Time (s)':>10}{'Speedup':>10}")
+    for label, elapsed in timings.items():
+        print(f"{label:<22}{elapsed:>10.3f}{baseline / elapsed:>9.1f}x")
+
+    for label in list(outputs)[1:]:
+        for expected, actual in zip(outputs['Original per-table'], outputs[label]):
+            pd.testing.assert_frame_equal(expected, actual, check_exact=False, rtol=1e-9)
+    print("\n  - Kernel tables match the per-table results")
+
+
+def main():
+    """
+    Main execution function.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark the SICT single-pass aggregation kernel")
+    parser.add_argument('--rows', type=int, default=2_000_000,
+                        help="Synthetic distribution rows (default: 2,000,000)")
+    parser.add_argument('--repeats', type=int, default=3,
+                        help="Timing repetitions; the best time is reported (default: 3)")
+    args = parser.parse_args()
+
+    run_benchmark(args.rows, args.repeats)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,383 @@
+"""
+Deliverable Builder
+
+Fills the SICT report and slide markdown templates with the analysis result
+frames (SICT_Share_Total, TopCommodities_Scaled_Tons, ...) and converts the
+rendered markdown to .docx and .pptx in the same process, so the numbers in the
+deliverables always come from the latest results instead of being copied by hand
+from the console summary.
+
+The frames come from the Parquet results cache that analyze_SICT_results writes
+next to its workbook, or from a fresh analysis run held in memory (with
+--analyze, or when the cache is missing or older than the workbook).  The
+workbook itself is never read: its percentages are rounded to two decimals, and
+values are rounded only once, when a placeholder formats them.
+
+Template syntax (templates live in Templates/ as *.md.tmpl):
+
+    {{Frame.Column}}            first row of a result frame
+    {{Frame.Column[2]}}         row by position (0-based)
+    {{Frame.Column[Key]}}       row whose first column equals Key
+    {{Frame.Column:,.0f}}       any Python format spec; a trailing K or M divides
+                                by a thousand or a million ({{...:.1fM}} -> 4.1M),
+                                and @K or @M rounds to the nearest thousand or
+                                million first ({{...:,.0f@K}} -> 132,000)
+
+    ```table Frame [rows=N] [bold="Key"] [tag="text"]
+    | Rank | Commodity | Tons |
+    |------|-----------|------|
+    | {#} | {SCTG2_Commodity} | {Tons:,.0f} |
+    ```
+
+A table block copies its lines and repeats the last one for every row of the
+frame ({#} is the 1-based row number); rows=N keeps the first N rows,
+bold="Key" bolds the row whose first column equals Key, and tag="text" adds
+text after that row's first cell (e.g. tag="(SICT)").
+
+Fixed-point and percent specs round half up, as in the hand-written reports
+(0.005 formats as 1% with ".0%"), in placeholders and table rows alike.
+
+Usage:
+    python build_deliverables.py [--analyze] [--template template.potx]
+                                 [--markdown-dir DIR] [--no-cache]
+
+Date: 2026-10-18
+"""
+
+import argparse
+import logging
+import numbers
+import re
+import shlex
+import sys
+import time
+from decimal import ROUND_HALF_UP, Decimal, localcontext
+from pathlib import Path
+
+from analyze_SICT_results import (
+    OUTPUT_PATH as RESULTS_PATH,
+    load_cached_results,
+    run_analysis,
+    save_results,
+)
+from process_FAF_Region import BASE_DIR
+
+# The markdown converters live in Helper_Scripts
+sys.path.insert(0, str(Path(__file__).parent / "Helper_Scripts"))
+from md_to_docx import convert_markdown_to_docx  # noqa: E402
+from md_to_pptx_converter import convert_markdown_to_pptx  # noqa: E402
+
+TEMPLATES_DIR = BASE_DIR / "Templates"
+DELIVERABLES_DIR = BASE_DIR / "Deliverables"
+
+# (markdown template, output file); the output suffix picks the converter
+DELIVERABLES = [
+    (TEMPLATES_DIR / "SICT_Freight_Analysis_DOCX.md.tmpl", DELIVERABLES_DIR / "SICT_Freight_Analysis.docx"),
+    (TEMPLATES_DIR / "SICT_Freight_Analysis_PPTX.md.tmpl", DELIVERABLES_DIR / "SICT_Freight_Analysis.pptx"),
+]
+
+# {{Frame.Column}}, {{Frame.Column[row]}}, {{Frame.Column:spec}}
+PLACEHOLDER_RE = re.compile(
+    r'\{\{\s*(\w+)\.([^\[\]:}]+?)\s*(?:\[([^\]]*)\])?\s*(?::([^}]*))?\}\}'
+)
+
+# Opening line of a table block
+TABLE_BLOCK_RE = re.compile(r'^```table\s+(.*)$')
+
+# Format spec suffixes that scale the value first (K, M) or round it to that
+# unit (@K, @M)
+SCALE_SUFFIXES = {'K': 1000, 'M': 1000000}
+
+# Format types rounded half up instead of to the nearest binary float
+HALF_UP_TYPES = ('f', 'F', '%')
+
+
+def format_value(value, spec=''):
+    """
+    Format a frame value with a Python format spec.
+
+    A trailing K or M in the spec divides the value by a thousand or a million
+    and is written after the number (".1fM" formats 4084234 as "4.1M"); @K or
+    @M rounds it to the nearest thousand or million instead (",.0f@K" formats
+    131954 as "132,000").  Fixed-point and percent specs round half up (".0%"
+    formats 0.005 as "1%").
+
+    Args:
+        value: Cell value (number or text)
+        spec: Format spec without the leading colon
+
+    Returns:
+        str: The formatted value
+    """
+    spec = (spec or '').strip()
+    suffix = spec[-1:] if spec[-1:] in SCALE_SUFFIXES else ''
+    if suffix and spec[-2:-1] == '@':
+        unit = Decimal(SCALE_SUFFIXES[suffix])
+        units = (Decimal(str(float(value))) / unit).quantize(Decimal(1), rounding=ROUND_HALF_UP)
+        value = float(units * unit)
+        spec, suffix = spec[:-2], ''
+    elif suffix:
+        value = value / SCALE_SUFFIXES[suffix]
+        spec = spec[:-1]
+    if (isinstance(value, numbers.Real) and not isinstance(value, bool)
+            and spec[-1:] in HALF_UP_TYPES):
+        # The shortest repr of the float is the number the reader expects
+        with localcontext() as ctx:
+            ctx.rounding = ROUND_HALF_UP
+            return format(Decimal(str(float(value))), spec) + suffix
+    return format(value, spec) + suffix
+
+
+class _CellValue:
+    """Frame value in a table row template, formatted with format_value."""
+
+    def __init__(self, value):
+        self.value = value
+
+    def __format__(self, spec):
+        return format_value(self.value, spec)
+
+    def __str__(self):
+        return format_value(self.value)
+
+
+def _frame_row(frame, row):
+    """Return the row selected by a placeholder's [row] part (position or first-column key)."""
+    if row is None or row.strip() == '':
+        position = 0
+    elif re.fullmatch(r'-?\d+', row.strip()):
+        position = int(row)
+    else:
+        matches = frame.index[frame.iloc[:, 0].astype(str) == row.strip()]
+        if len(matches) == 0:
+            raise KeyError(f"no row with {frame.columns[0]} = {row.strip()!r}")
+        return frame.loc[matches[0]]
+    if not -len(frame) <= position < len(frame):
+        raise KeyError(f"row {position} out of range ({len(frame)} rows)")
+    return frame.iloc[position]
+
+
+def _frame(frames, name):
+    if name not in frames:
+        raise KeyError(f"unknown frame {name!r} (available: {', '.join(frames)})")
+    return frames[name]
+
+
+def _substitute(line, frames):
+    """Replace every {{Frame.Column[row]:spec}} placeholder in one line."""
+    def replace(match):
+        name, column, row, spec = match.groups()
+        frame = _frame(frames, name)
+        column = column.strip()
+        if column not in frame.columns:
+            raise KeyError(f"frame {name!r} has no column {column!r}")
+        return format_value(_frame_row(frame, row)[column], spec)
+
+    return PLACEHOLDER_RE.sub(replace, line)
+
+
+def _render_table_block(options, lines, frames):
+    """
+    Expand a table block: copy its lines and repeat the last one per frame row.
+
+    Args:
+        options: Text after ```table (frame name, rows=N, bold="Key", tag="text")
+        lines: Lines between the fences; the last one is the row template
+        frames: Dictionary of frame name -> DataFrame
+
+    Returns:
+        list of rendered markdown lines
+    """
+    args = shlex.split(options)
+    if not args:
+        raise ValueError("table block needs a frame name")
+    frame = _frame(frames, args[0])
+    settings = dict(arg.split('=', 1) for arg in args[1:] if '=' in arg)
+    if not lines:
+        raise ValueError("table block needs a row template line")
+
+    if 'rows' in settings:
+        frame = frame.head(int(settings['rows']))
+    bold_key = settings.get('bold')
+    tag = settings.get('tag')
+    if tag is not None and bold_key is None:
+        raise ValueError('tag="..." needs bold="Key" to pick its row')
+
+    rendered = [_substitute(line, frames) for line in lines[:-1]]
+    row_template = lines[-1]
+    for number, (_, row) in enumerate(frame.iterrows(), start=1):
+        values = {str(column): _CellValue(value) for column, value in row.items()}
+        values['#'] = number
+        text = row_template.format_map(values)
+        if bold_key is not None and str(row.iloc[0]) == bold_key:
+            cells = [cell.strip() for cell in text.strip().strip('|').split('|')]
+            if tag:
+                cells[0] = f"{cells[0]} {tag}"
+            text = '| ' + ' | '.join(f"**{cell}**" if cell else cell for cell in cells) + ' |'
+        rendered.append(text)
+    return rendered
+
+
+def render_template(text, frames, source_name="<template>"):
+    """
+    Fill a markdown template with result frame values.
+
+    Args:
+        text: Template markdown (see the module docstring for the syntax)
+        frames: Dictionary of frame name -> DataFrame
+        source_name: Template name used in error messages
+
+    Returns:
+        str: The rendered markdown
+
+    Raises:
+        ValueError: naming the template line of an unknown frame, column or
+                    row, an unclosed table block or a bad format spec
+    """
+    lines = text.split('\n')
+    out = []
+    i = 0
+    while i < len(lines):
+        line = lines[i]
+        block = TABLE_BLOCK_RE.match(line.strip())
+        try:
+            if block:
+                end = i + 1
+                while end < len(lines) and lines[end].strip() != '```':
+                    end += 1
+                if end == len(lines):
+                    raise ValueError("table block is not closed with ```")
+                out.extend(_render_table_block(block.group(1), lines[i + 1:end], frames))
+                i = end + 1
+                continue
+            out.append(_substitute(line, frames))
+        except (KeyError, ValueError, IndexError, TypeError) as e:
+            message = e.args[0] if isinstance(e, KeyError) and e.args else e
+            raise ValueError(f"{source_name}:{i + 1}: {message}") from e
+        i += 1
+    return '\n'.join(out)
+
+
+class _WarningCounter(logging.Handler):
+    """Count the warnings logged while one deliverable is converted."""
+
+    def __init__(self):
+        super().__init__(logging.WARNING)
+        self.count = 0
+
+    def emit(self, record):
+        self.count += 1
+
+
+def _save_markdown(markdown_path, markdown):
+    markdown_path.parent.mkdir(parents=True, exist_ok=True)
+    markdown_path.write_text(markdown, encoding='utf-8')
+    print(f"  - Rendered markdown saved to {markdown_path}")
+
+
+def build_deliverables(frames, template_path=None, markdown_dir=None,
+                       deliverables=DELIVERABLES):
+    """
+    Render every deliverable template and convert it to its output format.
+
+    Converter warnings and errors cite file:line in the rendered markdown
+    (table blocks shift the template's line numbers), so the rendered file is
+    saved next to the output whenever a conversion warns or fails.
+
+    Args:
+        frames: Dictionary of frame name -> DataFrame
+        template_path: PowerPoint template for the .pptx outputs (optional)
+        markdown_dir: Always write each rendered markdown file here (optional)
+        deliverables: (template, output) pairs; the output suffix picks the
+                      converter (.docx or .pptx)
+
+    Returns:
+        list of output paths
+    """
+    outputs = []
+    for template, output in deliverables:
+        template, output = Path(template), Path(output)
+        print(f"\nRendering {template.name}...")
+        markdown = render_template(template.read_text(encoding='utf-8'), frames, str(template))
+
+        # Converter messages name this path, written below only when needed
+        markdown_name = template.name.replace('.md.tmpl', '.md')
+        markdown_path = Path(markdown_dir or output.parent) / markdown_name
+        saved = markdown_dir is not None
+        if saved:
+            _save_markdown(markdown_path, markdown)
+
+        output.parent.mkdir(parents=True, exist_ok=True)
+        warnings = _WarningCounter()
+        logging.getLogger().addHandler(warnings)
+        try:
+            if output.suffix.lower() == '.docx':
+                convert_markdown_to_docx(str(markdown_path), str(output), markdown=markdown)
+            elif output.suffix.lower() == '.pptx':
+                convert_markdown_to_pptx(str(markdown_path), str(output), template_path,
+                                         markdown=markdown)
+            else:
+                raise ValueError(f"Unsupported deliverable type: {output}")
+        except Exception:
+            if not saved:
+                _save_markdown(markdown_path, markdown)
+            raise
+        finally:
+            logging.getLogger().removeHandler(warnings)
+
+        if warnings.count and not saved:
+            _save_markdown(markdown_path, markdown)
+        outputs.append(output)
+    return outputs
+
+
+def main():
+    """
+    Main execution function.
+    """
+    parser = argparse.ArgumentParser(
+        description="Fill the SICT deliverable templates with the analysis results "
+                    "and build the .docx and .pptx files")
+    parser.add_argument('--analyze', action='store_true',
+                        help="Re-run the SICT analysis (and save its results) instead of "
+                             "loading the saved results")
+    parser.add_argument('--template', '-t',
+                        help="PowerPoint template (.pptx or .potx) for the slides")
+    parser.add_argument('--markdown-dir',
+                        help="Always write the rendered markdown files to this folder "
+                             "(by default they are saved next to the outputs only when "
+                             "a conversion warns or fails)")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="Re-run the SICT analysis in memory (without saving it) even if "
+                             "the Parquet results cache is current")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+
+    print("=" * 70)
+    print("SICT Deliverable Builder")
+    print("=" * 70)
+
+    start = time.perf_counter()
+    frames = None
+    if not (args.analyze or args.no_cache):
+        frames = load_cached_results(RESULTS_PATH)
+        if frames is None:
+            print("\nResults cache is missing or older than the workbook; re-running the "
+                  "analysis (run analyze_SICT_results.py to refresh it)")
+    if frames is None:
+        frames = run_analysis()
+        if args.analyze:
+            save_results(frames, RESULTS_PATH)
+
+    outputs = build_deliverables(frames, args.template, args.markdown_dir)
+
+    print("\n" + "=" * 70)
+    print(f"Built {len(outputs)} deliverables in {time.perf_counter() - start:.1f}s:")
+    for output in outputs:
+        print(f"  - {output}")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,296 @@
+"""
+Container Ratio Panel Builder
+
+Builds a multi-port, multi-year containerization panel from any number of US Trade
+(USA Trade Online) import extracts.  Both port-level extracts ("Port" column) and
+state-level extracts ("State" column) are supported, with any mix of countries,
+years and HS detail levels.
+
+Each extract is streamed in chunks through the typed reader in us_trade_io
+(numeric columns parsed at read time, Parquet cache used when current) and every
+chunk is reduced to (geography, year, HS) totals before the next one is read, so
+memory stays bounded by the size of the result rather than the size of the inputs.
+
+Output (Processed_Data/Container_Ratio_Panel.xlsx):
+    HS_Panel     container ratios indexed by (Port, Year, HS_Code)
+    SCTG2_Panel  container ratios indexed by (Port, Year, SCTG_Code)
+
+The SCTG2 panel can be used to derive Containers_Proportion in Commodity_Dict per
+port and year (see derive_containers_proportion) instead of a single hand-entered
+value.
+
+Usage:
+    python container_ratio_panel.py [extract.csv ...] [--hs-digits 2]
+
+Date: 2026-10-18
+"""
+
+import argparse
+from pathlib import Path
+
+import pandas as pd
+
+from hs_crosswalk import (
+    COMMODITY_DICT_PATH,
+    TOTAL_COLUMNS,
+    US_TRADE_DIR,
+    add_ratio_columns,
+    load_hs_sctg_map,
+    parse_hs_codes,
+    resolve_measure_columns,
+)
+from process_FAF_Region import PROCESSED_DATA_DIR
+from us_trade_io import iter_trade_chunks
+
+# Output file
+OUTPUT_PATH = PROCESSED_DATA_DIR / "Container_Ratio_Panel.xlsx"
+
+# Rows per chunk when streaming extracts
+CHUNK_SIZE = 200_000
+
+# USA Trade label for the all-countries total row
+WORLD_TOTAL = "World Total"
+
+# Geography columns by extract type; state totals are labelled "<State> (State)"
+# to sit alongside USA Trade's "<Port>, <ST> (Port)" names in the Port index.
+GEOGRAPHY_COLUMNS = {
+    'Port': '{}',
+    'State': '{} (State)',
+}
+
+PANEL_KEYS = ['Port', 'Year']
+
+
+def _geography_column(columns):
+    """Return (column name, label format) for the extract's geography column."""
+    for column, label_format in GEOGRAPHY_COLUMNS.items():
+        if column in columns:
+            return column, label_format
+    raise ValueError(
+        f"US Trade extract has no geography column. Expected one of: {list(GEOGRAPHY_COLUMNS)}."
+    )
+
+
+def reduce_trade_chunk(chunk, hs_digits=2):
+    """
+    Reduce one chunk of a US Trade extract to (Port, Year, HS) totals.
+
+    World Total rows and individual-country rows are kept apart (via the
+    'Is_World_Total' flag) so they can be reconciled once all chunks are read.
+
+    Args:
+        chunk: Parsed DataFrame chunk from us_trade_io.iter_trade_chunks
+        hs_digits: HS detail level (2, 4, 6, 8 or 10)
+
+    Returns:
+        pd.DataFrame: Partial totals with PANEL_KEYS, HS_Code, HS2, Is_World_Total
+                      and the four canonical measure columns
+    """
+    geography_col, label_format = _geography_column(chunk.columns)
+    rename_map = resolve_measure_columns(chunk.columns)
+
+    codes = parse_hs_codes(chunk['Commodity'], hs_digits=hs_digits)
+
+    reduced = chunk[list(rename_map)].rename(columns=rename_map)
+    reduced['Port'] = chunk[geography_col].astype('string').str.strip().map(label_format.format)
+    reduced['Year'] = pd.to_numeric(
+        chunk['Time'].astype('string').str.extract(r'(\d{4})', expand=False),
+        errors='coerce'
+    ).astype('Int64')
+    reduced['HS_Code'] = codes['HS_Code']
+    reduced['HS2'] = codes['HS2']
+    if 'Country' in chunk.columns:
+        reduced['Is_World_Total'] = chunk['Country'].astype('string').str.strip().eq(WORLD_TOTAL).fillna(False)
+    else:
+        reduced['Is_World_Total'] = True
+
+    reduced = reduced.dropna(subset=['HS_Code', 'Year'])
+    group_keys = PANEL_KEYS + ['HS_Code', 'HS2', 'Is_World_Total']
+    return reduced.groupby(group_keys, sort=False, observed=True).sum().reset_index()
+
+
+def stream_trade_totals(paths, hs_digits=2, chunksize=CHUNK_SIZE):
+    """
+    Stream one or more US Trade extracts into combined (Port, Year, HS) totals.
+
+    Where an extract includes both per-country rows and the World Total row for the
+    same (Port, Year, HS) cell, the World Total row is used; otherwise the country
+    rows are summed.  Cells that appear in several files are summed.
+
+    Args:
+        paths: Iterable of CSV paths
+        hs_digits: HS detail level (2, 4, 6, 8 or 10)
+        chunksize: Rows per streamed chunk
+
+    Returns:
+        pd.DataFrame: Totals with PANEL_KEYS, HS_Code, HS2 and the measure columns
+    """
+    measures = list(TOTAL_COLUMNS)
+    file_totals = []
+
+    for path in paths:
+        print(f"  Streaming {Path(path).name}...")
+        partials = []
+        row_count = 0
+        for chunk in iter_trade_chunks(path, chunksize):
+            row_count += len(chunk)
+            partials.append(reduce_trade_chunk(chunk, hs_digits=hs_digits))
+
+        if not partials:
+            print("    - Empty extract, skipped")
+            continue
+
+        keys = PANEL_KEYS + ['HS_Code', 'HS2', 'Is_World_Total']
+        combined = pd.concat(partials, ignore_index=True).groupby(keys, sort=False).sum().reset_index()
+
+        # Prefer World Total rows; fall back to the sum of individual countries
+        world = combined[combined['Is_World_Total']]
+        countries = combined[~combined['Is_World_Total']]
+        cell_keys = PANEL_KEYS + ['HS_Code', 'HS2']
+        world_cells = pd.MultiIndex.from_frame(world[cell_keys])
+        countries = countries[~pd.MultiIndex.from_frame(countries[cell_keys]).isin(world_cells)]
+        resolved = pd.concat([world, countries], ignore_index=True)
+        resolved = resolved.groupby(cell_keys, sort=False)[measures].sum().reset_index()
+
+        file_totals.append(resolved)
+        print(f"    - {row_count:,} rows -> {len(resolved):,} (Port, Year, HS) cells")
+
+    if not file_totals:
+        raise ValueError("No US Trade rows were read from the given extracts.")
+
+    cell_keys = PANEL_KEYS + ['HS_Code', 'HS2']
+    return pd.concat(file_totals, ignore_index=True).groupby(cell_keys, sort=False)[measures].sum().reset_index()
+
+
+def build_container_ratio_panel(paths, hs_digits=2, hs_sctg_map=None, chunksize=CHUNK_SIZE):
+    """
+    Build the container-ratio cube from many US Trade extracts.
+
+    Args:
+        paths: Iterable of port-level and/or state-level US Trade CSV paths
+        hs_digits: HS detail level for the HS panel (2, 4, 6, 8 or 10)
+        hs_sctg_map: HS2 -> SCTG2 lookup (loaded from Commodity_Dict.xlsx when None)
+        chunksize: Rows per streamed chunk
+
+    Returns:
+        tuple: (hs_panel, sctg_panel) DataFrames indexed by (Port, Year, HS_Code)
+               and (Port, Year, SCTG_Code), with totals and ratio columns
+    """
+    if hs_sctg_map is None:
+        hs_sctg_map = load_hs_sctg_map()
+
+    totals = stream_trade_totals(paths, hs_digits=hs_digits, chunksize=chunksize)
+    totals = totals.rename(columns=TOTAL_COLUMNS)
+    totals['SCTG_Code'] = totals['HS2'].map(hs_sctg_map)
+    total_cols = list(TOTAL_COLUMNS.values())
+
+    hs_panel = totals.groupby(PANEL_KEYS + ['HS_Code'])[total_cols].sum()
+    hs_panel = add_ratio_columns(hs_panel)
+
+    unmapped = totals['SCTG_Code'].isna()
+    if unmapped.any():
+        print(f"  - Warning: {totals.loc[unmapped, 'HS2'].nunique()} HS chapters have no SCTG2 mapping")
+
+    sctg_panel = totals[~unmapped].groupby(PANEL_KEYS + ['SCTG_Code'])[total_cols].sum()
+    sctg_panel = add_ratio_columns(sctg_panel)
+
+    return hs_panel, sctg_panel
+
+
+def derive_containers_proportion(commodity_sctg2_df, sctg_panel, port, year, basis='tons'):
+    """
+    Derive Containers_Proportion per SCTG2 commodity for one port and year.
+
+    Commodities without trade data for that port/year keep their existing
+    (hand-entered) Containers_Proportion.
+
+    Args:
+        commodity_sctg2_df: Commodity_SCTG2 sheet from Commodity_Dict.xlsx
+        sctg_panel: SCTG2 panel from build_container_ratio_panel
+        port: Port label as it appears in the panel (e.g. "Honolulu, HI (Port)")
+        year: Calendar year
+        basis: 'tons' (Container_Ratio_Tons) or 'value' (Container_Ratio_Value)
+
+    Returns:
+        pd.DataFrame: Copy of commodity_sctg2_df with Containers_Proportion updated
+                      and a Containers_Proportion_Source column ('US Trade' or
+                      'Manual')
+    """
+    ratio_col = {'tons': 'Container_Ratio_Tons', 'value': 'Container_Ratio_Value'}.get(basis)
+    if ratio_col is None:
+        raise ValueError(f"Invalid basis '{basis}'. Expected 'tons' or 'value'.")
+
+    try:
+        ratios = sctg_panel.xs((port, year), level=['Port', 'Year'])[ratio_col]
+    except KeyError as e:
+        raise ValueError(f"No US Trade data for port '{port}' in {year}.") from e
+
+    result = commodity_sctg2_df.copy()
+    derived = result['SCTG_Code'].map(ratios)
+    result['Containers_Proportion_Source'] = derived.notna().map({True: 'US Trade', False: 'Manual'})
+    result['Containers_Proportion'] = derived.fillna(result['Containers_Proportion'])
+
+    return result
+
+
+def discover_trade_extracts(root=US_TRADE_DIR):
+    """Return every CSV extract under the US Trade data folder (sorted)."""
+    return sorted(Path(root).rglob('*.csv'))
+
+
+def save_panel(hs_panel, sctg_panel, output_path):
+    """
+    Save the HS and SCTG2 panels to Excel.
+
+    Args:
+        hs_panel: HS-level panel
+        sctg_panel: SCTG2-level panel
+        output_path: Path for the output Excel file
+    """
+    print(f"\nSaving panel to {output_path}...")
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
+        hs_panel.reset_index().to_excel(writer, sheet_name='HS_Panel', index=False)
+        sctg_panel.reset_index().to_excel(writer, sheet_name='SCTG2_Panel', index=False)
+
+    print(f"  - Saved HS_Panel: {len(hs_panel):,} rows")
+    print(f"  - Saved SCTG2_Panel: {len(sctg_panel):,} rows")
+
+
+def main():
+    """
+    Main execution function.
+    """
+    parser = argparse.ArgumentParser(description="Build a multi-port, multi-year container-ratio panel")
+    parser.add_argument('extracts', nargs='*', help=f"US Trade CSV extracts (default: every CSV under {US_TRADE_DIR})")
+    parser.add_argument('--hs-digits', type=int, default=2, help="HS detail level (default: 2)")
+    parser.add_argument('-o', '--output', default=str(OUTPUT_PATH), help="Output Excel path")
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("Container Ratio Panel Builder")
+    print("=" * 70)
+
+    paths = [Path(p) for p in args.extracts] or discover_trade_extracts()
+    print(f"\nReading {len(paths)} US Trade extract(s)...")
+
+    hs_panel, sctg_panel = build_container_ratio_panel(
+        paths,
+        hs_digits=args.hs_digits,
+        hs_sctg_map=load_hs_sctg_map(COMMODITY_DICT_PATH),
+    )
+
+    ports = hs_panel.index.get_level_values('Port').unique()
+    years = hs_panel.index.get_level_values('Year').unique()
+    print(f"\n  - Panel covers {len(ports)} port(s)/state(s) and {len(years)} year(s)")
+
+    save_panel(hs_panel, sctg_panel, Path(args.output))
+
+    print("\n" + "=" * 70)
+    print("Processing complete!")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+"""
+HS to SCTG2 Crosswalk Engine
+
+Reusable helpers for mapping US Trade (USA Trade Online) HS commodity rows onto
+the SCTG2 classification and computing containerization ratios (by value and
+tonnage) for both classifications.
+
+HS codes are parsed with a single vectorized string extract, so the same code
+path works for the 2-digit Honolulu extract and for HS6/HS10 extracts covering
+every US port.  The HS -> SCTG2 map is read from Commodity_Dict.xlsx once per
+process and cached.
+
+Date: 2026-10-18
+"""
+
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from process_FAF_Region import BASE_DIR, PROCESSED_DATA_DIR
+
+# Input files
+US_TRADE_DIR = BASE_DIR / "Raw_Data" / "US_Trade"
+PORT_IMPORTS_PATH = US_TRADE_DIR / "Port-level Imports.csv"
+STATE_IMPORTS_PATH = US_TRADE_DIR / "State Imports by HS Commodities.csv"
+COMMODITY_DICT_PATH = PROCESSED_DATA_DIR / "Commodity_Dict.xlsx"
+
+# Canonical measure names -> accepted source column headers.  The port-level and
+# state-level extracts label the total vessel value/weight slightly differently.
+MEASURE_COLUMNS = {
+    'vessel_value': ['Vessel Customs Value (Gen) ($US)', 'Vessel Value ($US)'],
+    'container_value': ['Customs Containerized Vessel Value (Gen) ($US)'],
+    'vessel_kg': ['Vessel SWT (Gen) (kg)', 'Vessel SWT (kg)'],
+    'container_kg': ['Containerized Vessel SWT (Gen) (kg)'],
+}
+
+# Output column names for the aggregated totals (matches the original
+# compute_container_ratios.py naming)
+TOTAL_COLUMNS = {
+    'vessel_value': 'Total_Vessel_Value',
+    'container_value': 'Total_Containerized_Value',
+    'vessel_kg': 'Total_Vessel_Weight',
+    'container_kg': 'Total_Containerized_Weight',
+}
+
+# Leading HS digits of a USA Trade commodity label, e.g. "02 Meat And ..." or
+# "0201100000 Carcasses And Half-carcasses ..."
+_HS_CODE_PATTERN = r'^\s*(\d{2,10})\b'
+
+VALID_HS_DIGITS = (2, 4, 6, 8, 10)
+
+
+def resolve_measure_columns(columns):
+    """
+    Map canonical measure names to the matching source column headers.
+
+    Args:
+        columns: Iterable of column names from a US Trade extract
+
+    Returns:
+        dict: Source column name -> canonical measure name
+    """
+    available = set(columns)
+    rename_map = {}
+    for measure, candidates in MEASURE_COLUMNS.items():
+        for candidate in candidates:
+            if candidate in available:
+                rename_map[candidate] = measure
+                break
+        else:
+            raise ValueError(
+                f"Missing column for measure '{measure}'. Expected one of: {candidates}."
+            )
+    return rename_map
+
+
+def parse_hs_codes(commodity, hs_digits=2):
+    """
+    Extract HS codes from USA Trade commodity labels in one vectorized pass.
+
+    Args:
+        commodity: pandas Series of labels like "02 Meat And Edible Meat Offal"
+        hs_digits: HS detail level to return (2, 4, 6, 8 or 10)
+
+    Returns:
+        pd.DataFrame: Columns 'HS_Code' (string code truncated to hs_digits, leading
+                      zeros kept) and 'HS2' (nullable integer chapter, used for the
+                      SCTG2 crosswalk)
+    """
+    if hs_digits not in VALID_HS_DIGITS:
+        raise ValueError(f"Invalid hs_digits {hs_digits}. Expected one of: {VALID_HS_DIGITS}.")
+
+    codes = commodity.astype('string').str.extract(_HS_CODE_PATTERN, expand=False)
+
+    # Rows coarser than the requested level (e.g. an HS2 row in an HS6 run)
+    # cannot be disaggregated and are dropped from the code column.
+    codes = codes.where(codes.str.len().fillna(0) >= hs_digits)
+
+    return pd.DataFrame({
+        'HS_Code': codes.str[:hs_digits],
+        'HS2': pd.to_numeric(codes.str[:2], errors='coerce').astype('Int64'),
+    }, index=commodity.index)
+
+
+def build_hs_sctg_map(commodity_hs_df):
+    """
+    Build the HS2 -> SCTG2 lookup from a Commodity_HS sheet.
+
+    Args:
+        commodity_hs_df: DataFrame with 'HS_Code' and 'SCTG_Code' columns
+
+    Returns:
+        pd.Series: SCTG_Code indexed by integer HS2 chapter
+    """
+    hs_map = commodity_hs_df[['HS_Code', 'SCTG_Code']].dropna(subset=['HS_Code'])
+    hs_map = hs_map.drop_duplicates(subset='HS_Code')
+    return pd.Series(
+        hs_map['SCTG_Code'].to_numpy(),
+        index=pd.Index(hs_map['HS_Code'].astype('int64'), name='HS2'),
+        name='SCTG_Code',
+    )
+
+
+@lru_cache(maxsize=None)
+def _load_hs_sctg_map_cached(path, mtime_ns):
+    commodity_hs_df = pd.read_excel(path, sheet_name='Commodity_HS')
+    return build_hs_sctg_map(commodity_hs_df)
+
+
+def load_hs_sctg_map(path=COMMODITY_DICT_PATH):
+    """
+    Load the HS2 -> SCTG2 lookup from Commodity_Dict.xlsx (cached per process).
+
+    The cache key includes the file modification time, so edits to the workbook
+    are picked up without restarting the interpreter.
+
+    Args:
+        path: Path to Commodity_Dict.xlsx
+
+    Returns:
+        pd.Series: SCTG_Code indexed by integer HS2 chapter
+    """
+    path = Path(path)
+    return _load_hs_sctg_map_cached(str(path), path.stat().st_mtime_ns).copy()
+
+
+def add_ratio_columns(df):
+    """Add value and tonnage container ratio columns computed from the aggregated totals."""
+    df['Container_Ratio_Value'] = np.where(
+        df['Total_Vessel_Value'] > 0,
+        df['Total_Containerized_Value'] / df['Total_Vessel_Value'],
+        np.nan
+    )
+    df['Container_Ratio_Tons'] = np.where(
+        df['Total_Vessel_Weight'] > 0,
+        df['Total_Containerized_Weight'] / df['Total_Vessel_Weight'],
+        np.nan
+    )
+    return df
+
+
+def compute_container_ratios(trade_df, hs_sctg_map=None, hs_digits=2, keys=(),
+                             keep_totals=False):
+    """
+    Compute HS and SCTG2 container ratios from a US Trade extract.
+
+    The raw rows are grouped exactly once, by keys + (HS_Code, SCTG_Code).  The HS
+    and SCTG2 tables are then rolled up from that (small) grouped result, so the
+    cost is linear in the number of trade rows at any HS detail level.
+
+    Args:
+        trade_df: DataFrame with a 'Commodity' column and the four numeric
+                  value/weight columns (already parsed as numbers)
+        hs_sctg_map: Series from build_hs_sctg_map/load_hs_sctg_map (loaded from
+                     Commodity_Dict.xlsx when None)
+        hs_digits: HS detail level for the HS table (2, 4, 6, 8 or 10)
+        keys: Extra grouping columns kept in both outputs (e.g. ('Port', 'Time'))
+        keep_totals: If True, keep the aggregated value/weight totals alongside
+                     the ratios
+
+    Returns:
+        tuple: (hs_ratios, sctg_ratios) DataFrames keyed by keys + HS_Code and
+               keys + SCTG_Code respectively
+    """
+    if hs_sctg_map is None:
+        hs_sctg_map = load_hs_sctg_map()
+
+    keys = list(keys)
+    rename_map = resolve_measure_columns(trade_df.columns)
+    measures = list(rename_map.values())
+
+    # Work on a narrow view; the caller's frame is never mutated
+    codes = parse_hs_codes(trade_df['Commodity'], hs_digits=hs_digits)
+    work = trade_df[keys + list(rename_map)].rename(columns=rename_map)
+    work['HS_Code'] = codes['HS_Code']
+    work['SCTG_Code'] = codes['HS2'].map(hs_sctg_map)
+
+    # Single grouped pass over the raw rows
+    grouped = work.groupby(keys + ['HS_Code', 'SCTG_Code'], dropna=False, sort=False, observed=True)[measures].sum()
+    grouped = grouped.rename(columns=TOTAL_COLUMNS).reset_index()
+
+    totals = list(TOTAL_COLUMNS.values())
+    hs_ratios = grouped.dropna(subset=['HS_Code']).groupby(keys + ['HS_Code'], sort=True, observed=True)[totals].sum()
+    sctg_ratios = grouped.dropna(subset=['SCTG_Code']).groupby(keys + ['SCTG_Code'], sort=True, observed=True)[totals].sum()
+
+    hs_ratios = add_ratio_columns(hs_ratios.reset_index())
+    sctg_ratios = add_ratio_columns(sctg_ratios.reset_index())
+
+    if not keep_totals:
+        hs_ratios = hs_ratios.drop(columns=totals)
+        sctg_ratios = sctg_ratios.drop(columns=totals)
+
+    return hs_ratios, sctg_ratios
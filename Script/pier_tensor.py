@@ -0,0 +1,274 @@
+"""
+Sparse Pier Allocation Tensor
+
+Holds the Honolulu pier distribution (Honolulu_Piers and the SICT sheets derived
+from it) as a sparse pier x commodity x cargo_type tensor in COO form, with an
+optional dense year axis for measures named like 'tons_2024' / 'tons_2025'.
+
+Each stored entry is one row of the long frame: integer coordinates into the pier,
+commodity and cargo-type axes plus its measure values.  Slicing is a boolean mask
+over the entries and marginal sums are a single np.bincount, so every reduction is
+O(nnz) regardless of how many (pier, cargo_type) combinations are zero.
+
+Date: 2026-10-18
+"""
+
+import re
+
+import numpy as np
+import pandas as pd
+
+# Tensor axis name -> long-frame column
+AXIS_COLUMNS = {
+    'pier': 'Pier',
+    'commodity': 'SCTG2_Commodity',
+    'cargo_type': 'cargo_type',
+}
+
+# Measures carrying a year suffix, e.g. "tons_2024" or "current_value_2024"
+_YEAR_MEASURE_PATTERN = re.compile(r'^(?P<base>.+)_(?P<year>\d{4})$')
+
+
+class PierTensor:
+    """
+    Sparse pier x commodity x cargo_type (x year) tensor.
+
+    Attributes:
+        axes: dict of axis name -> pd.Index of labels ('pier', 'commodity', 'cargo_type')
+        coords: dict of axis name -> int64 array (one coordinate per stored entry)
+        years: tuple of years for year-suffixed measures (empty when there are none)
+        data: dict of measure name -> float64 array; year-suffixed measures are stored
+              under their base name with shape (nnz, len(years)), all others with
+              shape (nnz,)
+        attrs: dict of column name -> array for non-numeric passthrough columns
+               (e.g. SICT_Type), kept so to_frame() round-trips the long frame
+        columns: original column order, used by to_frame()
+    """
+
+    def __init__(self, axes, coords, data, years=(), attrs=None, columns=None):
+        self.axes = axes
+        self.coords = coords
+        self.data = data
+        self.years = tuple(years)
+        self.attrs = attrs or {}
+        self.columns = list(columns) if columns is not None else self._default_columns()
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_frame(cls, df):
+        """
+        Build a tensor from a long pier distribution frame.
+
+        Args:
+            df: DataFrame with Pier, SCTG2_Commodity and cargo_type columns plus
+                numeric measure columns (tons_2024, current_value_2024, scaled_tons, ...)
+
+        Returns:
+            PierTensor: One stored entry per row, in row order
+        """
+        missing = [col for col in AXIS_COLUMNS.values() if col not in df.columns]
+        if missing:
+            raise ValueError(f"Pier distribution is missing axis column(s): {missing}.")
+
+        axes = {}
+        coords = {}
+        for axis, column in AXIS_COLUMNS.items():
+            codes, labels = pd.factorize(df[column], sort=False)
+            if (codes < 0).any():
+                raise ValueError(f"Pier distribution has missing values in column '{column}'.")
+            coords[axis] = codes.astype(np.int64)
+            axes[axis] = pd.Index(labels, name=column)
+
+        # Split numeric columns into year-suffixed measures and plain measures
+        yearly = {}
+        data = {}
+        attrs = {}
+        for column in df.columns:
+            if column in AXIS_COLUMNS.values():
+                continue
+            if not pd.api.types.is_numeric_dtype(df[column]):
+                attrs[column] = df[column].to_numpy()
+                continue
+            match = _YEAR_MEASURE_PATTERN.match(column)
+            if match:
+                yearly.setdefault(match['base'], {})[int(match['year'])] = column
+            else:
+                data[column] = df[column].to_numpy(dtype=np.float64)
+
+        years = sorted({year for columns in yearly.values() for year in columns})
+        for base, columns in yearly.items():
+            matrix = np.zeros((len(df), len(years)))
+            for position, year in enumerate(years):
+                if year in columns:
+                    matrix[:, position] = df[columns[year]].to_numpy(dtype=np.float64)
+            data[base] = matrix
+
+        return cls(axes, coords, data, years=years, attrs=attrs, columns=df.columns)
+
+    def _default_columns(self):
+        columns = list(AXIS_COLUMNS.values())
+        for name, values in self.data.items():
+            if values.ndim == 2:
+                columns.extend(f"{name}_{year}" for year in self.years)
+            else:
+                columns.append(name)
+        columns.extend(self.attrs)
+        return columns
+
+    # ------------------------------------------------------------------
+    # Basic properties
+    # ------------------------------------------------------------------
+
+    @property
+    def nnz(self):
+        """Number of stored (pier, commodity, cargo_type) entries."""
+        return len(self.coords['pier'])
+
+    @property
+    def shape(self):
+        """Dense shape (piers, commodities, cargo_types[, years])."""
+        shape = tuple(len(self.axes[axis]) for axis in AXIS_COLUMNS)
+        return shape + (len(self.years),) if self.years else shape
+
+    def measure(self, name, year=None):
+        """
+        Return one measure as a 1-D array over the stored entries.
+
+        Args:
+            name: Base name ('tons'), full column name ('tons_2024') or plain
+                  measure ('scaled_tons')
+            year: Year for a base-named yearly measure (optional when the tensor
+                  holds a single year)
+
+        Returns:
+            np.ndarray: float64 values, NaN treated as 0 (matching groupby sums);
+                        a view of the stored values (not a copy) when none are NaN
+        """
+        if name not in self.data:
+            match = _YEAR_MEASURE_PATTERN.match(name)
+            if match and match['base'] in self.data:
+                name, year = match['base'], int(match['year'])
+            else:
+                raise ValueError(f"Unknown measure '{name}'. Available: {sorted(self.data)}.")
+
+        values = self.data[name]
+        if values.ndim == 2:
+            if year is None:
+                if len(self.years) != 1:
+                    raise ValueError(f"Measure '{name}' spans years {self.years}; pass year=.")
+                year = self.years[0]
+            if year not in self.years:
+                raise ValueError(f"Year {year} not in tensor years {self.years}.")
+            values = values[:, self.years.index(year)]
+
+        if np.isnan(values).any():
+            values = np.nan_to_num(values, nan=0.0)
+        return values
+
+    # ------------------------------------------------------------------
+    # Slicing and reductions
+    # ------------------------------------------------------------------
+
+    def _axis_mask(self, axis, labels):
+        """Boolean entry mask for the given label(s) on one axis."""
+        if isinstance(labels, (str, int, float)) or np.isscalar(labels):
+            labels = [labels]
+        positions = self.axes[axis].get_indexer(list(labels))
+        selected = np.zeros(len(self.axes[axis]), dtype=bool)
+        selected[positions[positions >= 0]] = True
+        return selected[self.coords[axis]]
+
+    def select(self, **criteria):
+        """
+        Slice the tensor by axis labels.
+
+        Args:
+            **criteria: axis name -> label or iterable of labels, e.g.
+                        select(pier="51, 52, 53", cargo_type={"Containers", "RO/RO"})
+
+        Returns:
+            PierTensor: Entries matching every criterion (axes are unchanged)
+        """
+        mask = np.ones(self.nnz, dtype=bool)
+        for axis, labels in criteria.items():
+            if axis not in self.axes:
+                raise ValueError(f"Unknown axis '{axis}'. Expected one of: {list(self.axes)}.")
+            mask &= self._axis_mask(axis, labels)
+        return self._subset(mask)
+
+    def _subset(self, mask):
+        return PierTensor(
+            self.axes,
+            {axis: codes[mask] for axis, codes in self.coords.items()},
+            {name: values[mask] for name, values in self.data.items()},
+            years=self.years,
+            attrs={name: values[mask] for name, values in self.attrs.items()},
+            columns=self.columns,
+        )
+
+    def total(self, measure='tons', year=None):
+        """Sum of a measure over every stored entry."""
+        return float(self.measure(measure, year).sum())
+
+    def marginal(self, axes, measure='tons', year=None):
+        """
+        Sum a measure onto one or more axes.
+
+        Args:
+            axes: Axis name or list of axis names to keep
+            measure: Measure name (see measure())
+            year: Year for yearly measures
+
+        Returns:
+            pd.Series: Dense sums over the kept axes (MultiIndex for several axes),
+                       in axis label order; labels with no entries sum to 0
+        """
+        if isinstance(axes, str):
+            axes = [axes]
+        for axis in axes:
+            if axis not in self.axes:
+                raise ValueError(f"Unknown axis '{axis}'. Expected one of: {list(self.axes)}.")
+
+        weights = self.measure(measure, year)
+        dims = tuple(len(self.axes[axis]) for axis in axes)
+        flat = np.ravel_multi_index(tuple(self.coords[axis] for axis in axes), dims) if self.nnz else np.zeros(0, dtype=np.int64)
+        sums = np.bincount(flat, weights=weights, minlength=int(np.prod(dims)))
+
+        if len(axes) == 1:
+            index = self.axes[axes[0]]
+        else:
+            index = pd.MultiIndex.from_product([self.axes[axis] for axis in axes])
+        return pd.Series(sums, index=index, name=measure)
+
+    # ------------------------------------------------------------------
+    # Conversion
+    # ------------------------------------------------------------------
+
+    def to_frame(self):
+        """
+        Convert back to the long pier distribution frame (one row per entry).
+
+        Returns:
+            pd.DataFrame: Columns in the original order
+        """
+        columns = {}
+        for axis, column in AXIS_COLUMNS.items():
+            columns[column] = self.axes[axis].take(self.coords[axis]).to_numpy()
+        for name, values in self.data.items():
+            if values.ndim == 2:
+                for position, year in enumerate(self.years):
+                    columns[f"{name}_{year}"] = values[:, position]
+            else:
+                columns[name] = values
+        columns.update(self.attrs)
+        return pd.DataFrame(columns)[self.columns]
+
+
+def as_pier_tensor(distribution):
+    """Return distribution as a PierTensor, converting a long frame if needed."""
+    if isinstance(distribution, PierTensor):
+        return distribution
+    return PierTensor.from_frame(distribution)
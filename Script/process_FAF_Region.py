@@ -8,10 +8,13 @@ Author: Adithya Ajith
 Date: 2026-01-07
 """
 
+import numpy as np
 import pandas as pd
 import re
 from pathlib import Path
 
+from pier_tensor import PierTensor
+
 # Define file paths
 BASE_DIR = Path(__file__).parent.parent
 RAW_DATA_DIR = BASE_DIR / "Raw_Data" / "FAF_5.7.1_Regional"
@@ -487,11 +490,24 @@ def create_honolulu_piers_distribution(df_honolulu_summary):
         'RO/RO': 'RO/RO Proportion'
     }
 
-    # Create result list
-    results = []
+    # Factorize pier labels once; allocations store integer pier coordinates
+    pier_codes, pier_labels = pd.factorize(df_piers['Pier'], sort=False)
+
+    # Per cargo type: pier coordinates and proportions for piers with proportion > 0
+    # (validated on first use)
+    pier_allocations = {}
+
+    # Sparse tensor entries (one per pier x commodity x cargo_type with positive share)
+    entry_piers = []
+    entry_commodities = []
+    entry_cargo_types = []
+    entry_tons = []
+    entry_values = []
+
+    commodity_codes, commodity_labels = pd.factorize(df_honolulu_summary['sctg2'], sort=False)
 
     # For each commodity in summary
-    for _, commodity_row in df_honolulu_summary.iterrows():
+    for commodity_code, (_, commodity_row) in zip(commodity_codes, df_honolulu_summary.iterrows()):
         primary_cargo_type = normalize_cargo_type(commodity_row['primary_cargo_type'])
         alternative_cargo_type = normalize_cargo_type(commodity_row['alternative_cargo_type'])
         containers_proportion = commodity_row['containers_proportion']
@@ -594,30 +610,50 @@ def create_honolulu_piers_distribution(df_honolulu_summary):
                     "Check the input workbook headers."
                 )
 
-            # For each pier
-            for _, pier_row in df_piers.iterrows():
-                pier_proportion = pier_row[proportion_col]
-
-                if pd.isna(pier_proportion):
+            if cargo_type not in pier_allocations:
+                pier_proportions = df_piers[proportion_col]
+                if pier_proportions.isna().any():
+                    missing_pier = df_piers.loc[pier_proportions.isna(), 'Pier'].iloc[0]
                     raise ValueError(
-                        f"Missing pier proportion for pier '{pier_row.get('Pier')}' in column '{proportion_col}'."
+                        f"Missing pier proportion for pier '{missing_pier}' in column '{proportion_col}'."
                     )
 
-                # Only include if proportion > 0
-                if pier_proportion > 0:
-                    results.append({
-                        'Pier': pier_row['Pier'],
-                        'SCTG2_Commodity': sctg2_code,
-                        'cargo_type': cargo_type,
-                        'tons_2024': total_tons * tonnage_fraction * pier_proportion,
-                        'current_value_2024': total_value * tonnage_fraction * pier_proportion
-                    })
-
-    df_piers_distribution = pd.DataFrame(results)
-    
-    # Reorder columns for clarity
-    df_piers_distribution = df_piers_distribution[['Pier', 'SCTG2_Commodity', 'cargo_type', 
-                                                    'tons_2024', 'current_value_2024']]
+                # Only include piers with proportion > 0
+                proportions = pier_proportions.to_numpy(dtype=float)
+                positive = np.flatnonzero(proportions > 0)
+                pier_allocations[cargo_type] = (pier_codes[positive], proportions[positive])
+
+            pier_coords, proportions = pier_allocations[cargo_type]
+            entry_piers.append(pier_coords)
+            entry_commodities.append(np.full(len(pier_coords), commodity_code, dtype=np.int64))
+            entry_cargo_types.append([cargo_type] * len(pier_coords))
+            entry_tons.append(total_tons * tonnage_fraction * proportions)
+            entry_values.append(total_value * tonnage_fraction * proportions)
+
+    cargo_codes, cargo_labels = pd.factorize(
+        pd.Series([cargo for entries in entry_cargo_types for cargo in entries], dtype=object), sort=False
+    )
+
+    tensor = PierTensor(
+        axes={
+            'pier': pd.Index(pier_labels, name='Pier'),
+            'commodity': pd.Index(commodity_labels, name='SCTG2_Commodity'),
+            'cargo_type': pd.Index(cargo_labels, name='cargo_type'),
+        },
+        coords={
+            'pier': np.concatenate(entry_piers).astype(np.int64) if entry_piers else np.zeros(0, dtype=np.int64),
+            'commodity': np.concatenate(entry_commodities) if entry_commodities else np.zeros(0, dtype=np.int64),
+            'cargo_type': cargo_codes.astype(np.int64),
+        },
+        data={
+            'tons': np.concatenate(entry_tons).reshape(-1, 1) if entry_tons else np.zeros((0, 1)),
+            'current_value': np.concatenate(entry_values).reshape(-1, 1) if entry_values else np.zeros((0, 1)),
+        },
+        years=(2024,),
+    )
+
+    # Long frame: Pier, SCTG2_Commodity, cargo_type, tons_2024, current_value_2024
+    df_piers_distribution = tensor.to_frame()
     
     print(f"  - Created pier distribution with {len(df_piers_distribution):,} records")
     print(f"  - Distribution covers {df_piers_distribution['Pier'].nunique()} unique piers")
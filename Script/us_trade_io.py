@@ -0,0 +1,267 @@
+"""
+US Trade Extract Reader
+
+Typed, cached reader for USA Trade Online CSV extracts (port-level and state-level).
+
+The value and weight columns are parsed as numbers at read time using the CSV
+parser's thousands-separator support ("10,007,576" -> 10007576.0), instead of
+loading everything as object dtype and cleaning each column with str.replace
+afterwards; any token that still is not a number becomes NaN, as before.  The
+repetitive identifier columns (Port, State, Country, Time) are read as category
+dtype, which keeps large multi-year extracts small in memory.  Parsed extracts
+are cached as Parquet next to the processed data, keyed by source path, size and
+modification time, so repeat loads skip CSV parsing entirely.
+
+Parquet caching needs pyarrow (or fastparquet); without it the reader still
+works, just uncached.
+
+Usage:
+    python us_trade_io.py --benchmark [extract.csv] [--scale 50]
+
+Date: 2026-10-18
+"""
+
+import argparse
+import hashlib
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from hs_crosswalk import MEASURE_COLUMNS, PORT_IMPORTS_PATH
+from process_FAF_Region import PROCESSED_DATA_DIR
+
+# Parsed extracts are cached here as Parquet
+CACHE_DIR = PROCESSED_DATA_DIR / "US_Trade_Cache"
+
+# Bump when the parsed schema changes so stale cache files are ignored
+CACHE_VERSION = 2
+
+# Identifier columns shared by every extract type
+KEY_COLUMNS = ['Port', 'State', 'Commodity', 'Country', 'Time']
+
+# Identifiers with few distinct values are stored as categories; Commodity
+# labels are nearly unique per row and stay as strings
+TRADE_DTYPES = {column: 'category' for column in KEY_COLUMNS}
+TRADE_DTYPES['Commodity'] = 'string'
+
+# Value/weight headers of either extract layout (coerced to numbers after parsing)
+TRADE_MEASURES = [header for candidates in MEASURE_COLUMNS.values() for header in candidates]
+
+
+def _is_trade_column(column):
+    return column in TRADE_DTYPES or column in TRADE_MEASURES
+
+
+def _coerce_measures(df):
+    """Turn value/weight columns the parser left as text into float64 (bad tokens -> NaN)."""
+    for col in TRADE_MEASURES:
+        if col in df.columns:
+            if not pd.api.types.is_numeric_dtype(df[col]):
+                # The parser only drops thousands separators from fully numeric columns
+                df[col] = pd.to_numeric(df[col].str.replace(',', '', regex=False), errors='coerce')
+            df[col] = df[col].astype('float64')
+    return df
+
+
+def read_trade_csv(path, chunksize=None):
+    """
+    Read a US Trade extract with numeric columns parsed at read time.
+
+    Only the identifier and value/weight columns are read; any other columns in
+    the export are skipped by the parser.
+
+    Args:
+        path: Path to a port-level or state-level US Trade CSV
+        chunksize: If given, return an iterator of DataFrames of this many rows
+
+    Returns:
+        pd.DataFrame (or iterator of DataFrames when chunksize is set) with
+        category identifier columns (string Commodity) and float64 value/weight
+        columns
+    """
+    reader = pd.read_csv(
+        path,
+        usecols=_is_trade_column,
+        dtype=TRADE_DTYPES,
+        thousands=',',
+        chunksize=chunksize,
+    )
+    if chunksize is None:
+        return _coerce_measures(reader)
+    return (_coerce_measures(chunk) for chunk in reader)
+
+
+def _cache_path(path):
+    """Return the Parquet cache path for a source extract (keyed by path, size, mtime)."""
+    path = Path(path).resolve()
+    stat = path.stat()
+    key = f"{CACHE_VERSION}|{path}|{stat.st_size}|{stat.st_mtime_ns}"
+    digest = hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]
+    return CACHE_DIR / f"{path.stem}-{digest}.parquet"
+
+
+def load_trade_data(path, use_cache=True):
+    """
+    Load a US Trade extract, using the Parquet cache when it is current.
+
+    Args:
+        path: Path to a port-level or state-level US Trade CSV
+        use_cache: Read from / write to the Parquet cache
+
+    Returns:
+        pd.DataFrame: Parsed extract (see read_trade_csv)
+    """
+    if not use_cache:
+        return read_trade_csv(path)
+
+    cache_path = _cache_path(path)
+    if cache_path.exists():
+        try:
+            return pd.read_parquet(cache_path)
+        except ImportError:
+            return read_trade_csv(path)
+
+    df = read_trade_csv(path)
+
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # Drop cache files left over from earlier versions of this extract
+        for stale in cache_path.parent.glob(f"{Path(path).stem}-*.parquet"):
+            stale.unlink()
+        df.to_parquet(cache_path, index=False)
+    except ImportError:
+        print("  - Note: pyarrow/fastparquet not installed; US Trade cache disabled")
+
+    return df
+
+
+def iter_trade_chunks(path, chunksize):
+    """
+    Yield a US Trade extract in chunks, from the Parquet cache when it is current.
+
+    Args:
+        path: Path to a port-level or state-level US Trade CSV
+        chunksize: Rows per chunk
+
+    Yields:
+        pd.DataFrame: Parsed chunks (see read_trade_csv)
+    """
+    cache_path = _cache_path(path)
+    if cache_path.exists():
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            pq = None
+        if pq is not None:
+            for batch in pq.ParquetFile(cache_path).iter_batches(batch_size=chunksize):
+                yield batch.to_pandas()
+            return
+
+    yield from read_trade_csv(path, chunksize=chunksize)
+
+
+def _read_trade_csv_legacy(path):
+    """Baseline reader: object-dtype read_csv, then per-column comma cleaning."""
+    df = pd.read_csv(path)
+    for candidates in MEASURE_COLUMNS.values():
+        for col in candidates:
+            if col in df.columns and not pd.api.types.is_numeric_dtype(df[col]):
+                df[col] = pd.to_numeric(df[col].str.replace(',', ''), errors='coerce')
+    return df
+
+
+def make_synthetic_extract(template_path, output_path, scale):
+    """
+    Write a large multi-year extract by replicating a real extract across years.
+
+    Args:
+        template_path: Real US Trade CSV to replicate
+        output_path: Destination CSV
+        scale: Number of copies (each copy gets a distinct year)
+
+    Returns:
+        int: Number of data rows written
+    """
+    template = pd.read_csv(template_path, dtype=str)
+    base_year = int(template['Time'].str.extract(r'(\d{4})', expand=False).dropna().astype(int).min())
+    frames = [template.assign(Time=str(base_year - i)) for i in range(scale)]
+    pd.concat(frames, ignore_index=True).to_csv(output_path, index=False)
+    return len(template) * scale
+
+
+def run_benchmark(template_path=PORT_IMPORTS_PATH, scale=50, repeats=3):
+    """
+    Compare the legacy reader, the typed reader and the Parquet cache.
+
+    Args:
+        template_path: US Trade CSV used to build the synthetic multi-year extract
+        scale: Number of replicated years
+        repeats: Timing repetitions (best time is reported)
+    """
+    def best_time(func):
+        timings = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            result = func()
+            timings.append(time.perf_counter() - start)
+        return min(timings), result
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        extract_path = Path(tmp_dir) / "benchmark_extract.csv"
+        row_count = make_synthetic_extract(template_path, extract_path, scale)
+        print(f"\nSynthetic extract: {row_count:,} rows ({extract_path.stat().st_size / 1e6:.1f} MB)")
+
+        legacy_time, legacy_df = best_time(lambda: _read_trade_csv_legacy(extract_path))
+        typed_time, typed_df = best_time(lambda: read_trade_csv(extract_path))
+
+        results = [
+            ('Legacy (object + clean)', legacy_time, legacy_df),
+            ('Typed read_csv', typed_time, typed_df),
+        ]
+
+        parquet_path = Path(tmp_dir) / "benchmark_extract.parquet"
+        try:
+            typed_df.to_parquet(parquet_path, index=False)
+            cached_time, cached_df = best_time(lambda: pd.read_parquet(parquet_path))
+            results.append(('Parquet cache', cached_time, cached_df))
+        except ImportError:
+            print("  - pyarrow/fastparquet not installed; skipping Parquet cache timing")
+
+        print(f"\n{'Reader':<26}{'Time (s)':>10}{'Speedup':>10}{'Memory (MB)':>14}")
+        for label, elapsed, df in results:
+            memory_mb = df.memory_usage(deep=True).sum() / 1e6
+            print(f"{label:<26}{elapsed:>10.3f}{legacy_time / elapsed:>9.1f}x{memory_mb:>14.1f}")
+
+        # The typed reader must produce the same numbers as the legacy path
+        for candidates in MEASURE_COLUMNS.values():
+            for col in candidates:
+                if col in legacy_df.columns:
+                    pd.testing.assert_series_equal(
+                        legacy_df[col].astype('float64'), typed_df[col], check_names=False
+                    )
+        print("\n  - Typed reader matches legacy parsing for all value/weight columns")
+
+
+def main():
+    """
+    Main execution function.
+    """
+    parser = argparse.ArgumentParser(description="Typed, cached US Trade extract reader")
+    parser.add_argument('extract', nargs='?', default=str(PORT_IMPORTS_PATH), help="US Trade CSV extract")
+    parser.add_argument('--benchmark', action='store_true', help="Benchmark legacy vs typed vs cached reads")
+    parser.add_argument('--scale', type=int, default=50, help="Years to replicate for the benchmark (default: 50)")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        run_benchmark(args.extract, scale=args.scale)
+        return
+
+    df = load_trade_data(args.extract)
+    print(f"Loaded {len(df):,} rows from {args.extract}")
+    print(df.dtypes.to_string())
+
+
+if __name__ == "__main__":
+    main()